@@ -0,0 +1,117 @@
+"""
+Account identification for the Naukri automation.
+
+Per-account state (browser profiles, caches, run statistics) is keyed by a
+filesystem-safe account id derived from the login identity. Multi-account
+runs read their accounts from the JSON file named by ACCOUNTS_FILE.
+"""
+
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+
+def account_id_for(login_method: str, email: Optional[str] = None, phone_number: Optional[str] = None) -> str:
+    """
+    Builds a filesystem-safe account id from a login identity.
+
+    Args:
+        login_method: The login method ('google', 'email_password', 'otp').
+        email: The account email, if any.
+        phone_number: The account phone number, if any.
+
+    Returns:
+        A lowercase id such as 'jane_doe_example_com'.
+    """
+    identity = phone_number if login_method == "otp" else email
+    if not identity:
+        identity = "default"
+    return re.sub(r"[^a-z0-9]+", "_", identity.lower()).strip("_") or "default"
+
+
+def current_account_id() -> str:
+    """
+    Returns the account id for the account configured in the environment.
+
+    Returns:
+        The account id for LOGIN_METHOD and its credential variables.
+    """
+    login_method = os.getenv("LOGIN_METHOD", "email_password").lower()
+    if login_method == "google":
+        return account_id_for(login_method, email=os.getenv("GOOGLE_EMAIL"))
+    if login_method == "otp":
+        return account_id_for(login_method, phone_number=os.getenv("PHONE_NUMBER"))
+    return account_id_for(login_method, email=os.getenv("NAUKRI_EMAIL"))
+
+
+class Account:
+    """One Naukri account to refresh."""
+
+    def __init__(self, login_method: str, email: Optional[str] = None, password: Optional[str] = None,
+                 phone_number: Optional[str] = None, resume_path: Optional[str] = None,
+                 account_id: Optional[str] = None):
+        self.login_method = login_method.lower()
+        self.email = email
+        self.password = password
+        self.phone_number = phone_number
+        self.resume_path = resume_path
+        self.account_id = account_id or account_id_for(self.login_method, email=email, phone_number=phone_number)
+
+    def login_kwargs(self) -> Dict[str, str]:
+        """Returns the keyword arguments login() expects for this account."""
+        if self.login_method == "otp":
+            return {"phone_number": self.phone_number}
+        if self.login_method == "google":
+            return {"email": self.email}
+        return {"email": self.email, "password": self.password}
+
+
+def account_from_env(resume_path: Optional[str] = None) -> Account:
+    """
+    Builds the single account configured through .env.
+
+    Args:
+        resume_path: Resume to upload for this account.
+
+    Returns:
+        The configured Account.
+    """
+    login_method = os.getenv("LOGIN_METHOD", "email_password").lower()
+    email = os.getenv("GOOGLE_EMAIL") if login_method == "google" else os.getenv("NAUKRI_EMAIL")
+    return Account(login_method, email=email, password=os.getenv("NAUKRI_PASSWORD"),
+                   phone_number=os.getenv("PHONE_NUMBER"), resume_path=resume_path)
+
+
+def load_accounts(resume_path: Optional[str] = None) -> List[Account]:
+    """
+    Loads every account to refresh.
+
+    Reads the JSON list in ACCOUNTS_FILE when set, otherwise returns the
+    single account from the environment. Each entry takes login_method,
+    email, password, phone_number, resume_path and an optional account_id.
+
+    Args:
+        resume_path: Default resume for entries that don't set their own.
+
+    Returns:
+        The accounts, in file order.
+    """
+    accounts_file = os.getenv("ACCOUNTS_FILE")
+    if not accounts_file:
+        return [account_from_env(resume_path)]
+
+    with open(accounts_file) as f:
+        entries = json.load(f)
+
+    accounts = []
+    for entry in entries:
+        accounts.append(Account(
+            entry.get("login_method", "email_password"),
+            email=entry.get("email"),
+            password=entry.get("password"),
+            phone_number=entry.get("phone_number"),
+            resume_path=entry.get("resume_path", resume_path),
+            account_id=entry.get("account_id"),
+        ))
+    return accounts
@@ -0,0 +1,235 @@
+"""
+Resource-aware concurrency for multi-account runs.
+
+Every worker runs a full Chrome, so a fixed concurrency either leaves the
+host idle or runs it out of memory. AutoscalingPool samples system CPU, free
+memory and the resident memory of the browsers it started, and moves the
+number of concurrent workers toward a CPU target: up one when CPU is below
+target and there is room for another browser, down one when CPU is above
+target or memory is short. A new browser is never launched without enough
+free memory for it, whatever the target. Every change is printed with the
+sample that caused it.
+
+Samples come from /proc; where it is unavailable the load average stands in
+for CPU and memory is not limited.
+
+Configuration (environment variables):
+    AUTOSCALE_MIN_WORKERS: Lowest concurrency (default: 1).
+    AUTOSCALE_MAX_WORKERS: Highest concurrency (default: CPU count).
+    AUTOSCALE_TARGET_CPU: Target system CPU utilisation in percent (default: 75).
+    AUTOSCALE_MIN_FREE_MB: Memory kept free on top of a new browser's needs (default: 512).
+    AUTOSCALE_INTERVAL: Seconds between samples (default: 5).
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from browser_contexts import process_tree_rss
+
+
+# Assumed memory per browser until one has been measured
+DEFAULT_BROWSER_MB = 400
+
+# CPU band around the target in which the worker count is left alone
+CPU_HYSTERESIS = 10
+
+# Process names counted as browser memory; anything else this process starts is ignored
+BROWSER_PROCESS_NAMES = ("chrome", "chromium", "chromedriver", "headless_shell")
+
+
+def _read_cpu_times() -> Optional[List[int]]:
+    try:
+        with open("/proc/stat") as f:
+            return [int(v) for v in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+
+
+def available_memory_mb() -> Optional[float]:
+    """
+    Returns MemAvailable from /proc/meminfo.
+
+    Returns:
+        Free memory in MB, or None where /proc is unavailable.
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class ResourceSampler:
+    """Samples system CPU, free memory and the memory used by this process's browsers."""
+
+    def __init__(self):
+        self._last_cpu = _read_cpu_times()
+
+    def cpu_percent(self) -> float:
+        """Returns system CPU utilisation since the previous call."""
+        current = _read_cpu_times()
+        if current is None or self._last_cpu is None:
+            try:
+                return min(100.0, os.getloadavg()[0] / (os.cpu_count() or 1) * 100)
+            except OSError:
+                return 0.0
+        deltas = [c - p for c, p in zip(current, self._last_cpu)]
+        self._last_cpu = current
+        total = sum(deltas)
+        # idle + iowait
+        idle = deltas[3] + (deltas[4] if len(deltas) > 4 else 0)
+        return 100.0 * (total - idle) / total if total else 0.0
+
+    def browser_rss_mb(self) -> float:
+        """Returns the memory of the chromedriver and Chrome processes this one started."""
+        return process_tree_rss(os.getpid(), BROWSER_PROCESS_NAMES) / (1024 * 1024)
+
+    def sample(self, active_workers: int) -> Dict:
+        """
+        Takes one sample.
+
+        Args:
+            active_workers: Browsers currently running.
+
+        Returns:
+            Dict with cpu_percent, free_mb, browser_mb and per_browser_mb.
+        """
+        browser_mb = self.browser_rss_mb()
+        return {
+            "cpu_percent": self.cpu_percent(),
+            "free_mb": available_memory_mb(),
+            "browser_mb": browser_mb,
+            "per_browser_mb": browser_mb / active_workers if active_workers and browser_mb else None,
+        }
+
+
+class AutoscalingPool:
+    """Runs tasks on worker threads, scaling their number to the host's free resources."""
+
+    def __init__(self, min_workers: Optional[int] = None, max_workers: Optional[int] = None,
+                 target_cpu: Optional[float] = None, min_free_mb: Optional[float] = None,
+                 interval: Optional[float] = None, sampler: Optional[ResourceSampler] = None):
+        self.min_workers = min_workers or int(os.getenv("AUTOSCALE_MIN_WORKERS", "1"))
+        self.max_workers = max(self.min_workers,
+                               max_workers or int(os.getenv("AUTOSCALE_MAX_WORKERS", str(os.cpu_count() or 2))))
+        self.target_cpu = target_cpu or float(os.getenv("AUTOSCALE_TARGET_CPU", "75"))
+        self.min_free_mb = min_free_mb if min_free_mb is not None else float(os.getenv("AUTOSCALE_MIN_FREE_MB", "512"))
+        self.interval = interval or float(os.getenv("AUTOSCALE_INTERVAL", "5"))
+        self.sampler = sampler or ResourceSampler()
+        self.target = self.min_workers
+        self.per_browser_mb = float(DEFAULT_BROWSER_MB)
+        self.decisions: List[Dict] = []
+        self._active = 0
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+
+    def _log(self, action: str, reason: str, sample: Dict) -> None:
+        with self._lock:
+            target, active = self.target, self._active
+        free = f"{sample['free_mb']:.0f} MB free" if sample.get("free_mb") is not None else "free memory unknown"
+        print(f"📈 Autoscaler: {action} (target {target}, {active} active) - {reason} "
+              f"[CPU {sample['cpu_percent']:.0f}%, {free}, ~{self.per_browser_mb:.0f} MB/browser]")
+        self.decisions.append({"time": time.time(), "action": action, "reason": reason,
+                               "target": target, "active": active, **sample})
+
+    def _headroom_ok(self, free_mb: Optional[float]) -> bool:
+        return free_mb is None or free_mb >= self.per_browser_mb + self.min_free_mb
+
+    def rescale(self) -> None:
+        """Takes a sample and moves the target concurrency one step if needed."""
+        with self._lock:
+            active = self._active
+        sample = self.sampler.sample(active)
+        if sample["per_browser_mb"]:
+            # Smooth so one browser's peak doesn't dominate the estimate
+            self.per_browser_mb = 0.7 * self.per_browser_mb + 0.3 * sample["per_browser_mb"]
+
+        cpu, free_mb = sample["cpu_percent"], sample["free_mb"]
+        low_memory = free_mb is not None and free_mb < self.min_free_mb
+        with self._lock:
+            if (low_memory or cpu > self.target_cpu + CPU_HYSTERESIS) and self.target > self.min_workers:
+                self.target -= 1
+                action, reason = "scale down", "memory below reserve" if low_memory else "CPU above target"
+            elif (cpu < self.target_cpu - CPU_HYSTERESIS and self.target < self.max_workers
+                  and self._active >= self.target and self._headroom_ok(free_mb)):
+                self.target += 1
+                action, reason = "scale up", "CPU below target with memory for another browser"
+            else:
+                return
+        self._log(action, reason, sample)
+        if action == "scale up":
+            self._changed.set()
+
+    def can_launch(self) -> bool:
+        """Returns whether another browser may start now."""
+        with self._lock:
+            if self._active >= self.target:
+                return False
+            if self._active == 0:
+                # Always let one worker run so the pool makes progress
+                return True
+        return self._headroom_ok(available_memory_mb())
+
+    def run(self, next_task: Callable[[], Optional[Callable[[], None]]]) -> None:
+        """
+        Runs tasks until next_task() returns None and every worker has finished.
+
+        Args:
+            next_task: Returns the next task to run (a no-argument callable),
+                or None when there is no more work.
+        """
+        stop = threading.Event()
+
+        def monitor():
+            while not stop.wait(self.interval):
+                self.rescale()
+
+        def run_task(task):
+            try:
+                task()
+            except Exception as e:
+                print(f"❌ Autoscaled task failed: {e}")
+            finally:
+                with self._lock:
+                    self._active -= 1
+                self._changed.set()
+
+        threading.Thread(target=monitor, daemon=True).start()
+        print(f"📈 Autoscaler: starting with {self.target} workers "
+              f"(range {self.min_workers}-{self.max_workers}, CPU target {self.target_cpu:.0f}%)")
+        threads = []
+        deferred_logged = False
+        exhausted = False
+        try:
+            while not exhausted:
+                if not self.can_launch():
+                    with self._lock:
+                        at_target = self._active >= self.target
+                    if not at_target and not deferred_logged:
+                        self._log("defer launch", "not enough free memory for another browser",
+                                  self.sampler.sample(self._active))
+                        deferred_logged = True
+                    self._changed.wait(self.interval)
+                    self._changed.clear()
+                    continue
+
+                task = next_task()
+                if task is None:
+                    exhausted = True
+                    break
+                deferred_logged = False
+                with self._lock:
+                    self._active += 1
+                thread = threading.Thread(target=run_task, args=(task,), daemon=True)
+                thread.start()
+                threads.append(thread)
+            for thread in threads:
+                thread.join()
+        finally:
+            stop.set()
+        print(f"📈 Autoscaler: finished {len(threads)} tasks, {len(self.decisions)} scaling decisions")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Driver backend benchmark for the Naukri automation.
+
+Compares the Selenium (chromedriver) and direct CDP backends on browser
+startup time and per-command latency for the operations the flows use. The
+test page is a local data: URL, so no network access is involved.
+
+Usage:
+    python benchmark_backends.py [--iterations 50] [--backends selenium,cdp] [--headed]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from urllib.parse import quote
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+from driver_backend import SUPPORTED_BACKENDS, create_driver
+
+
+TEST_PAGE = "data:text/html," + quote("""
+<html><head><title>Benchmark</title></head><body>
+<form><input type="text" id="email" name="email"><input type="password" id="password">
+<button type="button" id="login" onclick="this.dataset.clicked = '1'">Login</button></form>
+<a href="#profile">Profile</a>
+</body></html>
+""")
+
+
+def _options(headless: bool):
+    chrome_options = webdriver.ChromeOptions()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-first-run")
+    return chrome_options
+
+
+def _time_ms(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark_backend(backend: str, iterations: int, headless: bool) -> dict:
+    """
+    Measures startup and per-command latency for one backend.
+
+    Args:
+        backend: 'selenium' or 'cdp'.
+        iterations: Samples per command.
+        headless: Run Chrome headless.
+
+    Returns:
+        Dict mapping measurement name to a list of millisecond samples.
+    """
+    results = {}
+    driver = None
+    start = time.perf_counter()
+    try:
+        driver = create_driver(_options(headless), backend=backend)
+        driver.get("about:blank")
+        results["startup"] = [(time.perf_counter() - start) * 1000]
+
+        driver.get(TEST_PAGE)
+        commands = {
+            "navigate": lambda: driver.get(TEST_PAGE),
+            "find_element": lambda: driver.find_element(By.ID, "email"),
+            "find_elements_xpath": lambda: driver.find_elements(By.XPATH, "//input"),
+            "execute_script": lambda: driver.execute_script("return 1 + 1;"),
+            "current_url": lambda: driver.current_url,
+            "title": lambda: driver.title,
+            "get_cookies": lambda: driver.get_cookies(),
+            "is_displayed": lambda: driver.find_element(By.ID, "login").is_displayed(),
+            "click": lambda: driver.find_element(By.ID, "login").click(),
+            "send_keys": lambda: driver.find_element(By.ID, "email").send_keys("a"),
+        }
+        for name, command in commands.items():
+            results[name] = [_time_ms(command) for _ in range(iterations)]
+    finally:
+        if driver:
+            driver.quit()
+    return results
+
+
+def _summary(samples: list) -> str:
+    if len(samples) == 1:
+        return f"{samples[0]:9.1f}"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"{statistics.median(samples):9.2f} / {p95:7.2f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Selenium vs direct CDP driver backends")
+    parser.add_argument("--iterations", type=int, default=50)
+    # The remote backend needs a Grid, so it is only benchmarked when asked for
+    parser.add_argument("--backends", default="selenium,cdp",
+                        help=f"Comma-separated backends ({', '.join(SUPPORTED_BACKENDS)})")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    args = parser.parse_args()
+
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    all_results = {}
+    for backend in backends:
+        print(f"⏱️ Benchmarking {backend} backend ({args.iterations} iterations)...")
+        try:
+            all_results[backend] = benchmark_backend(backend, args.iterations, not args.headed)
+        except Exception as e:
+            print(f"❌ {backend} backend failed: {e}")
+
+    if not all_results:
+        return 1
+
+    print(f"\n{'operation (ms, median / p95)':<30}" + "".join(f"{b:>22}" for b in all_results))
+    names = list(next(iter(all_results.values())).keys())
+    for name in names:
+        row = f"{name:<30}"
+        for backend in all_results:
+            row += f"{_summary(all_results[backend].get(name, [0.0])):>22}"
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Concurrent bootstrap pipeline for the Naukri automation.
+
+main.py used to run every startup step in series. The steps form a small
+dependency graph instead: configuration has to load before Chrome starts
+(the options read the environment), but chromedriver resolution and resume
+preparation do not depend on each other. BootstrapPipeline runs each step as
+soon as its dependencies finish and records a timeline, so the cold-start
+critical path is the slowest chain of dependencies rather than the sum of
+all steps.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from accounts import Account, account_from_env
+from resume_artifacts import prepare_resume
+
+
+# Added to about:blank once Chrome is up so Chrome's own DNS cache and socket pool are warm.
+# No crossOrigin: the top-level navigation is credentialed and only reuses a credentialed preconnect.
+PRECONNECT_SCRIPT = """
+for (const rel of ['dns-prefetch', 'preconnect']) {
+    const link = document.createElement('link');
+    link.rel = rel;
+    link.href = 'https://www.naukri.com';
+    document.head.appendChild(link);
+}
+"""
+
+
+class BootstrapError(Exception):
+    """A bootstrap step failed; carries the results of the steps that succeeded."""
+
+    def __init__(self, step: str, error: Exception, results: Dict[str, Any]):
+        super().__init__(f"{step}: {error}")
+        self.step = step
+        self.error = error
+        self.results = results
+
+
+class BootstrapPipeline:
+    """Runs named steps concurrently, each as soon as its dependencies are done."""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.steps: Dict[str, Dict] = {}
+        self.timeline: Dict[str, Dict[str, float]] = {}
+
+    def add(self, name: str, func: Callable[[Dict[str, Any]], Any], deps: Optional[List[str]] = None) -> None:
+        """
+        Adds a step.
+
+        Args:
+            name: Step name, also the key of its result.
+            func: Called with the results of completed steps.
+            deps: Names of steps that must finish first.
+        """
+        self.steps[name] = {"func": func, "deps": deps or []}
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Runs all steps.
+
+        Returns:
+            Step results by name.
+
+        Raises:
+            BootstrapError: For the first step that fails. Steps already
+                running are allowed to finish; steps depending on the failed
+                one are skipped.
+        """
+        results: Dict[str, Any] = {}
+        pending = dict(self.steps)
+        running = {}
+        failure = None
+        origin = time.perf_counter()
+
+        def timed(name, func):
+            start = time.perf_counter() - origin
+            try:
+                return func(results)
+            finally:
+                self.timeline[name] = {"start": start, "end": time.perf_counter() - origin}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                if failure is None:
+                    for name, step in list(pending.items()):
+                        if all(dep in results for dep in step["deps"]):
+                            running[executor.submit(timed, name, step["func"])] = name
+                            del pending[name]
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        if failure is None:
+                            failure = (name, e)
+
+        if failure:
+            raise BootstrapError(failure[0], failure[1], results)
+        return results
+
+    def print_timeline(self, width: int = 40) -> None:
+        """Prints when each step ran, to show what overlapped."""
+        if not self.timeline:
+            return
+        total = max(entry["end"] for entry in self.timeline.values()) or 1e-9
+        serial = sum(entry["end"] - entry["start"] for entry in self.timeline.values())
+        print(f"🧵 Bootstrap timeline: {total:.2f}s wall clock vs {serial:.2f}s if run in series")
+        for name, entry in sorted(self.timeline.items(), key=lambda item: item[1]["start"]):
+            begin = int(entry["start"] / total * width)
+            length = max(1, int((entry["end"] - entry["start"]) / total * width))
+            bar = " " * begin + "█" * min(length, width - begin)
+            print(f"   {name:<18} |{bar:<{width}}| {entry['start']:.2f}s → {entry['end']:.2f}s")
+
+
+def load_config(resume_path: Optional[str]) -> Account:
+    """
+    Builds the configured account. main.py has already loaded .env and validated the credentials.
+
+    Args:
+        resume_path: Resume to upload.
+
+    Returns:
+        The configured account.
+    """
+    return account_from_env(resume_path)
+
+
+def validate_resume(path: str) -> str:
+    """
+    Validates and prepares the resume (see resume_artifacts) before Chrome needs it.
+
+    Args:
+        path: Resume path.
+
+    Returns:
+        The absolute path.
+    """
+    return prepare_resume(path).source
+
+
+def run_bootstrap(resume_path: Optional[str]) -> Dict[str, Any]:
+    """
+    Loads configuration, resolves the driver and starts Chrome concurrently.
+
+    Args:
+        resume_path: Resume to upload.
+
+    Returns:
+        Dict with 'account', 'driver', 'snapshot' and 'resume_path'.
+
+    Raises:
+        BootstrapError: If a step fails; a browser that did start is quit.
+    """
+    from driver_backend import resolve_driver_path
+    from utility import launch_driver
+
+    def launch_chrome(results):
+        driver, snapshot = launch_driver(results["config"].account_id, results["driver_resolution"])
+        try:
+            driver.execute_script(PRECONNECT_SCRIPT)
+        except Exception:
+            pass
+        return driver, snapshot
+
+    pipeline = BootstrapPipeline()
+    pipeline.add("config", lambda results: load_config(resume_path))
+    pipeline.add("driver_resolution", lambda results: resolve_driver_path())
+    pipeline.add("resume_staging", lambda results: validate_resume(results["config"].resume_path), deps=["config"])
+    pipeline.add("chrome_launch", launch_chrome, deps=["config", "driver_resolution"])
+
+    try:
+        results = pipeline.run()
+    except BootstrapError as e:
+        pipeline.print_timeline()
+        if "chrome_launch" in e.results:
+            from utility import cleanup
+            cleanup(e.results["chrome_launch"][0])
+        raise
+
+    pipeline.print_timeline()
+    account = results["config"]
+    account.resume_path = results["resume_staging"]
+    driver, snapshot = results["chrome_launch"]
+    return {"account": account, "driver": driver, "snapshot": snapshot, "resume_path": account.resume_path}
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Multiple Naukri accounts in one Chrome via isolated browser contexts.
+
+Running N accounts with setup_driver() means N full Chrome processes. This
+mode launches one browser over the direct DevTools backend and gives each
+account its own browser context (CDP Target.createBrowserContext), which has
+separate cookies, storage and cache, like an incognito window. Accounts run
+through the usual open_naukri() / login() / refresh_profile() flow with
+bounded concurrency, and each context is disposed as soon as its account
+finishes.
+
+Usage:
+    python browser_contexts.py            # accounts from ACCOUNTS_FILE or .env
+
+Configuration (environment variables):
+    CONTEXT_CONCURRENCY: Accounts running at the same time (default: 2).
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from accounts import Account, load_accounts
+from cdp_driver import CdpDriver
+from command_counter import attach_command_counter
+from delay_controller import attach_delays
+from page_readiness import get_page_load_strategy
+from run_report import record_run_error, set_run_phase, start_run_report
+
+
+def process_tree_rss(pid: int, names: Optional[Tuple[str, ...]] = None) -> int:
+    """
+    Returns the resident memory of a process and all its descendants.
+
+    Reads /proc, so it returns 0 on platforms without it.
+
+    Args:
+        pid: Root process id.
+        names: Only count processes whose name contains one of these; the
+            whole tree is still walked. Every process is counted when None.
+
+    Returns:
+        Total RSS in bytes.
+    """
+    children: Dict[int, List[int]] = {}
+    rss: Dict[int, int] = {}
+    try:
+        proc_entries = os.listdir("/proc")
+    except OSError:
+        return 0
+
+    for entry in proc_entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                name, fields = f.read().split("(", 1)[1].rsplit(")", 1)
+            parent = int(fields.split()[1])
+            children.setdefault(parent, []).append(int(entry))
+            if names is not None and not any(n in name.lower() for n in names):
+                continue
+            with open(f"/proc/{entry}/statm") as f:
+                rss[int(entry)] = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            continue
+
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        total += rss.get(current, 0)
+        stack.extend(children.get(current, []))
+    return total
+
+
+class SharedBrowser:
+    """One Chrome process hosting an isolated browser context per account."""
+
+    def __init__(self, chrome_options):
+        self._host = CdpDriver(
+            arguments=list(chrome_options.arguments),
+            binary_location=chrome_options.binary_location or None,
+            page_load_strategy=chrome_options.page_load_strategy or get_page_load_strategy(),
+        )
+        self._page_load_strategy = self._host.page_load_strategy
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._host.browser_pid
+
+    def new_context_driver(self) -> CdpDriver:
+        """
+        Creates an isolated browser context and a driver for a page in it.
+
+        Returns:
+            A CdpDriver bound to the new context.
+        """
+        with self._lock:
+            context_id = self._host.execute_cdp_cmd("Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+        driver = CdpDriver(websocket_url=self._host.websocket_url, browser_context_id=context_id,
+                           page_load_strategy=self._page_load_strategy)
+        driver.set_page_load_timeout(30)
+        driver.implicitly_wait(10)
+        return driver
+
+    def dispose_context(self, driver: CdpDriver) -> None:
+        """
+        Closes a context driver and disposes of its browser context.
+
+        Args:
+            driver: A driver from new_context_driver().
+        """
+        context_id = driver.browser_context_id
+        try:
+            driver.quit()
+        finally:
+            with self._lock:
+                try:
+                    self._host.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+                except Exception as e:
+                    print(f"⚠️ Could not dispose browser context {context_id}: {e}")
+
+    def quit(self) -> None:
+        self._host.quit()
+
+
+def run_account_in_context(browser: SharedBrowser, account: Account) -> Dict:
+    """
+    Runs the full refresh flow for one account inside its own context.
+
+    Args:
+        browser: The shared browser.
+        account: The account to run.
+
+    Returns:
+        Dict with account_id, success, error and duration_seconds.
+    """
+    from utility import cleanup, login_and_refresh, open_naukri
+
+    start = time.time()
+    result = {"account_id": account.account_id, "success": False, "error": None}
+    driver = None
+    try:
+        driver = browser.new_context_driver()
+        attach_command_counter(driver, "setup_driver")
+        attach_delays(driver, account.account_id)
+        start_run_report(driver, account.account_id)
+        set_run_phase(driver, "setup")
+        print(f"🧩 [{account.account_id}] Started isolated browser context")
+        open_naukri(driver)
+        login_and_refresh(driver, account)
+        result["success"] = True
+    except Exception as e:
+        print(f"❌ [{account.account_id}] Failed: {e}")
+        result["error"] = str(e)
+        if driver:
+            record_run_error(driver, e)
+    finally:
+        if driver:
+            # cleanup() quits the context's pages; disposing the context drops its cookies and cache
+            try:
+                cleanup(driver)
+            except Exception:
+                pass
+            browser.dispose_context(driver)
+    result["duration_seconds"] = time.time() - start
+    return result
+
+
+def run_accounts_in_contexts(accounts: List[Account], concurrency: Optional[int] = None) -> List[Dict]:
+    """
+    Refreshes several accounts in one browser with bounded concurrency.
+
+    Args:
+        accounts: The accounts to run.
+        concurrency: Contexts alive at the same time; defaults to CONTEXT_CONCURRENCY.
+
+    Returns:
+        One result dict per account, in input order.
+    """
+    from utility import build_chrome_options
+
+    concurrency = concurrency or int(os.getenv("CONTEXT_CONCURRENCY", "2"))
+    is_ci = os.getenv('CI') == 'true' or os.getenv('GITHUB_ACTIONS') == 'true'
+    browser = SharedBrowser(build_chrome_options(is_ci))
+    baseline_rss = process_tree_rss(browser.pid) if browser.pid else 0
+    peak_rss = baseline_rss
+    stop_sampling = threading.Event()
+
+    def sample_memory():
+        nonlocal peak_rss
+        while not stop_sampling.wait(1.0):
+            peak_rss = max(peak_rss, process_tree_rss(browser.pid))
+
+    sampler = threading.Thread(target=sample_memory, daemon=True)
+    sampler.start()
+
+    print(f"🧩 Running {len(accounts)} accounts in one browser ({concurrency} at a time)")
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda account: run_account_in_context(browser, account), accounts))
+    finally:
+        stop_sampling.set()
+        browser.quit()
+
+    if baseline_rss:
+        extra_mb = (peak_rss - baseline_rss) / (1024 * 1024)
+        per_context = extra_mb / min(concurrency, len(accounts)) if accounts else 0
+        print(f"🧠 Browser memory: {baseline_rss / (1024 * 1024):.0f} MB base, peak +{extra_mb:.0f} MB "
+              f"(~{per_context:.0f} MB per concurrent account)")
+
+    succeeded = sum(1 for r in results if r["success"])
+    print(f"📊 {succeeded}/{len(results)} accounts refreshed successfully")
+    return results
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    results = run_accounts_in_contexts(load_accounts(os.getenv("RESUME_FILE_PATH")))
+    sys.exit(0 if all(r["success"] for r in results) else 1)
@@ -0,0 +1,299 @@
+"""
+Persistent per-account Chrome profiles for the Naukri automation.
+
+By default every run starts from a fresh temporary profile and re-downloads
+naukri.com's static bundles. With PERSISTENT_PROFILE enabled each account
+gets a managed user-data-dir with a bounded HTTP disk cache, locked for the
+duration of the run so two runs never share a profile. Profiles are pruned
+of regenerable caches and their SQLite stores compacted before launch, and
+cache hit ratio and bytes transferred are tracked for warm and cold runs.
+
+Configuration (environment variables):
+    PERSISTENT_PROFILE: Set to 'true' to enable persistent profiles.
+    PROFILE_ROOT: Directory holding the profiles (default: ~/.naukri-automation/profiles).
+    PROFILE_CACHE_MB: Maximum HTTP disk cache size in MB (default: 100).
+    PROFILE_MAX_MB: Profile size above which the HTTP cache is dropped (default: 500).
+"""
+
+import fcntl
+import json
+import os
+import shutil
+import sqlite3
+import weakref
+from datetime import datetime
+from typing import Dict, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from cdp_events import drain_events, subscribe
+
+
+# Regenerable directories that only grow the profile between runs
+PRUNABLE_DIRS = [
+    "Crashpad",
+    "BrowserMetrics",
+    "ShaderCache",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "component_crx_cache",
+    "optimization_guide_model_store",
+    os.path.join("Default", "GPUCache"),
+    os.path.join("Default", "Code Cache"),
+    os.path.join("Default", "Service Worker", "CacheStorage"),
+    os.path.join("Default", "blob_storage"),
+]
+
+# SQLite stores that are safe to VACUUM while Chrome is not running
+COMPACTABLE_DBS = [
+    os.path.join("Default", "History"),
+    os.path.join("Default", "Favicons"),
+    os.path.join("Default", "Top Sites"),
+    os.path.join("Default", "Web Data"),
+    os.path.join("Default", "Cookies"),
+    os.path.join("Default", "Network", "Cookies"),
+]
+
+HISTORY_LIMIT = 30
+
+
+class ProfileLease:
+    """An exclusively locked persistent profile directory."""
+
+    def __init__(self, account_id: str, path: str, lock_file, warm: bool):
+        self.account_id = account_id
+        self.path = path
+        self.lock_file = lock_file
+        self.warm = warm
+        self.requests = 0
+        # Request ids, since one hit can be reported by both requestServedFromCache and responseReceived
+        self.cache_hit_ids = set()
+        self.bytes_transferred = 0
+
+    @property
+    def cache_hits(self) -> int:
+        return len(self.cache_hit_ids)
+
+    def on_event(self, method: str, params: dict) -> None:
+        if method == "Network.requestWillBeSent":
+            # Redirect hops reuse the request id; count the request once
+            if "redirectResponse" not in params:
+                self.requests += 1
+        elif method == "Network.requestServedFromCache":
+            self.cache_hit_ids.add(params.get("requestId"))
+        elif method == "Network.responseReceived" and params.get("response", {}).get("fromDiskCache"):
+            self.cache_hit_ids.add(params.get("requestId"))
+        elif method == "Network.loadingFinished":
+            self.bytes_transferred += int(params.get("encodedDataLength") or 0)
+
+
+_leases: "weakref.WeakKeyDictionary[WebDriver, ProfileLease]" = weakref.WeakKeyDictionary()
+
+
+def persistent_profiles_enabled() -> bool:
+    """
+    Returns whether runs should use a persistent per-account profile.
+
+    Returns:
+        True when PERSISTENT_PROFILE is set to a true value.
+    """
+    return os.getenv("PERSISTENT_PROFILE", "false").lower() in ("1", "true", "yes")
+
+
+def get_profile_root() -> str:
+    """
+    Returns the directory that holds all managed profiles.
+
+    Returns:
+        Absolute path of the profile root.
+    """
+    root = os.getenv("PROFILE_ROOT", os.path.join("~", ".naukri-automation", "profiles"))
+    return os.path.abspath(os.path.expanduser(root))
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                pass
+    return total
+
+
+def prune_profile(path: str) -> int:
+    """
+    Removes regenerable caches and compacts SQLite stores in a profile.
+
+    The HTTP cache is kept unless the profile exceeds PROFILE_MAX_MB. Must
+    only be called while holding the profile lock.
+
+    Args:
+        path: The profile directory.
+
+    Returns:
+        Bytes reclaimed.
+    """
+    before = _dir_size(path)
+
+    for relative in PRUNABLE_DIRS:
+        shutil.rmtree(os.path.join(path, relative), ignore_errors=True)
+
+    for relative in COMPACTABLE_DBS:
+        db_path = os.path.join(path, relative)
+        if not os.path.exists(db_path):
+            continue
+        try:
+            connection = sqlite3.connect(db_path)
+            connection.execute("VACUUM")
+            connection.close()
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not compact {relative}: {e}")
+
+    max_bytes = int(os.getenv("PROFILE_MAX_MB", "500")) * 1024 * 1024
+    if _dir_size(path) > max_bytes:
+        print("🧹 Profile over size limit - dropping HTTP cache")
+        shutil.rmtree(os.path.join(path, "HttpCache"), ignore_errors=True)
+
+    reclaimed = max(0, before - _dir_size(path))
+    if reclaimed:
+        print(f"🧹 Pruned profile: reclaimed {reclaimed / (1024 * 1024):.1f} MB")
+    return reclaimed
+
+
+def acquire_profile(account_id: str) -> ProfileLease:
+    """
+    Locks and prepares the persistent profile for an account.
+
+    Args:
+        account_id: The account id (see accounts.current_account_id()).
+
+    Returns:
+        A ProfileLease holding the lock.
+
+    Raises:
+        Exception: If another run is already using the profile.
+    """
+    root = get_profile_root()
+    os.makedirs(root, exist_ok=True)
+    path = os.path.join(root, account_id)
+    warm = os.path.isdir(os.path.join(path, "HttpCache"))
+
+    lock_file = open(os.path.join(root, f"{account_id}.lock"), "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        raise Exception(f"Profile for account '{account_id}' is in use by another run")
+    lock_file.write(str(os.getpid()))
+    lock_file.flush()
+
+    os.makedirs(path, exist_ok=True)
+    prune_profile(path)
+    print(f"📁 Using {'warm' if warm else 'cold'} persistent profile: {path}")
+    return ProfileLease(account_id, path, lock_file, warm)
+
+
+def configure_profile(chrome_options, lease: ProfileLease) -> None:
+    """
+    Points Chrome at the leased profile with a bounded disk cache.
+
+    Args:
+        chrome_options: The ChromeOptions instance being built.
+        lease: The profile lease from acquire_profile().
+    """
+    cache_bytes = int(os.getenv("PROFILE_CACHE_MB", "100")) * 1024 * 1024
+    chrome_options.add_argument(f"--user-data-dir={lease.path}")
+    chrome_options.add_argument(f"--disk-cache-dir={os.path.join(lease.path, 'HttpCache')}")
+    chrome_options.add_argument(f"--disk-cache-size={cache_bytes}")
+
+
+def attach_profile(driver: WebDriver, lease: ProfileLease) -> None:
+    """
+    Starts collecting cache statistics for a driver running on a lease.
+
+    Args:
+        driver: The webdriver instance.
+        lease: The profile lease the driver was launched with.
+    """
+    _leases[driver] = lease
+    subscribe(driver, lease.on_event)
+
+
+def leased_profile_path(driver: WebDriver) -> Optional[str]:
+    """
+    Returns the persistent profile directory a driver runs on.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        The profile path, or None for temporary profiles.
+    """
+    lease = _leases.get(driver)
+    return lease.path if lease else None
+
+
+def _record_run(lease: ProfileLease) -> Dict:
+    stats_path = os.path.join(get_profile_root(), f"{lease.account_id}.stats.json")
+    try:
+        with open(stats_path) as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        history = []
+
+    run = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "warm": lease.warm,
+        "requests": lease.requests,
+        "cache_hits": lease.cache_hits,
+        "cache_hit_ratio": lease.cache_hits / lease.requests if lease.requests else 0.0,
+        "bytes_transferred": lease.bytes_transferred,
+    }
+    history = (history + [run])[-HISTORY_LIMIT:]
+    with open(stats_path, "w") as f:
+        json.dump(history, f, indent=2)
+
+    print(f"📁 {'Warm' if lease.warm else 'Cold'} run: cache hit ratio {run['cache_hit_ratio']:.0%}, "
+          f"{lease.bytes_transferred / 1024:.0f} KB transferred")
+    for label, warm in (("warm", True), ("cold", False)):
+        runs = [r for r in history if r["warm"] == warm]
+        if runs:
+            avg_ratio = sum(r["cache_hit_ratio"] for r in runs) / len(runs)
+            avg_kb = sum(r["bytes_transferred"] for r in runs) / len(runs) / 1024
+            print(f"   - {label} average over {len(runs)} runs: {avg_ratio:.0%} hits, {avg_kb:.0f} KB")
+    return run
+
+
+def report_profile_cache(driver: WebDriver) -> Dict:
+    """
+    Records and prints this run's cache statistics. Call before quitting.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        The recorded run entry, or an empty dict without a persistent profile.
+    """
+    lease = _leases.get(driver)
+    if lease is None:
+        return {}
+    drain_events(driver)
+    return _record_run(lease)
+
+
+def release_profile(driver: Optional[WebDriver] = None, lease: Optional[ProfileLease] = None) -> None:
+    """
+    Releases the profile lock. Call after Chrome has exited.
+
+    Args:
+        driver: The webdriver instance the lease was attached to.
+        lease: The lease itself, for drivers that never started.
+    """
+    if driver is not None:
+        lease = _leases.pop(driver, None) or lease
+    if lease is None or lease.lock_file.closed:
+        return
+    fcntl.flock(lease.lock_file, fcntl.LOCK_UN)
+    lease.lock_file.close()
@@ -0,0 +1,653 @@
+"""
+Direct Chrome DevTools Protocol driver for the Naukri automation.
+
+CdpDriver launches Chrome itself and talks to it over a single DevTools
+websocket, skipping chromedriver and its extra HTTP hop per command. It
+implements the subset of Selenium's WebDriver/WebElement API that the login
+and refresh flows use (navigation, find_element(s) with the usual By
+strategies, click, send_keys, cookies, execute_script, window switching and
+execute_cdp_cmd) and raises Selenium's own exceptions, so WebDriverWait,
+expected_conditions and the existing try/except blocks work unchanged.
+"""
+
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import websocket
+from selenium.common.exceptions import (NoSuchElementException, NoSuchWindowException,
+                                        StaleElementReferenceException, TimeoutException,
+                                        WebDriverException)
+
+
+CHROME_BINARY_PATHS = [
+    "/usr/bin/google-chrome",
+    "/usr/bin/google-chrome-stable",
+    "/usr/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+# Selenium Keys code points the flows may send, mapped to DevTools key names
+SPECIAL_KEYS = {
+    "\ue003": ("Backspace", 8),
+    "\ue004": ("Tab", 9),
+    "\ue006": ("Enter", 13),
+    "\ue007": ("Enter", 13),
+    "\ue00c": ("Escape", 27),
+}
+
+# Events kept for get_log('performance'), mirroring chromedriver's perf log
+LOGGED_EVENT_DOMAINS = ("Network.", "Page.", "Tracing.")
+BROWSER_DOMAINS = ("Browser.", "Target.")
+
+_FIND_ELEMENTS_JS = """
+function(by, value, root) {
+    root = root || document;
+    const doc = root.ownerDocument || root;
+    const all = (selector) => Array.from(root.querySelectorAll(selector));
+    switch (by) {
+        case 'xpath': {
+            const r = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const out = [];
+            for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+            return out;
+        }
+        case 'css selector': return all(value);
+        case 'tag name': return all(value);
+        case 'id': return all('#' + CSS.escape(value));
+        case 'name': return all('[name="' + CSS.escape(value) + '"]');
+        case 'class name': return all('.' + CSS.escape(value));
+        case 'link text': return all('a').filter(a => a.innerText.trim() === value);
+        case 'partial link text': return all('a').filter(a => a.innerText.includes(value));
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+"""
+
+_IS_DISPLAYED_JS = """
+function() {
+    const style = window.getComputedStyle(this);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+    const rect = this.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+_CLICK_POINT_JS = """
+function() {
+    this.scrollIntoView({block: 'center', inline: 'center'});
+    const r = this.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 ? [r.left + r.width / 2, r.top + r.height / 2] : null;
+}
+"""
+
+
+def find_chrome_binary(preferred: Optional[str] = None) -> str:
+    """
+    Returns the Chrome executable to launch.
+
+    Args:
+        preferred: An explicit binary location, used when it exists.
+
+    Returns:
+        Path to a Chrome/Chromium binary.
+    """
+    candidates = [preferred] if preferred else []
+    candidates += [shutil.which(name) for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser")]
+    candidates += CHROME_BINARY_PATHS
+    for candidate in candidates:
+        if candidate and os.path.exists(candidate):
+            return candidate
+    raise WebDriverException("Chrome binary not found")
+
+
+class CdpElement:
+    """A DOM node held as a DevTools remote object, with a WebElement-like API."""
+
+    def __init__(self, driver: "CdpDriver", object_id: str, session_id: str):
+        self._driver = driver
+        self._object_id = object_id
+        self._session_id = session_id
+
+    @property
+    def id(self) -> str:
+        return self._object_id
+
+    def _call(self, declaration: str, *args, return_by_value: bool = True) -> Any:
+        return self._driver._call_function_on(self._object_id, declaration, list(args), return_by_value, self._session_id)
+
+    @property
+    def tag_name(self) -> str:
+        return self._call("function() { return this.tagName.toLowerCase(); }")
+
+    @property
+    def text(self) -> str:
+        return self._call("function() { return (this.innerText || '').trim(); }")
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self._call("function(n) { const v = n in this ? this[n] : this.getAttribute(n);"
+                          " return v === null || v === undefined ? null : String(v); }", name)
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        return self._call("function(n) { return this.getAttribute(n); }", name)
+
+    def is_displayed(self) -> bool:
+        return bool(self._call(_IS_DISPLAYED_JS))
+
+    def is_enabled(self) -> bool:
+        return not self._call("function() { return !!this.disabled; }")
+
+    def is_selected(self) -> bool:
+        return bool(self._call("function() { return !!(this.checked || this.selected); }"))
+
+    def clear(self) -> None:
+        self._call("function() { this.focus(); this.value = '';"
+                   " this.dispatchEvent(new Event('input', {bubbles: true}));"
+                   " this.dispatchEvent(new Event('change', {bubbles: true})); }")
+
+    def click(self) -> None:
+        point = self._call(_CLICK_POINT_JS)
+        if not point:
+            self._call("function() { this.click(); }")
+            return
+        x, y = point
+        send = self._driver._send
+        send("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": y}, self._session_id)
+        send("Input.dispatchMouseEvent", {"type": "mousePressed", "x": x, "y": y, "button": "left", "clickCount": 1}, self._session_id)
+        send("Input.dispatchMouseEvent", {"type": "mouseReleased", "x": x, "y": y, "button": "left", "clickCount": 1}, self._session_id)
+
+    def send_keys(self, *values) -> None:
+        text = "".join(str(v) for v in values)
+        if self._call("function() { return this.tagName === 'INPUT' && this.type === 'file'; }"):
+            files = [os.path.abspath(path) for path in text.split("\n") if path]
+            self._driver._send("DOM.setFileInputFiles", {"files": files, "objectId": self._object_id}, self._session_id)
+            return
+
+        self._call("function() { this.focus(); }")
+        buffer = ""
+        for char in text:
+            if char in SPECIAL_KEYS:
+                if buffer:
+                    self._driver._send("Input.insertText", {"text": buffer}, self._session_id)
+                    buffer = ""
+                self._driver._press_key(*SPECIAL_KEYS[char], session_id=self._session_id)
+            else:
+                buffer += char
+        if buffer:
+            self._driver._send("Input.insertText", {"text": buffer}, self._session_id)
+
+    def submit(self) -> None:
+        self._call("function() { (this.form || this).requestSubmit ? (this.form || this).requestSubmit() : (this.form || this).submit(); }")
+
+    def find_element(self, by: str = "id", value: Optional[str] = None) -> "CdpElement":
+        return self._driver._find(by, value, root=self, single=True)
+
+    def find_elements(self, by: str = "id", value: Optional[str] = None) -> List["CdpElement"]:
+        return self._driver._find(by, value, root=self, single=False)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CdpElement) and other._object_id == self._object_id
+
+    def __hash__(self) -> int:
+        return hash(self._object_id)
+
+
+class _SwitchTo:
+    def __init__(self, driver: "CdpDriver"):
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        self._driver._activate_target(handle)
+
+    def new_window(self, type_hint: Optional[str] = "tab") -> None:
+        params = {"url": "about:blank", "newWindow": type_hint == "window"}
+        if self._driver.browser_context_id:
+            # Keep the tab in the driver's context, with its cookies
+            params["browserContextId"] = self._driver.browser_context_id
+        result = self._driver._send("Target.createTarget", params, session_id=None)
+        self._driver._own_targets.add(result["targetId"])
+        self._driver._activate_target(result["targetId"])
+
+    def default_content(self) -> None:
+        pass
+
+
+class CdpDriver:
+    """Chrome driven over one DevTools websocket, without chromedriver."""
+
+    def __init__(self, arguments: Optional[List[str]] = None, binary_location: Optional[str] = None,
+                 page_load_strategy: str = "normal", startup_timeout: float = 20,
+                 websocket_url: Optional[str] = None, browser_context_id: Optional[str] = None):
+        """
+        Launches Chrome (or attaches to an existing browser) and opens a page.
+
+        Args:
+            arguments: Chrome command-line arguments.
+            binary_location: Chrome binary to launch.
+            page_load_strategy: 'normal', 'eager' or 'none'.
+            startup_timeout: Seconds to wait for the DevTools endpoint.
+            websocket_url: Attach to this browser endpoint instead of launching Chrome.
+            browser_context_id: Open the page inside this browser context.
+        """
+        self.page_load_strategy = page_load_strategy
+        self._page_load_timeout = 300.0
+        self._implicit_wait = 0.0
+        self._script_timeout = 30.0
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Dict] = {}
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._events: deque = deque(maxlen=20000)
+        self._load_events: Dict[str, threading.Event] = {}
+        self._sessions: Dict[str, str] = {}
+        self._process = None
+        self._temp_profile = None
+        self._owns_browser = websocket_url is None
+        self._closed = False
+        self.browser_context_id = browser_context_id
+        self.switch_to = _SwitchTo(self)
+
+        if websocket_url is None:
+            websocket_url = self._launch(arguments or [], binary_location, startup_timeout)
+        self.websocket_url = websocket_url
+        self._ws = websocket.create_connection(websocket_url, suppress_origin=True, enable_multithread=True)
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+        params = {"url": "about:blank"}
+        if browser_context_id:
+            params["browserContextId"] = browser_context_id
+        target_id = self._send("Target.createTarget", params, session_id=None)["targetId"]
+        self._own_targets = {target_id}
+        self._activate_target(target_id)
+        if self._owns_browser:
+            self._close_startup_pages()
+
+    # Connection ---------------------------------------------------------
+
+    def _launch(self, arguments: List[str], binary_location: Optional[str], startup_timeout: float) -> str:
+        args = [a for a in arguments if not a.startswith("--remote-debugging-port")]
+        user_data_dir = next((a.split("=", 1)[1] for a in args if a.startswith("--user-data-dir=")), None)
+        if user_data_dir is None:
+            self._temp_profile = tempfile.mkdtemp(prefix="naukri-cdp-")
+            user_data_dir = self._temp_profile
+            args.append(f"--user-data-dir={user_data_dir}")
+
+        port_file = os.path.join(user_data_dir, "DevToolsActivePort")
+        if os.path.exists(port_file):
+            os.remove(port_file)
+
+        command = [find_chrome_binary(binary_location), "--remote-debugging-port=0", *args, "about:blank"]
+        self._process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        deadline = time.time() + startup_timeout
+        while time.time() < deadline:
+            if self._process.poll() is not None:
+                raise WebDriverException(f"Chrome exited during startup with code {self._process.returncode}")
+            try:
+                with open(port_file) as f:
+                    port, path = f.read().split("\n")[:2]
+                return f"ws://127.0.0.1:{port.strip()}{path.strip()}"
+            except (OSError, ValueError):
+                time.sleep(0.05)
+        self._process.kill()
+        raise WebDriverException("Timed out waiting for Chrome DevTools endpoint")
+
+    def _close_startup_pages(self) -> None:
+        # The page Chrome opens at startup would otherwise count as a second window
+        targets = self._send("Target.getTargets", {}, session_id=None).get("targetInfos", [])
+        for target in targets:
+            if target.get("type") == "page" and target["targetId"] not in self._own_targets:
+                try:
+                    self._send("Target.closeTarget", {"targetId": target["targetId"]}, session_id=None)
+                except WebDriverException:
+                    pass
+
+    def _read_loop(self) -> None:
+        while True:
+            try:
+                message = json.loads(self._ws.recv())
+            except Exception:
+                break
+            if "id" in message:
+                with self._pending_lock:
+                    waiter = self._pending.get(message["id"])
+                if waiter:
+                    waiter["message"] = message
+                    waiter["event"].set()
+                continue
+
+            method = message.get("method", "")
+            session_id = message.get("sessionId")
+            if method == "Page.loadEventFired" and session_id in self._load_events:
+                self._load_events[session_id].set()
+            elif method == "Target.detachedFromTarget":
+                detached = message.get("params", {}).get("sessionId")
+                self._sessions = {t: s for t, s in self._sessions.items() if s != detached}
+            if method.startswith(LOGGED_EVENT_DOMAINS):
+                self._events.append({
+                    "level": "INFO",
+                    "timestamp": int(time.time() * 1000),
+                    "message": json.dumps({"message": {"method": method, "params": message.get("params", {})},
+                                           "webview": session_id}),
+                })
+
+        # Connection gone: release anyone still waiting
+        with self._pending_lock:
+            for waiter in self._pending.values():
+                waiter["event"].set()
+
+    def _send(self, method: str, params: Optional[Dict] = None, session_id: Optional[str] = "current",
+              timeout: Optional[float] = None) -> Dict:
+        if session_id == "current":
+            session_id = self._session_id
+        command_id = next(self._ids)
+        payload = {"id": command_id, "method": method, "params": params or {}}
+        if session_id:
+            payload["sessionId"] = session_id
+
+        waiter = {"event": threading.Event(), "message": None}
+        with self._pending_lock:
+            self._pending[command_id] = waiter
+        try:
+            with self._send_lock:
+                self._ws.send(json.dumps(payload))
+            if not waiter["event"].wait(timeout or self._script_timeout):
+                raise TimeoutException(f"DevTools command {method} timed out")
+        finally:
+            with self._pending_lock:
+                self._pending.pop(command_id, None)
+
+        message = waiter["message"]
+        if message is None:
+            raise WebDriverException("DevTools connection closed")
+        if "error" in message:
+            error = message["error"].get("message", "")
+            if "Could not find object" in error or "Cannot find context" in error:
+                raise StaleElementReferenceException(error)
+            if "No session with given id" in error or "No target with given id" in error:
+                raise NoSuchWindowException(error)
+            raise WebDriverException(f"{method} failed: {error}")
+        return message.get("result", {})
+
+    def _activate_target(self, target_id: str) -> None:
+        if target_id not in self._sessions:
+            try:
+                session_id = self._send("Target.attachToTarget", {"targetId": target_id, "flatten": True}, session_id=None)["sessionId"]
+            except WebDriverException as e:
+                raise NoSuchWindowException(str(e))
+            self._load_events[session_id] = threading.Event()
+            for domain in ("Page.enable", "Network.enable", "Runtime.enable"):
+                self._send(domain, session_id=session_id)
+            self._sessions[target_id] = session_id
+        self._target_id = target_id
+        self._session_id = self._sessions[target_id]
+
+    # Script evaluation --------------------------------------------------
+
+    def _unwrap(self, remote: Dict, session_id: str) -> Any:
+        if remote.get("subtype") == "node":
+            return CdpElement(self, remote["objectId"], session_id)
+        if remote.get("type") == "undefined" or remote.get("subtype") == "null":
+            return None
+        if "unserializableValue" in remote:
+            return float(remote["unserializableValue"].rstrip("n"))
+        if "objectId" not in remote:
+            return remote.get("value")
+        if remote.get("subtype") == "array":
+            properties = self._send("Runtime.getProperties", {"objectId": remote["objectId"], "ownProperties": True}, session_id)
+            items = sorted((int(p["name"]), p["value"]) for p in properties.get("result", []) if p["name"].isdigit())
+            return [self._unwrap(value, session_id) for _, value in items]
+        result = self._send("Runtime.callFunctionOn", {
+            "objectId": remote["objectId"],
+            "functionDeclaration": "function() { return this; }",
+            "returnByValue": True,
+        }, session_id)
+        return result.get("result", {}).get("value")
+
+    def _raise_on_exception(self, result: Dict) -> None:
+        details = result.get("exceptionDetails")
+        if details:
+            description = details.get("exception", {}).get("description") or details.get("text", "")
+            raise WebDriverException(f"javascript error: {description}")
+
+    def _call_function_on(self, object_id: str, declaration: str, args: List[Any],
+                          return_by_value: bool, session_id: Optional[str] = None) -> Any:
+        session_id = session_id or self._session_id
+        result = self._send("Runtime.callFunctionOn", {
+            "objectId": object_id,
+            "functionDeclaration": declaration,
+            "arguments": [self._argument(a) for a in args],
+            "returnByValue": return_by_value,
+        }, session_id)
+        self._raise_on_exception(result)
+        remote = result.get("result", {})
+        return remote.get("value") if return_by_value else self._unwrap(remote, session_id)
+
+    @staticmethod
+    def _argument(value: Any) -> Dict:
+        if isinstance(value, CdpElement):
+            return {"objectId": value.id}
+        return {"value": value}
+
+    def execute_script(self, script: str, *args) -> Any:
+        """Runs a script the way WebDriver does: as a function body with arguments[]."""
+        declaration = f"function() {{\n{script}\n}}"
+        element = next((a for a in args if isinstance(a, CdpElement)), None)
+        if element is not None:
+            return self._call_function_on(element.id, f"function() {{ return ({declaration}).apply(null, arguments); }}",
+                                          list(args), False)
+        result = self._send("Runtime.evaluate", {
+            "expression": f"({declaration}).apply(null, {json.dumps(list(args))})",
+            "returnByValue": False,
+        })
+        self._raise_on_exception(result)
+        return self._unwrap(result.get("result", {}), self._session_id)
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict) -> Dict:
+        # Browser and Target commands go to the browser session, the rest to the current page
+        if cmd.startswith(BROWSER_DOMAINS):
+            return self._send(cmd, cmd_args, session_id=None)
+        return self._send(cmd, cmd_args)
+
+    # Elements -----------------------------------------------------------
+
+    def _find(self, by: str, value: str, root: Optional[CdpElement], single: bool):
+        deadline = time.time() + self._implicit_wait
+        while True:
+            if root is not None:
+                found = root._call(f"function(by, value) {{ return ({_FIND_ELEMENTS_JS})(by, value, this); }}",
+                                   by, value, return_by_value=False)
+            else:
+                result = self._send("Runtime.evaluate", {
+                    "expression": f"({_FIND_ELEMENTS_JS})({json.dumps(by)}, {json.dumps(value)}, null)",
+                    "returnByValue": False,
+                })
+                self._raise_on_exception(result)
+                found = self._unwrap(result.get("result", {}), self._session_id)
+            found = found or []
+            if found or time.time() >= deadline:
+                break
+            time.sleep(0.1)
+
+        if not single:
+            return found
+        if not found:
+            raise NoSuchElementException(f"no such element: Unable to locate element: {{\"method\":\"{by}\",\"selector\":\"{value}\"}}")
+        return found[0]
+
+    def find_element(self, by: str = "id", value: Optional[str] = None) -> CdpElement:
+        return self._find(by, value, None, single=True)
+
+    def find_elements(self, by: str = "id", value: Optional[str] = None) -> List[CdpElement]:
+        return self._find(by, value, None, single=False)
+
+    def _press_key(self, key: str, code: int, session_id: Optional[str] = None) -> None:
+        session_id = session_id or self._session_id
+        for event_type in ("rawKeyDown", "keyUp"):
+            params = {"type": event_type, "key": key, "code": key, "windowsVirtualKeyCode": code}
+            if event_type == "rawKeyDown" and key == "Enter":
+                params["text"] = "\r"
+                params["type"] = "keyDown"
+            self._send("Input.dispatchKeyEvent", params, session_id)
+
+    # Navigation ---------------------------------------------------------
+
+    def get(self, url: str) -> None:
+        load_event = self._load_events[self._session_id]
+        load_event.clear()
+        result = self._send("Page.navigate", {"url": url}, timeout=self._page_load_timeout)
+        if result.get("errorText"):
+            raise WebDriverException(f"unknown error: net::{result['errorText']}")
+
+        if self.page_load_strategy == "none":
+            return
+        deadline = time.time() + self._page_load_timeout
+        if self.page_load_strategy == "eager":
+            while time.time() < deadline:
+                try:
+                    if self.execute_script("return document.readyState;") != "loading":
+                        return
+                except WebDriverException:
+                    pass
+                time.sleep(0.05)
+        elif load_event.wait(self._page_load_timeout):
+            return
+        raise TimeoutException(f"timeout: Timed out receiving message from renderer loading {url}")
+
+    @property
+    def current_url(self) -> str:
+        return self.execute_script("return location.href;")
+
+    @property
+    def title(self) -> str:
+        return self.execute_script("return document.title;")
+
+    @property
+    def page_source(self) -> str:
+        return self.execute_script("return document.documentElement ? document.documentElement.outerHTML : '';")
+
+    def refresh(self) -> None:
+        self.get(self.current_url)
+
+    def back(self) -> None:
+        self.execute_script("history.back();")
+
+    # Cookies ------------------------------------------------------------
+
+    def get_cookies(self) -> List[Dict]:
+        cookies = []
+        for cookie in self._send("Network.getCookies", {}).get("cookies", []):
+            converted = {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie.get("domain"),
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+            }
+            if cookie.get("sameSite"):
+                converted["sameSite"] = cookie["sameSite"]
+            if cookie.get("expires", -1) > 0:
+                converted["expiry"] = int(cookie["expires"])
+            cookies.append(converted)
+        return cookies
+
+    def get_cookie(self, name: str) -> Optional[Dict]:
+        return next((c for c in self.get_cookies() if c["name"] == name), None)
+
+    def add_cookie(self, cookie_dict: Dict) -> None:
+        cookie = {k: v for k, v in cookie_dict.items() if k != "expiry"}
+        if "expiry" in cookie_dict:
+            cookie["expires"] = cookie_dict["expiry"]
+        if "domain" not in cookie:
+            cookie["url"] = self.current_url
+        self._send("Network.setCookie", cookie)
+
+    def delete_all_cookies(self) -> None:
+        self._send("Network.clearBrowserCookies", {})
+
+    # Windows ------------------------------------------------------------
+
+    @property
+    def window_handles(self) -> List[str]:
+        targets = self._send("Target.getTargets", {}, session_id=None).get("targetInfos", [])
+        pages = [target for target in targets if target.get("type") == "page"]
+        # Only pages this driver created, and popups (e.g. OAuth) opened from them
+        owned = set(self._own_targets)
+        added = True
+        while added:
+            added = False
+            for target in pages:
+                if target["targetId"] not in owned and target.get("openerId") in owned:
+                    owned.add(target["targetId"])
+                    added = True
+        handles = [target["targetId"] for target in pages if target["targetId"] in owned]
+        # Keep our own first target first, like chromedriver's creation order
+        handles.sort(key=lambda handle: handle not in self._own_targets)
+        return handles
+
+    @property
+    def browser_pid(self) -> Optional[int]:
+        return self._process.pid if self._process else None
+
+    @property
+    def current_window_handle(self) -> str:
+        return self._target_id
+
+    def close(self) -> None:
+        self._send("Target.closeTarget", {"targetId": self._target_id}, session_id=None)
+        self._sessions.pop(self._target_id, None)
+
+    # Timeouts and logs --------------------------------------------------
+
+    def set_page_load_timeout(self, time_to_wait: float) -> None:
+        self._page_load_timeout = float(time_to_wait)
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        self._implicit_wait = float(time_to_wait)
+
+    def set_script_timeout(self, time_to_wait: float) -> None:
+        self._script_timeout = float(time_to_wait)
+
+    def get_log(self, log_type: str) -> List[Dict]:
+        if log_type != "performance":
+            return []
+        entries = list(self._events)
+        self._events.clear()
+        return entries
+
+    def quit(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._owns_browser:
+                self._send("Browser.close", {}, session_id=None, timeout=5)
+            else:
+                for target_id in list(self._own_targets) + list(self._sessions):
+                    try:
+                        self._send("Target.closeTarget", {"targetId": target_id}, session_id=None, timeout=5)
+                    except WebDriverException:
+                        pass
+        except WebDriverException:
+            pass
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+        if self._process:
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        if self._temp_profile:
+            shutil.rmtree(self._temp_profile, ignore_errors=True)
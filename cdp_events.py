@@ -0,0 +1,101 @@
+"""
+Chrome DevTools Protocol event collection for the Naukri automation.
+
+Selenium only surfaces CDP events (Network.*, Page.*, Tracing.*) through the
+chromedriver performance log, and reading that log consumes it. This module
+drains the log in one place and fans the parsed events out to every
+subscriber registered for a driver, so several features can watch the same
+event stream without stealing entries from each other.
+"""
+
+import json
+import weakref
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+EventCallback = Callable[[str, dict], None]
+
+# Subscribers per driver instance; dropped automatically when the driver is
+# garbage collected.
+_subscribers: "weakref.WeakKeyDictionary[WebDriver, List[EventCallback]]" = weakref.WeakKeyDictionary()
+
+
+def enable_performance_logging(chrome_options, trace_categories: Optional[str] = None) -> None:
+    """
+    Turns on the chromedriver performance log so CDP events can be drained.
+
+    Args:
+        chrome_options: The ChromeOptions instance being built.
+        trace_categories: Optional comma-separated Chrome trace categories to
+            record into the same log (used by profiling mode).
+    """
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    perf_prefs = {"enableNetwork": True, "enablePage": True}
+    if trace_categories:
+        perf_prefs["traceCategories"] = trace_categories
+    chrome_options.add_experimental_option("perfLoggingPrefs", perf_prefs)
+
+
+def subscribe(driver: WebDriver, callback: EventCallback) -> None:
+    """
+    Registers a callback that receives (method, params) for every CDP event.
+
+    Args:
+        driver: The webdriver instance.
+        callback: Function called once per drained event.
+    """
+    _subscribers.setdefault(driver, [])
+    if callback not in _subscribers[driver]:
+        _subscribers[driver].append(callback)
+
+
+def unsubscribe(driver: WebDriver, callback: EventCallback) -> None:
+    """
+    Removes a previously registered callback.
+
+    Args:
+        driver: The webdriver instance.
+        callback: The callback passed to subscribe().
+    """
+    callbacks = _subscribers.get(driver, [])
+    if callback in callbacks:
+        callbacks.remove(callback)
+
+
+def drain_events(driver: WebDriver) -> List[Dict]:
+    """
+    Reads all pending CDP events from the performance log and dispatches them.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        The parsed events as dicts with 'method' and 'params' keys. Empty if
+        performance logging is not enabled for this driver.
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return []
+
+    events = []
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        events.append(message)
+
+    callbacks = list(_subscribers.get(driver, []))
+    for event in events:
+        method = event.get("method", "")
+        params = event.get("params", {})
+        for callback in callbacks:
+            try:
+                callback(method, params)
+            except Exception as e:
+                print(f"⚠️ CDP event subscriber failed on {method}: {e}")
+
+    return events
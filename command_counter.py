@@ -0,0 +1,224 @@
+"""
+WebDriver command accounting for the Naukri automation.
+
+Every WebDriver command is a round-trip to chromedriver (or, on the DevTools
+backend, a CDP message), and loops of find_elements, is_displayed,
+per-character send_keys and repeated current_url reads add up. The counter
+wraps a driver's command entry point and records the count and latency of
+each command type per phase, where a phase is the flow function running at
+the time (setup_driver, login_with_*, refresh_profile).
+
+Per-phase budgets cap the number of commands, in total or per command type:
+
+    {"login_with_email_password": {"total": 400, "findElements": 150},
+     "refresh_profile": 40}
+
+check_command_budgets() lists the violations (also added to the run report)
+and assert_command_budgets() raises, so a test that drives the flows against
+a stub site fails when a change adds round-trips.
+
+Configuration (environment variables):
+    COMMAND_BUDGETS_PATH: JSON file with per-phase budgets (default: unset).
+"""
+
+import functools
+import json
+import os
+import time
+import weakref
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from cdp_driver import CdpDriver
+
+
+class CommandBudgetExceeded(AssertionError):
+    """Raised by assert_command_budgets() when a phase used more commands than budgeted."""
+
+
+class CommandCounter:
+    """Counts and times one driver's commands by phase and command type."""
+
+    def __init__(self, phase: str):
+        self.phases: List[str] = [phase]
+        # phase -> command -> [count, total seconds]
+        self.counts: Dict[str, Dict[str, List[float]]] = {}
+
+    @property
+    def phase(self) -> str:
+        return self.phases[-1]
+
+    def record(self, command: str, seconds: float) -> None:
+        entry = self.counts.setdefault(self.phase, {}).setdefault(command, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def wrap(self, send: Callable) -> Callable:
+        @functools.wraps(send)
+        def counted(command, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return send(command, *args, **kwargs)
+            finally:
+                self.record(command, time.perf_counter() - start)
+        return counted
+
+    def summary(self) -> Dict:
+        return {
+            phase: {
+                "commands": int(sum(count for count, _ in commands.values())),
+                "seconds": round(sum(seconds for _, seconds in commands.values()), 3),
+                "by_command": {command: {"count": int(count), "seconds": round(seconds, 3)}
+                               for command, (count, seconds) in
+                               sorted(commands.items(), key=lambda c: c[1][0], reverse=True)},
+            }
+            for phase, commands in self.counts.items()
+        }
+
+
+_counters: "weakref.WeakKeyDictionary[WebDriver, CommandCounter]" = weakref.WeakKeyDictionary()
+
+
+def attach_command_counter(driver: WebDriver, phase: str = "setup_driver") -> CommandCounter:
+    """
+    Starts counting a driver's commands.
+
+    Wraps WebDriver.execute, which element methods go through as well, or the
+    CDP send of the DevTools backend.
+
+    Args:
+        driver: The webdriver instance.
+        phase: Phase for commands sent outside any counted flow function.
+
+    Returns:
+        The counter.
+    """
+    counter = _counters.get(driver)
+    if counter is not None:
+        return counter
+    counter = _counters[driver] = CommandCounter(phase)
+    if isinstance(driver, CdpDriver):
+        driver._send = counter.wrap(driver._send)
+    else:
+        driver.execute = counter.wrap(driver.execute)
+    return counter
+
+
+def command_phase(name: str) -> Callable:
+    """
+    Decorates a flow function taking the driver first, attributing its commands to a phase.
+
+    Args:
+        name: Phase name, usually the function's name.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(driver, *args, **kwargs):
+            counter = _counters.get(driver)
+            if counter is None:
+                return func(driver, *args, **kwargs)
+            counter.phases.append(name)
+            try:
+                return func(driver, *args, **kwargs)
+            finally:
+                counter.phases.pop()
+        return wrapper
+    return decorator
+
+
+def command_counts(driver: WebDriver) -> Dict:
+    """
+    Returns a driver's command counts so far.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        Dict of phase -> {commands, seconds, by_command}; empty without a counter.
+    """
+    counter = _counters.get(driver)
+    return counter.summary() if counter else {}
+
+
+def load_command_budgets() -> Dict:
+    """Returns the budgets from COMMAND_BUDGETS_PATH, empty if unset or unreadable."""
+    path = os.getenv("COMMAND_BUDGETS_PATH")
+    if not path:
+        return {}
+    try:
+        with open(os.path.expanduser(path)) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read command budgets from {path}: {e}")
+        return {}
+
+
+def check_command_budgets(counts: Dict, budgets: Optional[Dict] = None) -> List[str]:
+    """
+    Compares command counts against per-phase budgets.
+
+    Args:
+        counts: Counts from command_counts().
+        budgets: Phase -> total or {"total"/command type: limit}; loaded from
+            COMMAND_BUDGETS_PATH if not given.
+
+    Returns:
+        One message per exceeded limit.
+    """
+    budgets = load_command_budgets() if budgets is None else budgets
+    violations = []
+    for phase, limits in budgets.items():
+        if not isinstance(limits, dict):
+            limits = {"total": limits}
+        phase_counts = counts.get(phase, {"commands": 0, "by_command": {}})
+        for command, limit in limits.items():
+            used = phase_counts["commands"] if command == "total" else \
+                phase_counts["by_command"].get(command, {}).get("count", 0)
+            if used > limit:
+                violations.append(f"{phase}: {used} {'commands' if command == 'total' else command} "
+                                  f"(budget {limit})")
+    return violations
+
+
+def assert_command_budgets(driver: WebDriver, budgets: Optional[Dict] = None) -> None:
+    """
+    Raises if any phase of a driver's run exceeded its command budget.
+
+    Args:
+        driver: The webdriver instance.
+        budgets: As for check_command_budgets().
+
+    Raises:
+        CommandBudgetExceeded: With every violation in the message.
+    """
+    violations = check_command_budgets(command_counts(driver), budgets)
+    if violations:
+        raise CommandBudgetExceeded("WebDriver command budget exceeded: " + "; ".join(violations))
+
+
+def report_command_counts(driver: WebDriver) -> Dict:
+    """
+    Prints and returns a driver's command counts and budget violations. Call before quitting.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        Dict with 'phases' and 'budget_violations', or {} without a counter.
+    """
+    counter = _counters.pop(driver, None)
+    if counter is None:
+        return {}
+    counts = counter.summary()
+    violations = check_command_budgets(counts)
+
+    total = sum(phase["commands"] for phase in counts.values())
+    seconds = sum(phase["seconds"] for phase in counts.values())
+    print(f"🔁 WebDriver commands: {total} round-trips, {seconds:.1f}s")
+    for phase, summary in counts.items():
+        top = ", ".join(f"{command} {entry['count']}" for command, entry in list(summary["by_command"].items())[:3])
+        print(f"   - {phase}: {summary['commands']} commands, {summary['seconds']:.1f}s ({top})")
+    for violation in violations:
+        print(f"❌ Command budget exceeded: {violation}")
+    return {"phases": counts, "budget_violations": violations}
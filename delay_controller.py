@@ -0,0 +1,260 @@
+"""
+Adaptive humanisation delays for the Naukri automation.
+
+The flows pause between actions (before navigation, after page loads, while
+typing) and back off after an "Access Denied" page. Fixed ranges either
+waste time or get the run blocked. DelayController scales every range by one
+factor chosen per account and host from a ladder of levels, using the
+outcomes of earlier runs: a block or CAPTCHA moves one level slower, and
+after enough clean runs at a level whose observed block rate is under the
+target it tries one level faster. A login error (wrong password, OTP
+timeout) says nothing about pace and leaves the level alone. State is kept in a JSON file so
+the controller learns across runs. Level 1.0 reproduces the original fixed
+delays.
+
+Configuration (environment variables):
+    ADAPTIVE_DELAYS: false to always use the original delays (default: true).
+    DELAY_TARGET_BLOCK_RATE: Highest acceptable share of blocked runs (default: 0.05).
+    DELAY_STATE_PATH: Where the learned state is kept
+        (default: ~/.naukri-automation/delay_state.json).
+"""
+
+import fcntl
+import json
+import os
+import random
+import socket
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# Base ranges in seconds, as used by the flows before adaptation
+DELAY_RANGES = {
+    "pre_navigation": (3.0, 8.0),
+    "post_load": (3.0, 7.0),
+    "navigation_retry": (5.0, 10.0),
+    "scroll_pause": (0.5, 2.0),
+    "before_typing": (0.5, 1.5),
+    "keystroke": (0.05, 0.2),
+    "password_keystroke": (0.08, 0.25),
+    "between_fields": (1.0, 3.0),
+    "before_submit": (2.0, 4.0),
+}
+
+# Scale factors tried, fastest first
+LEVELS = [0.25, 0.35, 0.5, 0.7, 1.0, 1.4, 2.0]
+DEFAULT_LEVEL = LEVELS.index(1.0)
+
+# Clean runs needed at a level before trying the next faster one
+MIN_RUNS_PER_LEVEL = 3
+
+# Older outcomes count less, so the controller follows changes in site behaviour
+DECAY = 0.9
+
+# Outcomes from worst to best; a run records the worst one seen
+OUTCOMES = ("blocked", "captcha", "login_error", "success")
+# Outcomes that mean the site pushed back and the delays should grow
+BLOCK_OUTCOMES = ("blocked", "captcha")
+
+_state_lock = threading.Lock()
+_controllers: "weakref.WeakKeyDictionary[WebDriver, DelayController]" = weakref.WeakKeyDictionary()
+
+
+def adaptive_delays_enabled() -> bool:
+    """Returns whether ADAPTIVE_DELAYS is enabled."""
+    return os.getenv("ADAPTIVE_DELAYS", "true").lower() != "false"
+
+
+def _state_path() -> str:
+    return os.path.expanduser(os.getenv("DELAY_STATE_PATH", "~/.naukri-automation/delay_state.json"))
+
+
+@contextmanager
+def _locked_state_file() -> Iterator[None]:
+    # Worker processes on one host share the file; hold the lock across load, change and replace
+    path = _state_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with _state_lock, open(f"{path}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load_state() -> Dict:
+    try:
+        with open(_state_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class DelayController:
+    """Delays for one run of one account on this host."""
+
+    def __init__(self, account_id: str):
+        self.key = f"{account_id}@{socket.gethostname()}"
+        self.target_block_rate = float(os.getenv("DELAY_TARGET_BLOCK_RATE", "0.05"))
+        self.enabled = adaptive_delays_enabled()
+        entry = _load_state().get(self.key, {}) if self.enabled else {}
+        self.level = entry.get("level", DEFAULT_LEVEL) if self.enabled else DEFAULT_LEVEL
+        self.outcome: Optional[str] = None
+        self.slept = 0.0
+        self.started = time.time()
+
+    @property
+    def scale(self) -> float:
+        return LEVELS[self.level]
+
+    def delay(self, name: str) -> float:
+        """
+        Returns a random delay for an action, scaled to the current level.
+
+        Args:
+            name: A DELAY_RANGES key.
+        """
+        low, high = DELAY_RANGES[name]
+        return random.uniform(low, high) * self.scale
+
+    def wait(self, seconds: float) -> None:
+        """Sleeps and counts the time towards this run's total delay."""
+        self.slept += seconds
+        time.sleep(seconds)
+
+    def sleep(self, name: str) -> float:
+        """
+        Sleeps for delay(name) and returns the time slept.
+
+        Args:
+            name: A DELAY_RANGES key.
+        """
+        seconds = self.delay(name)
+        self.wait(seconds)
+        return seconds
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the wait after an "Access Denied" page.
+
+        Backoff is never shortened below the original, only lengthened at slower levels.
+
+        Args:
+            attempt: Zero-based navigation attempt.
+        """
+        return (15 + attempt * 10) * max(1.0, self.scale)
+
+    def note(self, outcome: str) -> None:
+        """
+        Records an event of this run; the worst one becomes the run's outcome.
+
+        Args:
+            outcome: One of OUTCOMES.
+        """
+        if self.outcome is None or OUTCOMES.index(outcome) < OUTCOMES.index(self.outcome):
+            self.outcome = outcome
+
+    def finish(self) -> Optional[Dict]:
+        """
+        Stores the run's outcome and picks the level for the next run.
+
+        Runs that ended without any recorded outcome (crashes before login)
+        teach nothing and are ignored.
+
+        Returns:
+            The stored entry, or None if nothing was recorded.
+        """
+        if not self.enabled or self.outcome is None:
+            return None
+
+        with _locked_state_file():
+            state = _load_state()
+            entry = state.setdefault(self.key, {"level": DEFAULT_LEVEL, "levels": {}, "runs": 0, "blocked": 0})
+            stats = entry["levels"]
+            for level_stats in stats.values():
+                level_stats["runs"] *= DECAY
+                level_stats["blocks"] *= DECAY
+            current = stats.setdefault(str(self.level), {"runs": 0.0, "blocks": 0.0})
+            current["runs"] += 1
+            blocked = self.outcome in BLOCK_OUTCOMES
+            if blocked:
+                current["blocks"] += 1
+
+            level = self.level
+            if blocked:
+                level = min(len(LEVELS) - 1, level + 1)
+            elif self.outcome == "success" and level > 0 and current["runs"] >= MIN_RUNS_PER_LEVEL * DECAY and \
+                    current["blocks"] / current["runs"] <= self.target_block_rate:
+                faster = stats.get(str(level - 1))
+                # A faster level that was blocked is retried once the block has decayed away
+                if not faster or faster["blocks"] < 0.5 or faster["blocks"] / faster["runs"] <= self.target_block_rate:
+                    level -= 1
+
+            entry["level"] = level
+            entry["runs"] += 1
+            entry["blocked"] += int(blocked)
+            entry["last_outcome"] = self.outcome
+            entry["last_run_seconds"] = round(time.time() - self.started, 1)
+            entry["last_delay_seconds"] = round(self.slept, 1)
+            path = _state_path()
+            # Other processes load the state at any moment; never let them see a half-written file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    json.dump(state, f, indent=2)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"⚠️ Could not save delay state: {e}")
+
+        change = "unchanged" if level == self.level else f"{'slower' if level > self.level else 'faster'} ({LEVELS[level]}x)"
+        print(f"⏱️ Delays at {self.scale}x: run ended with '{self.outcome}', {self.slept:.1f}s spent waiting; "
+              f"next run {change} ({entry['blocked']}/{entry['runs']} runs blocked so far)")
+        return entry
+
+
+def attach_delays(driver: WebDriver, account_id: str) -> DelayController:
+    """
+    Creates the delay controller for a driver's run.
+
+    Args:
+        driver: The webdriver instance.
+        account_id: The account the run belongs to.
+
+    Returns:
+        The controller.
+    """
+    controller = DelayController(account_id)
+    _controllers[driver] = controller
+    if controller.scale != 1.0:
+        print(f"⏱️ Using adaptive delays at {controller.scale}x for {account_id}")
+    return controller
+
+
+def delays_for(driver: WebDriver) -> DelayController:
+    """
+    Returns the delay controller for a driver, creating one for the configured account if needed.
+
+    Args:
+        driver: The webdriver instance.
+    """
+    controller = _controllers.get(driver)
+    if controller is None:
+        from accounts import current_account_id
+        controller = attach_delays(driver, current_account_id())
+    return controller
+
+
+def finish_delays(driver: WebDriver) -> Optional[Dict]:
+    """
+    Records the run's outcome for a driver. Call once, at cleanup.
+
+    Args:
+        driver: The webdriver instance.
+    """
+    controller = _controllers.pop(driver, None)
+    return controller.finish() if controller else None
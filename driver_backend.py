@@ -0,0 +1,117 @@
+"""
+Pluggable browser driver backends for the Naukri automation.
+
+The flows in utility.py only use a small part of the WebDriver API, captured
+by the BrowserDriver protocol below. Three backends provide it:
+
+    selenium: webdriver.Chrome driven through a chromedriver process (default).
+    cdp:      CdpDriver, which launches Chrome and speaks the DevTools
+              Protocol over a single websocket, with no chromedriver.
+    remote:   Chrome on a Selenium Grid or other remote WebDriver endpoint
+              (see remote_grid.py).
+
+Configuration (environment variables):
+    DRIVER_BACKEND: selenium (default), cdp or remote.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Protocol
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from cdp_driver import CdpDriver, find_chrome_binary
+from remote_grid import create_remote_driver
+
+
+SUPPORTED_BACKENDS = ("selenium", "cdp", "remote")
+
+
+class BrowserDriver(Protocol):
+    """The driver operations the login and refresh flows rely on."""
+
+    current_url: str
+    title: str
+    page_source: str
+    window_handles: List[str]
+    current_window_handle: str
+    switch_to: Any
+
+    def get(self, url: str) -> None: ...
+    def find_element(self, by: str, value: str) -> Any: ...
+    def find_elements(self, by: str, value: str) -> List[Any]: ...
+    def execute_script(self, script: str, *args) -> Any: ...
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict) -> Dict: ...
+    def get_cookies(self) -> List[Dict]: ...
+    def add_cookie(self, cookie_dict: Dict) -> None: ...
+    def get_log(self, log_type: str) -> List[Dict]: ...
+    def set_page_load_timeout(self, time_to_wait: float) -> None: ...
+    def implicitly_wait(self, time_to_wait: float) -> None: ...
+    def quit(self) -> None: ...
+
+
+def get_driver_backend() -> str:
+    """
+    Returns the configured driver backend name.
+
+    Returns:
+        'selenium', 'cdp' or 'remote'.
+    """
+    backend = os.getenv("DRIVER_BACKEND", "selenium").lower()
+    if backend not in SUPPORTED_BACKENDS:
+        print(f"⚠️ Unknown DRIVER_BACKEND '{backend}', using 'selenium'")
+        backend = "selenium"
+    return backend
+
+
+def resolve_driver_path(backend: Optional[str] = None) -> Optional[str]:
+    """
+    Resolves (and downloads if needed) the executable the backend needs.
+
+    Args:
+        backend: Backend name; defaults to DRIVER_BACKEND.
+
+    Returns:
+        The chromedriver path for the selenium backend, the Chrome binary for
+        cdp, None for remote (nothing runs locally).
+    """
+    backend = backend or get_driver_backend()
+    if backend == "cdp":
+        return find_chrome_binary()
+    if backend == "remote":
+        return None
+    return ChromeDriverManager().install()
+
+
+def create_driver(chrome_options, backend: Optional[str] = None, driver_path: Optional[str] = None) -> BrowserDriver:
+    """
+    Starts a browser with the given options on the selected backend.
+
+    Args:
+        chrome_options: The ChromeOptions built by setup_driver().
+        backend: Backend name; defaults to DRIVER_BACKEND.
+        driver_path: chromedriver path from resolve_driver_path(), to skip resolving it again.
+
+    Returns:
+        A driver implementing BrowserDriver.
+    """
+    backend = backend or get_driver_backend()
+    if backend == "cdp":
+        return CdpDriver(
+            arguments=list(chrome_options.arguments),
+            binary_location=chrome_options.binary_location or driver_path,
+            page_load_strategy=chrome_options.page_load_strategy or "normal",
+        )
+    if backend == "remote":
+        return create_remote_driver(chrome_options)
+
+    service = Service(driver_path or ChromeDriverManager().install())
+    try:
+        return webdriver.Chrome(service=service, options=chrome_options)
+    except Exception:
+        try:
+            service.stop()
+        except Exception:
+            pass
+        raise
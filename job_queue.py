@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Durable refresh job queue for the Naukri automation.
+
+With one crontab line per host, every host refreshes every account. This
+queue keeps one job per account in a SQLite database that several worker
+processes (or hosts sharing the file over a network filesystem that
+supports locking) pull from. The database uses SQLite's rollback journal,
+not WAL, whose shared-memory index doesn't work across hosts. A worker
+leases a job for a limited time and extends the lease while it runs; a
+lease that expires (worker crashed or host lost) makes the job available
+again and counts as a failed attempt. Failed jobs are retried with
+exponential backoff and moved to a dead-letter state after too many
+attempts. Due jobs are handed out in order of how long ago the account was
+last refreshed successfully.
+
+Only account ids are stored; each worker resolves credentials from its own
+ACCOUNTS_FILE or .env.
+
+Usage:
+    python job_queue.py sync           # add a job for every configured account
+    python job_queue.py work [--once]  # run due jobs until none are left
+    python job_queue.py work --autoscale   # ... several at a time (see autoscaler.py)
+    python job_queue.py work --preflight   # ... unless preflight.py reports no-go
+    python job_queue.py status
+    python job_queue.py requeue [account_id]   # retry dead-lettered jobs
+
+Configuration (environment variables):
+    JOB_QUEUE_DB: SQLite database path (default: ~/.naukri-automation/jobs.db).
+    JOB_MIN_INTERVAL_HOURS: A refreshed account is not due again before this (default: 12).
+    JOB_LEASE_SECONDS: Lease length, extended while the job runs (default: 600).
+    JOB_MAX_ATTEMPTS: Failures before a job is dead-lettered (default: 4).
+    JOB_BACKOFF_SECONDS: First retry delay, doubled per failure (default: 300).
+"""
+
+import argparse
+import itertools
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    account_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'ready',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_success_at REAL,
+    last_error TEXT,
+    updated_at REAL NOT NULL
+)
+"""
+
+READY, LEASED, DEAD = "ready", "leased", "dead"
+# fail()'s outcome when the lease had already passed to another worker
+LOST = "lost"
+
+
+class Job:
+    """A leased refresh job."""
+
+    def __init__(self, account_id: str, attempts: int, lease_owner: str, lease_expires_at: float):
+        self.account_id = account_id
+        self.attempts = attempts
+        self.lease_owner = lease_owner
+        self.lease_expires_at = lease_expires_at
+
+
+class JobQueue:
+    """One refresh job per account in a SQLite database shared by workers."""
+
+    def __init__(self, path: Optional[str] = None, min_interval_hours: Optional[float] = None,
+                 lease_seconds: Optional[float] = None, max_attempts: Optional[int] = None,
+                 backoff_seconds: Optional[float] = None):
+        self.path = os.path.expanduser(path or os.getenv("JOB_QUEUE_DB", "~/.naukri-automation/jobs.db"))
+        self.min_interval = 3600 * (min_interval_hours if min_interval_hours is not None
+                                    else float(os.getenv("JOB_MIN_INTERVAL_HOURS", "12")))
+        self.lease_seconds = lease_seconds or float(os.getenv("JOB_LEASE_SECONDS", "600"))
+        self.max_attempts = max_attempts or int(os.getenv("JOB_MAX_ATTEMPTS", "4"))
+        self.backoff_seconds = backoff_seconds or float(os.getenv("JOB_BACKOFF_SECONDS", "300"))
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            # Also switches back databases created in WAL mode
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per operation keeps the queue safe to use from several threads
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def sync(self, account_ids: List[str]) -> int:
+        """
+        Adds a job for every account that doesn't have one yet.
+
+        Args:
+            account_ids: The configured accounts.
+
+        Returns:
+            Number of jobs added.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO jobs (account_id, updated_at) VALUES (?, ?)",
+                             [(account_id, now) for account_id in account_ids])
+            return conn.total_changes - before
+
+    def lease(self, worker_id: str) -> Optional[Job]:
+        """
+        Leases the most overdue job.
+
+        A job is due when it is ready, its backoff has passed and its last
+        success is older than the minimum interval. Expired leases are
+        reclaimed first: each counts as a failed attempt, and a job that runs
+        out of attempts that way is dead-lettered.
+
+        Args:
+            worker_id: Identifies the lease holder.
+
+        Returns:
+            The leased job, or None if nothing is due.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            # IMMEDIATE takes the write lock up front so two workers can't pick the same row
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    """UPDATE jobs SET status = CASE WHEN attempts + 1 >= ? THEN ? ELSE ? END,
+                           attempts = attempts + 1, lease_owner = NULL, lease_expires_at = NULL,
+                           last_error = 'Lease expired (worker lost)', updated_at = ?
+                       WHERE status = ? AND lease_expires_at < ?""",
+                    (self.max_attempts, DEAD, READY, now, LEASED, now),
+                )
+                row = conn.execute(
+                    """SELECT account_id, attempts FROM jobs
+                       WHERE status = ?
+                         AND available_at <= ?
+                         AND (last_success_at IS NULL OR last_success_at <= ?)
+                       ORDER BY COALESCE(last_success_at, 0) ASC, attempts ASC
+                       LIMIT 1""",
+                    (READY, now, now - self.min_interval),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                expires_at = now + self.lease_seconds
+                conn.execute(
+                    "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires_at = ?, updated_at = ? WHERE account_id = ?",
+                    (LEASED, worker_id, expires_at, now, row["account_id"]),
+                )
+                conn.execute("COMMIT")
+                return Job(row["account_id"], row["attempts"], worker_id, expires_at)
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _update_owned(self, job: Job, sql: str, params: tuple) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(f"{sql} WHERE account_id = ? AND status = ? AND lease_owner = ?",
+                                  params + (job.account_id, LEASED, job.lease_owner))
+            return cursor.rowcount == 1
+
+    def heartbeat(self, job: Job) -> bool:
+        """
+        Extends a lease. Returns False if the lease was lost to another worker.
+
+        Args:
+            job: A job from lease().
+        """
+        now = time.time()
+        job.lease_expires_at = now + self.lease_seconds
+        return self._update_owned(job, "UPDATE jobs SET lease_expires_at = ?, updated_at = ?",
+                                  (job.lease_expires_at, now))
+
+    def complete(self, job: Job) -> bool:
+        """
+        Marks a job successful; it becomes due again after the minimum interval.
+
+        Args:
+            job: A job from lease().
+        """
+        now = time.time()
+        return self._update_owned(
+            job, "UPDATE jobs SET status = ?, attempts = 0, lease_owner = NULL, lease_expires_at = NULL,"
+                 " last_success_at = ?, last_error = NULL, available_at = 0, updated_at = ?",
+            (READY, now, now))
+
+    def fail(self, job: Job, error: str) -> str:
+        """
+        Records a failure and schedules a retry, or dead-letters the job.
+
+        Args:
+            job: A job from lease().
+            error: What went wrong.
+
+        Returns:
+            The job's new status, or LOST if the lease had passed to another
+            worker and nothing was recorded.
+        """
+        now = time.time()
+        attempts = job.attempts + 1
+        if attempts >= self.max_attempts:
+            status, available_at = DEAD, 0
+        else:
+            status, available_at = READY, now + self.backoff_seconds * (2 ** (attempts - 1))
+        if not self._update_owned(
+                job, "UPDATE jobs SET status = ?, attempts = ?, available_at = ?, lease_owner = NULL,"
+                     " lease_expires_at = NULL, last_error = ?, updated_at = ?",
+                (status, attempts, available_at, error[:1000], now)):
+            return LOST
+        return status
+
+    def requeue(self, account_id: Optional[str] = None) -> int:
+        """
+        Makes dead-lettered jobs ready again.
+
+        Args:
+            account_id: Only this account; all dead jobs when None.
+
+        Returns:
+            Number of jobs requeued.
+        """
+        sql = "UPDATE jobs SET status = ?, attempts = 0, available_at = 0, updated_at = ? WHERE status = ?"
+        params: tuple = (READY, time.time(), DEAD)
+        if account_id:
+            sql += " AND account_id = ?"
+            params += (account_id,)
+        with self._connect() as conn:
+            return conn.execute(sql, params).rowcount
+
+    def jobs(self) -> List[Dict]:
+        """Returns every job as a dict, most overdue first."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM jobs ORDER BY COALESCE(last_success_at, 0) ASC").fetchall()
+        return [dict(row) for row in rows]
+
+
+def default_worker_id() -> str:
+    """Returns a worker id unique to this host, process and thread."""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def run_job(account) -> None:
+    """
+    Runs the refresh flow for one account.
+
+    Args:
+        account: The accounts.Account to refresh.
+    """
+    from browser_profile import leased_profile_path
+    from run_report import record_run_error
+    from session_snapshot import export_configured_snapshot
+    from utility import cleanup, login_and_refresh, setup_driver
+
+    driver = setup_driver(account.account_id)
+    try:
+        login_and_refresh(driver, account)
+        export_configured_snapshot(driver, account.account_id, leased_profile_path(driver))
+    except Exception as e:
+        record_run_error(driver, e)
+        raise
+    finally:
+        cleanup(driver)
+
+
+def process_job(queue: JobQueue, job: Job, accounts: Dict) -> str:
+    """
+    Runs one leased job, renewing its lease meanwhile, and records the outcome.
+
+    Args:
+        queue: The job queue.
+        job: A job from lease().
+        accounts: Account objects by account id.
+
+    Returns:
+        'succeeded', 'failed', 'dead' or 'lost' (the lease passed to another
+        worker before the outcome was recorded).
+    """
+    account = accounts.get(job.account_id)
+    print(f"📋 [{job.lease_owner}] Leased job for {job.account_id} (attempt {job.attempts + 1})")
+
+    stop_heartbeat = threading.Event()
+
+    def keep_lease():
+        while not stop_heartbeat.wait(queue.lease_seconds / 3):
+            if not queue.heartbeat(job):
+                print(f"⚠️ Lease on {job.account_id} was lost")
+                return
+
+    threading.Thread(target=keep_lease, daemon=True).start()
+    try:
+        if account is None:
+            raise Exception(f"Account {job.account_id} is not configured on this worker")
+        run_job(account)
+        if not queue.complete(job):
+            # The refresh happened, but another worker holds the job now and may run it again
+            print(f"⚠️ Job for {job.account_id} ran, but its lease was lost before it could be recorded")
+            return LOST
+        print(f"✅ Job for {job.account_id} completed")
+        return "succeeded"
+    except Exception as e:
+        status = queue.fail(job, str(e))
+        outcome = {DEAD: "dead-lettered", LOST: "lease lost, not recorded"}.get(status, "will retry")
+        print(f"❌ Job for {job.account_id} failed ({outcome}): {e}")
+        return {DEAD: "dead", LOST: LOST}.get(status, "failed")
+    finally:
+        stop_heartbeat.set()
+
+
+def work(queue: JobQueue, accounts: Dict, worker_id: Optional[str] = None, once: bool = False) -> Dict[str, int]:
+    """
+    Leases and runs due jobs one at a time until none are left.
+
+    Args:
+        queue: The job queue.
+        accounts: Account objects by account id.
+        worker_id: Lease owner; defaults to default_worker_id().
+        once: Stop after one job.
+
+    Returns:
+        Counts of succeeded, failed, dead-lettered and lost jobs.
+    """
+    worker_id = worker_id or default_worker_id()
+    counts = {"succeeded": 0, "failed": 0, "dead": 0, LOST: 0}
+    while True:
+        job = queue.lease(worker_id)
+        if job is None:
+            break
+        counts[process_job(queue, job, accounts)] += 1
+        if once:
+            break
+    return counts
+
+
+def work_autoscaled(queue: JobQueue, accounts: Dict) -> Dict[str, int]:
+    """
+    Runs due jobs concurrently, with the number of browsers set by the autoscaler.
+
+    Args:
+        queue: The job queue.
+        accounts: Account objects by account id.
+
+    Returns:
+        Counts of succeeded, failed, dead-lettered and lost jobs.
+    """
+    from autoscaler import AutoscalingPool
+
+    counts = {"succeeded": 0, "failed": 0, "dead": 0, LOST: 0}
+    counts_lock = threading.Lock()
+    worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+    slot_ids = itertools.count(1)
+
+    def next_task():
+        job = queue.lease(f"{worker_prefix}:slot-{next(slot_ids)}")
+        if job is None:
+            return None
+
+        def run():
+            outcome = process_job(queue, job, accounts)
+            with counts_lock:
+                counts[outcome] += 1
+        return run
+
+    AutoscalingPool().run(next_task)
+    return counts
+
+
+def main() -> int:
+    from dotenv import load_dotenv
+
+    from accounts import load_accounts
+
+    parser = argparse.ArgumentParser(description="Durable refresh job queue")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("sync", help="Add jobs for the configured accounts")
+    work_parser = subparsers.add_parser("work", help="Run due jobs")
+    work_parser.add_argument("--once", action="store_true", help="Stop after one job")
+    work_parser.add_argument("--autoscale", action="store_true",
+                             help="Run jobs concurrently, scaled to the host's free CPU and memory")
+    work_parser.add_argument("--preflight", action="store_true",
+                             help="Leave the jobs due when the preflight probe reports no-go")
+    subparsers.add_parser("status", help="Show every job")
+    requeue_parser = subparsers.add_parser("requeue", help="Retry dead-lettered jobs")
+    requeue_parser.add_argument("account_id", nargs="?")
+    args = parser.parse_args()
+
+    load_dotenv()
+    queue = JobQueue()
+
+    if args.command == "status":
+        now = time.time()
+        for job in queue.jobs():
+            last = f"{(now - job['last_success_at']) / 3600:.1f}h ago" if job["last_success_at"] else "never"
+            print(f"{job['account_id']:<32} {job['status']:<7} attempts={job['attempts']} last success {last}"
+                  + (f" error={job['last_error'][:60]}" if job["last_error"] else ""))
+        return 0
+    if args.command == "requeue":
+        print(f"🔁 Requeued {queue.requeue(args.account_id)} dead jobs")
+        return 0
+
+    accounts = {account.account_id: account for account in load_accounts(os.getenv("RESUME_FILE_PATH"))}
+    if args.command == "sync":
+        print(f"📋 Added {queue.sync(list(accounts))} jobs ({len(accounts)} accounts configured)")
+        return 0
+
+    queue.sync(list(accounts))
+    if args.preflight:
+        from preflight import NO_GO_EXIT_CODE, print_result, run_preflight
+
+        result = run_preflight()
+        print_result(result)
+        if not result["go"]:
+            # Nothing is leased, so the jobs stay due for the next worker run
+            print("⏭️ Skipping this work run")
+            return NO_GO_EXIT_CODE
+    if args.autoscale and not args.once:
+        counts = work_autoscaled(queue, accounts)
+    else:
+        counts = work(queue, accounts, once=args.once)
+    print(f"📊 Jobs: {counts['succeeded']} succeeded, {counts['failed']} failed, {counts['dead']} dead-lettered"
+          + (f", {counts[LOST]} with lost leases" if counts[LOST] else ""))
+    return 0 if not counts["failed"] and not counts["dead"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
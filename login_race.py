@@ -0,0 +1,274 @@
+"""
+Racing login strategies for the Naukri automation.
+
+With a saved session (a restored snapshot or a persistent profile) the flow
+used to validate the session first and only start a fresh login after that
+check failed, so every expired session paid for the check and the login in
+series. In racing mode both start together: the saved session is validated
+in the main tab while a fresh credential login runs in an isolated browser
+context of the same Chrome. The first strategy to reach an authenticated
+page wins and the other is cancelled: the fresh login stops at its next step
+and its context is disposed. When the fresh login wins, its cookies are
+copied into the main tab so the rest of the run continues there.
+
+Only email/password accounts race. An OTP login sends a real code and waits
+for it, and a Google login may prompt on the account's devices, so those
+accounts validate the saved session first and log in only when it fails.
+
+Configuration (environment variables):
+    LOGIN_RACE: true to race saved-session validation against a fresh login (default: false).
+    LOGIN_RACE_LOG: JSON file with per-strategy results
+        (default: ~/.naukri-automation/login_race.json).
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.request
+import weakref
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from cdp_driver import CdpDriver
+from network_policy import apply_network_policy
+from page_readiness import get_page_load_strategy, navigate
+from session_snapshot import settable_cookies
+
+
+SAVED_SESSION = "saved_session"
+FRESH_LOGIN = "fresh_login"
+
+HISTORY_LIMIT = 100
+
+# Login methods that can run speculatively without side effects for the user
+RACEABLE_METHODS = ("email_password",)
+
+# Seconds to wait for a cancelled fresh login's thread after disposing its context
+CANCEL_JOIN_TIMEOUT = 15
+
+_pending: "weakref.WeakKeyDictionary[WebDriver, bool]" = weakref.WeakKeyDictionary()
+
+
+class LoginCancelled(Exception):
+    """Raised inside a fresh login once the race has been decided without it."""
+
+
+def login_race_enabled() -> bool:
+    """Returns whether LOGIN_RACE is enabled."""
+    return os.getenv("LOGIN_RACE", "false").lower() == "true"
+
+
+def mark_race_pending(driver: WebDriver) -> None:
+    """
+    Records that the driver holds an unvalidated saved session to race.
+
+    Args:
+        driver: The webdriver instance.
+    """
+    _pending[driver] = True
+
+
+def race_pending(driver: WebDriver) -> bool:
+    """
+    Returns whether open_naukri() left the saved session for race_login().
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        True if login should go through race_login().
+    """
+    return _pending.get(driver, False)
+
+
+def browser_websocket_url(driver: WebDriver) -> Optional[str]:
+    """
+    Returns the browser-level DevTools endpoint of a running driver.
+
+    Args:
+        driver: A CdpDriver or a Selenium Chrome driver.
+
+    Returns:
+        The websocket URL, or None if the browser doesn't expose one.
+    """
+    if getattr(driver, "websocket_url", None):
+        return driver.websocket_url
+    capabilities = getattr(driver, "capabilities", None) or {}
+    address = (capabilities.get("goog:chromeOptions") or {}).get("debuggerAddress")
+    if not address:
+        return None
+    with urllib.request.urlopen(f"http://{address}/json/version", timeout=5) as response:
+        return json.load(response)["webSocketDebuggerUrl"]
+
+
+def _validate_saved_session(driver: WebDriver) -> bool:
+    apply_network_policy(driver, "profile")
+    navigate(driver, "homepage")
+    return "login" not in driver.current_url.lower()
+
+
+def _fresh_login(websocket_url: str, account, state: Dict, cancelled: threading.Event) -> bool:
+    from utility import login, open_naukri
+
+    host = CdpDriver(websocket_url=websocket_url, page_load_strategy=get_page_load_strategy())
+    state["host"] = host
+    context_id = host.execute_cdp_cmd("Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+    state["context_id"] = context_id
+    driver = CdpDriver(websocket_url=websocket_url, browser_context_id=context_id,
+                       page_load_strategy=get_page_load_strategy())
+    state["driver"] = driver
+    if cancelled.is_set():
+        # Lost before it started; race_login() may already have cleaned up
+        _dispose_fresh_login(state)
+        return False
+    driver.set_page_load_timeout(30)
+    driver.implicitly_wait(10)
+
+    open_naukri(driver, cancelled=cancelled)
+    login(driver, account.login_method, cancelled=cancelled, **account.login_kwargs())
+    return "login" not in driver.current_url.lower()
+
+
+def _dispose_fresh_login(state: Dict) -> None:
+    driver, host = state.get("driver"), state.get("host")
+    if driver:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    if host:
+        if state.get("context_id"):
+            try:
+                host.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": state["context_id"]})
+            except Exception:
+                pass
+        host.quit()
+
+
+def _record_race(result: Dict) -> None:
+    """Appends one race to LOGIN_RACE_LOG and prints per-strategy win rates and latencies."""
+    log_path = os.path.expanduser(os.getenv("LOGIN_RACE_LOG", "~/.naukri-automation/login_race.json"))
+    try:
+        with open(log_path) as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        history = []
+
+    history = (history + [result])[-HISTORY_LIMIT:]
+    try:
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        with open(log_path, "w") as f:
+            json.dump(history, f, indent=2)
+    except OSError as e:
+        print(f"⚠️ Could not write login race log: {e}")
+
+    print(f"🏁 Login race won by {result['winner'] or 'nobody'} after {result['seconds']:.1f}s")
+    for strategy in (SAVED_SESSION, FRESH_LOGIN):
+        latencies: List[float] = sorted(
+            r["latencies"][strategy] for r in history if r["latencies"].get(strategy) is not None)
+        wins = sum(1 for r in history if r["winner"] == strategy)
+        if latencies:
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            print(f"   - {strategy}: won {wins}/{len(history)} races, "
+                  f"median {latencies[len(latencies) // 2]:.1f}s, p95 {p95:.1f}s")
+
+
+def race_login(driver: WebDriver, account, timeout: float = 300) -> str:
+    """
+    Races saved-session validation against a fresh login and keeps the winner.
+
+    Args:
+        driver: A driver left by open_naukri() with race_pending() set.
+        account: The accounts.Account to log in.
+        timeout: Maximum seconds to wait for either strategy.
+
+    Returns:
+        The winning strategy, SAVED_SESSION or FRESH_LOGIN.
+
+    Raises:
+        Exception: If neither strategy produced an authenticated session.
+    """
+    from utility import login
+
+    _pending.pop(driver, None)
+    websocket_url = None
+    try:
+        websocket_url = browser_websocket_url(driver)
+    except Exception as e:
+        print(f"⚠️ Could not reach the browser's DevTools endpoint: {e}")
+
+    start = time.time()
+    latencies: Dict[str, Optional[float]] = {SAVED_SESSION: None, FRESH_LOGIN: None}
+    errors: Dict[str, str] = {}
+    fresh_state: Dict = {}
+    cancelled = threading.Event()
+    winner = None
+
+    def timed(strategy, func, *args):
+        try:
+            return func(*args)
+        finally:
+            latencies[strategy] = time.time() - start
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    futures = {}
+    if account.login_method.lower() not in RACEABLE_METHODS:
+        print(f"🏁 {account.login_method} logins aren't raced - validating saved session first")
+    elif websocket_url:
+        print("🏁 Racing saved session against a fresh login in an isolated context...")
+        futures[executor.submit(timed, FRESH_LOGIN, _fresh_login, websocket_url, account, fresh_state, cancelled)] = FRESH_LOGIN
+    else:
+        print("⚠️ Fresh login cannot run alongside - validating saved session first")
+
+    # The saved session is checked in the main tab, on this thread
+    try:
+        if timed(SAVED_SESSION, _validate_saved_session, driver):
+            winner = SAVED_SESSION
+    except Exception as e:
+        errors[SAVED_SESSION] = str(e)
+
+    if winner is None and futures:
+        print("⚠️ Saved session is no longer valid - waiting for the fresh login")
+        done, _ = wait(futures, timeout=max(0, timeout - (time.time() - start)), return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                if future.result():
+                    winner = FRESH_LOGIN
+            except Exception as e:
+                errors[FRESH_LOGIN] = str(e)
+
+    cancelled.set()
+    if winner == FRESH_LOGIN:
+        cookies = fresh_state["driver"].execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": settable_cookies(cookies)})
+        print(f"🍪 Copied {len(cookies)} cookies from the winning login context")
+    elif winner == SAVED_SESSION and futures:
+        print("✂️ Cancelling the fresh login")
+    _dispose_fresh_login(fresh_state)
+    if futures:
+        # The loser notices the cancellation at its next step or when its disposed context fails
+        _, running = wait(futures, timeout=CANCEL_JOIN_TIMEOUT)
+        if running:
+            print(f"⚠️ Cancelled fresh login still running after {CANCEL_JOIN_TIMEOUT}s, leaving it behind")
+    executor.shutdown(wait=False)
+
+    _record_race({
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "winner": winner,
+        "seconds": time.time() - start,
+        "latencies": latencies if winner != SAVED_SESSION else {SAVED_SESSION: latencies[SAVED_SESSION]},
+        "errors": errors,
+    })
+
+    if winner is None and not futures:
+        # No second context available: fall back to the serial flow
+        navigate(driver, "login")
+        login(driver, account.login_method, **account.login_kwargs())
+        return FRESH_LOGIN
+    if winner is None:
+        raise Exception(f"Login race failed: {errors or 'no strategy authenticated in time'}")
+    return winner
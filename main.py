@@ -5,15 +5,26 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By # Keep By import if used in functions
+import argparse
 import time
 import os
 from dotenv import load_dotenv
 from datetime import datetime
 
-from utility import setup_driver,login,refresh_profile,cleanup
+from utility import open_naukri,login_and_refresh,cleanup
+from bootstrap import run_bootstrap
+from browser_profile import leased_profile_path
+from session_snapshot import export_configured_snapshot
+from profiler import finish_profiling, start_profiling
+from run_report import record_run_error
 
 if __name__ == "__main__":
 
+    parser = argparse.ArgumentParser(description="Refresh the Naukri profile")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the run (cProfile and a Chrome trace) and write a summary to logs/profiles")
+    args = parser.parse_args()
+
     # Load environment variables
     load_dotenv()
     
@@ -36,8 +47,8 @@ if __name__ == "__main__":
         print("✅ Supported methods: google, email_password, otp")
         exit(1)
 
-    # Define resume file path
-    RESUME_FILE_PATH = "/Users/mac/Documents/Job Material/Prakhar_PM_resume.pdf"
+    # Resume to upload (validated, optimised and cached by resume_artifacts)
+    RESUME_FILE_PATH = os.getenv("RESUME_FILE_PATH")
 
     # Check if required environment variables are loaded
     if LOGIN_METHOD == "google" and not EMAIL:
@@ -51,27 +62,31 @@ if __name__ == "__main__":
         exit(1)
     
     if not RESUME_FILE_PATH:
-        print("❌ Error: Resume file path is required")
+        print("❌ Error: RESUME_FILE_PATH is required")
         exit(1)
     
     print(f"🚀 Starting Naukri automation with {LOGIN_METHOD} login method")
     
+    if args.profile:
+        start_profiling()
+    
     try:
-        # Call functions in order
-        driver = setup_driver()
-        
-        # Login with the specified method
-        if LOGIN_METHOD == "google":
-            login(driver, LOGIN_METHOD, email=EMAIL)
-        elif LOGIN_METHOD == "email_password":
-            login(driver, LOGIN_METHOD, email=EMAIL, password=PASSWORD)
-        elif LOGIN_METHOD == "otp":
-            login(driver, LOGIN_METHOD, phone_number=PHONE_NUMBER)
+        # Chromedriver resolution, resume checks and Chrome launch run
+        # concurrently where their dependencies allow
+        bootstrap = run_bootstrap(RESUME_FILE_PATH)
+        account, driver = bootstrap["account"], bootstrap["driver"]
+        open_naukri(driver, bootstrap["snapshot"])
         
-        refresh_profile(driver, RESUME_FILE_PATH)
+        # Login with the specified method (skipped when a restored session is valid)
+        login_and_refresh(driver, account)
+        export_configured_snapshot(driver, account.account_id, leased_profile_path(driver))
         cleanup(driver)
+        finish_profiling()
         
     except Exception as e:
         print(f"❌ Script failed: {e}")
-        cleanup(driver) if 'driver' in locals() else None
+        if 'driver' in locals():
+            record_run_error(driver, e)
+            cleanup(driver)
+        finish_profiling()
         exit(1)
\ No newline at end of file
@@ -82,6 +82,13 @@ check_status() {
     else
         print_error "Environment configuration (.env) not found"
     fi
+    
+    # Show per-account outcomes recorded by metrics.py
+    if [ -x "$SCRIPT_DIR/venv/bin/python" ]; then
+        echo ""
+        print_info "Last runs per account:"
+        (cd "$SCRIPT_DIR" && venv/bin/python metrics.py status)
+    fi
 }
 
 # Function to start automation now
@@ -0,0 +1,356 @@
+"""
+OpenMetrics export of automation runs.
+
+Every finished run report (see run_report.py) is folded into cumulative
+metrics kept in a JSON state file, so counters survive across the separate
+processes cron starts. After each run they are written to a node_exporter
+textfile-collector file (in the Prometheus text format node_exporter parses)
+and can be served in OpenMetrics format by `python metrics.py serve`, which
+also answers /status with a JSON summary per account.
+
+Exported metrics:
+    naukri_runs_total{login_method,outcome}
+    naukri_run_failures_total{login_method,error_class,phase}
+    naukri_captcha_encounters_total{login_method}
+    naukri_retries_total{kind}
+    naukri_phase_duration_seconds{phase} (histogram)
+    naukri_last_run_timestamp_seconds{account}
+    naukri_last_success_timestamp_seconds{account}
+
+Configuration (environment variables):
+    METRICS_STATE_PATH: Cumulative metric state
+        (default: ~/.naukri-automation/metrics.json).
+    METRICS_TEXTFILE: node_exporter textfile path to write after every run,
+        e.g. /var/lib/node_exporter/textfile_collector/naukri.prom (default: unset).
+    METRICS_HTTP_HOST: Address `serve` listens on (default: 127.0.0.1).
+    METRICS_HTTP_PORT: Port `serve` listens on (default: 9464).
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional
+
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Upper bounds in seconds; phases range from a few seconds to several minutes with OTP
+PHASE_BUCKETS = [1, 2.5, 5, 10, 20, 40, 80, 160, 320]
+
+# Run report events counted as retries, by retry kind
+RETRY_EVENTS = {
+    "chrome_start_retry": "chrome_start",
+    "navigation_retry": "navigation",
+    "login_retry": "login",
+}
+
+_state_lock = threading.Lock()
+
+
+def _state_path() -> str:
+    return os.path.expanduser(os.getenv("METRICS_STATE_PATH", "~/.naukri-automation/metrics.json"))
+
+
+@contextmanager
+def _locked_state_file() -> Iterator[None]:
+    # Workers finishing together in separate processes would otherwise lose increments
+    path = _state_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with _state_lock, open(f"{path}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_state() -> Dict:
+    """Returns the cumulative metric state, empty if none has been recorded."""
+    try:
+        with open(_state_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: str, text: str) -> None:
+    # node_exporter may read at any moment, so never expose a half-written file
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _label_key(**labels: str) -> str:
+    return json.dumps(labels, sort_keys=True)
+
+
+def _increment(family: Dict, amount: float = 1, **labels: str) -> None:
+    key = _label_key(**labels)
+    family[key] = family.get(key, 0) + amount
+
+
+def error_class(error: Optional[Dict]) -> str:
+    """
+    Returns a coarse failure class for a run report's error entry.
+
+    The flows mostly raise plain Exceptions, so the message decides where the type can't.
+
+    Args:
+        error: The report's 'error' entry, if any.
+    """
+    if not error:
+        return "unknown"
+    message = error.get("message", "").lower()
+    if error.get("type") == "RefreshNotConfirmed":
+        return "refresh_unconfirmed"
+    if "captcha" in message or "verification" in message:
+        return "captcha"
+    if "access denied" in message:
+        return "access_denied"
+    if "otp" in message:
+        return "otp"
+    if error.get("type") == "TimeoutException" or "timed out" in message or "timeout" in message:
+        return "timeout"
+    if error.get("type", "Exception") != "Exception":
+        return error["type"]
+    if "chrome" in message or "driver" in message:
+        return "browser_start"
+    if "login" in message:
+        return "login"
+    return "other"
+
+
+def record_run_metrics(report: Optional[Dict]) -> None:
+    """
+    Folds a finished run report into the cumulative metrics and rewrites METRICS_TEXTFILE.
+
+    Args:
+        report: A report from run_report.finish_run_report().
+    """
+    if not report:
+        return
+    account = report.get("account_id", "default")
+    login_method = report.get("login_method", "unknown")
+    succeeded = bool(report.get("succeeded"))
+    now = time.time()
+
+    with _locked_state_file():
+        state = load_state()
+        _increment(state.setdefault("runs", {}), login_method=login_method,
+                   outcome="success" if succeeded else "failure")
+        if not succeeded:
+            error = report.get("error")
+            _increment(state.setdefault("failures", {}), login_method=login_method,
+                       error_class=error_class(error), phase=(error or {}).get("phase") or "unknown")
+
+        events = report.get("events", {})
+        if events.get("captcha"):
+            _increment(state.setdefault("captchas", {}), events["captcha"], login_method=login_method)
+        retries = state.setdefault("retries", {})
+        for event, kind in RETRY_EVENTS.items():
+            if events.get(event):
+                _increment(retries, events[event], kind=kind)
+
+        histograms = state.setdefault("phase_durations", {})
+        for phase, seconds in report.get("phases", {}).items():
+            histogram = histograms.setdefault(phase, {"buckets": [0] * len(PHASE_BUCKETS), "count": 0, "sum": 0.0})
+            for i, bound in enumerate(PHASE_BUCKETS):
+                if seconds <= bound:
+                    histogram["buckets"][i] += 1
+            histogram["count"] += 1
+            histogram["sum"] += seconds
+
+        accounts = state.setdefault("accounts", {})
+        entry = accounts.setdefault(account, {})
+        entry["last_run"] = now
+        entry["last_outcome"] = "success" if succeeded else error_class(report.get("error"))
+        if succeeded:
+            entry["last_success"] = now
+
+        try:
+            _write_atomic(_state_path(), json.dumps(state, indent=2))
+        except OSError as e:
+            print(f"⚠️ Could not save metrics state: {e}")
+
+        textfile = os.getenv("METRICS_TEXTFILE")
+        if textfile:
+            try:
+                _write_atomic(textfile, render_openmetrics(state, openmetrics=False))
+            except OSError as e:
+                print(f"⚠️ Could not write metrics textfile: {e}")
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in sorted(labels.items())) + "}"
+
+
+def _counter(lines: List[str], name: str, help_text: str, family: Dict, openmetrics: bool) -> None:
+    # OpenMetrics names the family without the _total suffix, the Prometheus format with it
+    family_name = name if openmetrics else f"{name}_total"
+    lines.append(f"# TYPE {family_name} counter")
+    lines.append(f"# HELP {family_name} {help_text}")
+    for key, value in sorted(family.items()):
+        lines.append(f"{name}_total{_labels(json.loads(key))} {value}")
+
+
+def render_openmetrics(state: Optional[Dict] = None, openmetrics: bool = True) -> str:
+    """
+    Renders the cumulative metrics in OpenMetrics text format.
+
+    Args:
+        state: Metric state; loaded from METRICS_STATE_PATH if not given.
+        openmetrics: False for the Prometheus text format read by the
+            node_exporter textfile collector.
+
+    Returns:
+        The exposition.
+    """
+    state = load_state() if state is None else state
+    lines: List[str] = []
+    _counter(lines, "naukri_runs", "Finished automation runs.", state.get("runs", {}), openmetrics)
+    _counter(lines, "naukri_run_failures", "Failed automation runs by error class and phase.",
+             state.get("failures", {}), openmetrics)
+    _counter(lines, "naukri_captcha_encounters", "CAPTCHA or verification pages met during login.",
+             state.get("captchas", {}), openmetrics)
+    _counter(lines, "naukri_retries", "Retried Chrome starts, navigations and logins.", state.get("retries", {}), openmetrics)
+
+    name = "naukri_phase_duration_seconds"
+    lines.append(f"# TYPE {name} histogram")
+    if openmetrics:
+        lines.append(f"# UNIT {name} seconds")
+    lines.append(f"# HELP {name} Time spent in each phase of a run.")
+    for phase, histogram in sorted(state.get("phase_durations", {}).items()):
+        for bound, count in zip(PHASE_BUCKETS, histogram["buckets"]):
+            lines.append(f"{name}_bucket{_labels({'phase': phase, 'le': str(float(bound))})} {count}")
+        lines.append(f"{name}_bucket{_labels({'phase': phase, 'le': '+Inf'})} {histogram['count']}")
+        lines.append(f"{name}_count{_labels({'phase': phase})} {histogram['count']}")
+        lines.append(f"{name}_sum{_labels({'phase': phase})} {round(histogram['sum'], 3)}")
+
+    accounts = state.get("accounts", {})
+    for name, field, help_text in (
+            ("naukri_last_run_timestamp_seconds", "last_run", "When the account's last run finished."),
+            ("naukri_last_success_timestamp_seconds", "last_success", "When the account was last refreshed.")):
+        lines.append(f"# TYPE {name} gauge")
+        if openmetrics:
+            lines.append(f"# UNIT {name} seconds")
+        lines.append(f"# HELP {name} {help_text}")
+        for account, entry in sorted(accounts.items()):
+            if field in entry:
+                lines.append(f"{name}{_labels({'account': account})} {round(entry[field], 3)}")
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def status_summary(state: Optional[Dict] = None) -> Dict:
+    """
+    Returns the per-account status served at /status.
+
+    Args:
+        state: Metric state; loaded from METRICS_STATE_PATH if not given.
+    """
+    state = load_state() if state is None else state
+    now = time.time()
+    return {
+        account: {
+            "last_outcome": entry.get("last_outcome"),
+            "last_run_age_hours": round((now - entry["last_run"]) / 3600, 2) if "last_run" in entry else None,
+            "last_success_age_hours": round((now - entry["last_success"]) / 3600, 2) if "last_success" in entry else None,
+        }
+        for account, entry in state.get("accounts", {}).items()
+    }
+
+
+def serve(host: Optional[str] = None, port: Optional[int] = None) -> None:
+    """
+    Serves /metrics (OpenMetrics) and /status (JSON) until interrupted.
+
+    Args:
+        host: Listen address (default: METRICS_HTTP_HOST or 127.0.0.1).
+        port: Listen port (default: METRICS_HTTP_PORT or 9464).
+    """
+    host = host or os.getenv("METRICS_HTTP_HOST", "127.0.0.1")
+    port = port or int(os.getenv("METRICS_HTTP_PORT", "9464"))
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/metrics":
+                self._respond(200, CONTENT_TYPE, render_openmetrics())
+            elif path == "/status":
+                self._respond(200, "application/json", json.dumps(status_summary(), indent=2) + "\n")
+            else:
+                self._respond(404, "text/plain", "not found\n")
+
+        def _respond(self, code, content_type, text):
+            body = text.encode()
+            self.send_response(code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"📊 Serving metrics on http://{host}:{port}/metrics and /status")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main() -> int:
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description="OpenMetrics export of automation runs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Serve /metrics and /status over HTTP")
+    serve_parser.add_argument("--host")
+    serve_parser.add_argument("--port", type=int)
+    write_parser = subparsers.add_parser("write", help="Write the textfile-collector file")
+    write_parser.add_argument("path", nargs="?", help="Output path (default: METRICS_TEXTFILE)")
+    subparsers.add_parser("show", help="Print the metrics")
+    subparsers.add_parser("status", help="Print the per-account status")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if args.command == "serve":
+        serve(args.host, args.port)
+    elif args.command == "write":
+        path = args.path or os.getenv("METRICS_TEXTFILE")
+        if not path:
+            print("❌ Give a path or set METRICS_TEXTFILE")
+            return 1
+        _write_atomic(path, render_openmetrics(openmetrics=False))
+        print(f"📊 Metrics written to {path}")
+    elif args.command == "show":
+        sys.stdout.write(render_openmetrics())
+    else:
+        for account, entry in status_summary().items():
+            age = entry["last_success_age_hours"]
+            print(f"{account:<32} last outcome {entry['last_outcome']:<14} "
+                  f"last success {f'{age:.1f}h ago' if age is not None else 'never'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Network resource blocking for the Naukri automation.
+
+Blocks third-party trackers, ads and (optionally) heavy static media through
+CDP Network.setBlockedURLs. Each page type has an allow-list so the login
+form, CAPTCHA/Google OAuth widgets, the profile page and the resume upload
+endpoint keep working. Blocked requests are counted from the CDP event
+stream and summarised at the end of the run.
+
+Configuration (environment variables):
+    NETWORK_BLOCK_PROFILE: off, trackers (default), media or aggressive.
+    NETWORK_BLOCK_EXTRA: Comma-separated extra URL patterns to block.
+"""
+
+import os
+import weakref
+from fnmatch import fnmatchcase
+from typing import Dict, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from cdp_events import drain_events, subscribe
+
+
+# Third-party analytics, ads and session-replay hosts seen on naukri.com
+TRACKER_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googletagservices.com*",
+    "*googlesyndication.com*",
+    "*googleadservices.com*",
+    "*doubleclick.net*",
+    "*adservice.google.*",
+    "*connect.facebook.net*",
+    "*facebook.com/tr*",
+    "*bat.bing.com*",
+    "*clarity.ms*",
+    "*hotjar.com*",
+    "*scorecardresearch.com*",
+    "*quantserve.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*criteo.com*",
+    "*criteo.net*",
+    "*moengage.com*",
+    "*webengage.com*",
+    "*nr-data.net*",
+    "*js-agent.newrelic.com*",
+    "*ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*analytics.twitter.com*",
+]
+
+# Static media that is never needed to drive the flows
+MEDIA_PATTERNS = [
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.webp*",
+    "*.avif*",
+    "*.ico*",
+    "*.mp4*",
+    "*.webm*",
+    "*.mp3*",
+]
+
+FONT_PATTERNS = [
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.eot*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+]
+
+BLOCK_PROFILES: Dict[str, List[str]] = {
+    "off": [],
+    "trackers": TRACKER_PATTERNS,
+    "media": TRACKER_PATTERNS + MEDIA_PATTERNS,
+    "aggressive": TRACKER_PATTERNS + MEDIA_PATTERNS + FONT_PATTERNS + ["*.svg*"],
+}
+
+# URLs that must keep loading on each page type. Any block pattern matching
+# one of these is dropped from the blocked list for that page.
+PAGE_ALLOW_LISTS: Dict[str, List[str]] = {
+    "home": [
+        "https://www.naukri.com/",
+    ],
+    "login": [
+        "https://www.naukri.com/nlogin/login",
+        "https://www.google.com/recaptcha/api.js",
+        "https://www.gstatic.com/recaptcha/releases/captcha.png",
+        "https://www.naukri.com/central-login-services/v1/captcha.png",
+        "https://accounts.google.com/gsi/client",
+        "https://apis.google.com/js/platform.js",
+    ],
+    "profile": [
+        "https://www.naukri.com/mnjuser/profile",
+        "https://www.naukri.com/cloudgateway-mynaukri/resman-aggregator-services/v2/users/self",
+    ],
+    "upload": [
+        "https://filevalidation.naukri.com/file",
+        "https://www.naukri.com/cloudgateway-mynaukri/resman-aggregator-services/v0/users/self/profiles/resume.pdf",
+    ],
+}
+
+# Typical transfer sizes per CDP resource type, used to estimate bytes saved
+# because blocked requests never report a size.
+ESTIMATED_BYTES_BY_TYPE = {
+    "Image": 25_000,
+    "Media": 250_000,
+    "Font": 40_000,
+    "Script": 60_000,
+    "Stylesheet": 20_000,
+    "XHR": 2_000,
+    "Fetch": 2_000,
+    "Ping": 500,
+    "Other": 5_000,
+}
+
+
+class NetworkPolicyStats:
+    """Counts requests blocked by the policy from the CDP event stream."""
+
+    def __init__(self):
+        self.request_types: Dict[str, str] = {}
+        self.blocked_by_type: Dict[str, int] = {}
+        self.blocked_requests = 0
+        self.estimated_bytes_saved = 0
+
+    def on_event(self, method: str, params: dict) -> None:
+        if method == "Network.requestWillBeSent":
+            self.request_types[params.get("requestId", "")] = params.get("type", "Other")
+        elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+            resource_type = params.get("type") or self.request_types.get(params.get("requestId", ""), "Other")
+            self.blocked_requests += 1
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+            self.estimated_bytes_saved += ESTIMATED_BYTES_BY_TYPE.get(resource_type, ESTIMATED_BYTES_BY_TYPE["Other"])
+
+
+_stats: "weakref.WeakKeyDictionary[WebDriver, NetworkPolicyStats]" = weakref.WeakKeyDictionary()
+
+
+def get_block_patterns() -> List[str]:
+    """
+    Returns the configured block patterns before page allow-lists are applied.
+
+    Returns:
+        List of URL wildcard patterns.
+    """
+    profile = os.getenv("NETWORK_BLOCK_PROFILE", "trackers").lower()
+    if profile not in BLOCK_PROFILES:
+        print(f"⚠️ Unknown NETWORK_BLOCK_PROFILE '{profile}', using 'trackers'")
+        profile = "trackers"
+
+    patterns = list(BLOCK_PROFILES[profile])
+    extra = os.getenv("NETWORK_BLOCK_EXTRA", "")
+    patterns.extend(p.strip() for p in extra.split(",") if p.strip())
+    return patterns
+
+
+def patterns_for_page(page_type: str) -> List[str]:
+    """
+    Returns the block patterns for a page type with its allow-list applied.
+
+    Args:
+        page_type: One of the PAGE_ALLOW_LISTS keys.
+
+    Returns:
+        Block patterns that do not match any allowed URL for that page.
+    """
+    allowed = PAGE_ALLOW_LISTS.get(page_type, [])
+    return [
+        pattern for pattern in get_block_patterns()
+        if not any(fnmatchcase(url, pattern) for url in allowed)
+    ]
+
+
+def apply_network_policy(driver: WebDriver, page_type: str) -> None:
+    """
+    Applies the blocking policy for the page that is about to be loaded.
+
+    Args:
+        driver: The webdriver instance.
+        page_type: The kind of page being navigated to ('home', 'login',
+            'profile' or 'upload').
+    """
+    patterns = patterns_for_page(page_type)
+
+    if driver not in _stats:
+        _stats[driver] = NetworkPolicyStats()
+        subscribe(driver, _stats[driver].on_event)
+    else:
+        # Attribute events from the previous page before switching policies
+        drain_events(driver)
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        print(f"🚧 Network policy for '{page_type}' page: blocking {len(patterns)} URL patterns")
+    except Exception as e:
+        print(f"⚠️ Could not apply network policy: {e}")
+
+
+def report_network_savings(driver: WebDriver) -> Dict:
+    """
+    Prints and returns the blocked request totals for this driver's run.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        Dict with blocked_requests, estimated_bytes_saved and blocked_by_type.
+    """
+    stats = _stats.pop(driver, None)
+    if stats is None:
+        return {}
+
+    drain_events(driver)
+    summary = {
+        "blocked_requests": stats.blocked_requests,
+        "estimated_bytes_saved": stats.estimated_bytes_saved,
+        "blocked_by_type": dict(stats.blocked_by_type),
+    }
+    print(f"🚧 Blocked {stats.blocked_requests} requests "
+          f"(~{stats.estimated_bytes_saved / 1024:.0f} KB saved, estimated)")
+    for resource_type, count in sorted(stats.blocked_by_type.items()):
+        print(f"   - {resource_type}: {count}")
+    return summary
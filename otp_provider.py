@@ -0,0 +1,336 @@
+"""
+Non-blocking OTP sources for the Naukri automation.
+
+login_with_otp() used to wait on input(), which needs a human at a terminal
+and holds up every other account in a multi-account run. An OtpProvider
+hands out a Future per account when the code is requested; the code arrives
+from one of the sources below and the login fills the OTP field itself. Each
+wait blocks only the thread of the account that asked, so accounts running
+in other threads keep going.
+
+Sources:
+    manual:      The old behaviour - enter the code in the browser and press Enter.
+    file:        Write the code to <OTP_DROP_DIR>/<account_id>.otp (a plain
+                 file or a FIFO created with mkfifo).
+    http:        POST the code to http://<OTP_HTTP_HOST>:<OTP_HTTP_PORT>/otp/<account_id>
+                 (plain text, {"code": "..."} or ?code=...).
+    sms_webhook: Point an SMS-forwarder app at http://<host>:<port>/sms; the
+                 code is extracted from the message text and routed by the
+                 recipient number, or to the only account waiting.
+
+Configuration (environment variables):
+    OTP_PROVIDER: manual (default), file, http or sms_webhook.
+    OTP_TIMEOUT: Seconds to wait for a code (default: 300).
+    OTP_DROP_DIR: Directory watched by the file source (default: ~/.naukri-automation/otp).
+    OTP_HTTP_HOST / OTP_HTTP_PORT: Address of the http and sms_webhook
+        receivers (default: 127.0.0.1:8765).
+"""
+
+import json
+import os
+import re
+import select
+import stat
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+SUPPORTED_PROVIDERS = ("manual", "file", "http", "sms_webhook")
+
+OTP_CODE_PATTERN = re.compile(r"(?<!\d)(\d{4,8})(?!\d)")
+
+
+class OtpProvider:
+    """Hands out a Future per account that resolves to its OTP code."""
+
+    def __init__(self):
+        self._waiters: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def request_code(self, account_id: str) -> Future:
+        """
+        Registers interest in an account's next code. Call before the OTP is sent.
+
+        Args:
+            account_id: The account waiting for a code.
+
+        Returns:
+            A Future that resolves to the code, or to None if it was entered by hand.
+        """
+        future = Future()
+        with self._lock:
+            self._waiters[account_id] = future
+        future.add_done_callback(lambda f: self._forget(account_id, f))
+        return future
+
+    def deliver(self, account_id: Optional[str], code: str) -> bool:
+        """
+        Resolves the waiting Future for an account.
+
+        Args:
+            account_id: The account the code belongs to; None routes it to the
+                only account waiting, if there is exactly one.
+            code: The OTP code.
+
+        Returns:
+            True if an account was waiting for it.
+        """
+        with self._lock:
+            if account_id is None and len(self._waiters) == 1:
+                account_id = next(iter(self._waiters))
+            future = self._waiters.get(account_id)
+        if future is None or future.done():
+            return False
+        future.set_result(code)
+        print(f"🔑 OTP received for {account_id}")
+        return True
+
+    def _forget(self, account_id: str, future: Future) -> None:
+        with self._lock:
+            if self._waiters.get(account_id) is future:
+                del self._waiters[account_id]
+
+    def wait_for_code(self, future: Future, timeout: float) -> Optional[str]:
+        """
+        Waits for a requested code.
+
+        Args:
+            future: The Future from request_code().
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            The code, or None if it was entered in the browser by hand.
+
+        Raises:
+            TimeoutError: If no code arrived in time.
+        """
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            raise TimeoutError(f"No OTP received within {timeout:.0f}s")
+
+
+class ManualOtpProvider(OtpProvider):
+    """Waits for a person to type the code in the browser and press Enter."""
+
+    _prompt_lock = threading.Lock()
+
+    def wait_for_code(self, future: Future, timeout: float) -> Optional[str]:
+        # One prompt at a time, so concurrent accounts don't share a terminal line
+        with self._prompt_lock:
+            print("⏳ Please enter the OTP received on your phone...")
+            input("Press Enter after entering the OTP in the browser...")
+        future.cancel()
+        return None
+
+
+class FileOtpProvider(OtpProvider):
+    """Picks codes up from <drop_dir>/<account_id>.otp files or FIFOs."""
+
+    def __init__(self, drop_dir: str, poll_interval: float = 0.5):
+        super().__init__()
+        self.drop_dir = os.path.expanduser(drop_dir)
+        self.poll_interval = poll_interval
+        os.makedirs(self.drop_dir, exist_ok=True)
+
+    def request_code(self, account_id: str) -> Future:
+        future = super().request_code(account_id)
+        path = os.path.join(self.drop_dir, f"{account_id}.otp")
+        # A code left over from an earlier attempt is stale
+        if os.path.isfile(path):
+            os.remove(path)
+        threading.Thread(target=self._watch, args=(account_id, path, future), daemon=True).start()
+        print(f"📂 Waiting for OTP in {path}")
+        return future
+
+    def _read(self, path: str) -> Optional[str]:
+        try:
+            with open(path) as f:
+                content = f.read()
+            os.remove(path)
+        except OSError:
+            return None
+        match = OTP_CODE_PATTERN.search(content)
+        return match.group(1) if match else None
+
+    def _watch_fifo(self, account_id: str, path: str, future: Future) -> None:
+        # One reader for the whole wait, so a write can't land between polls with no reader
+        # (the writer would get EPIPE); our own idle writer keeps select() from reporting EOF
+        reader = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        writer = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        buffer = ""
+        try:
+            while not future.done():
+                readable, _, _ = select.select([reader], [], [], self.poll_interval)
+                if not readable:
+                    continue
+                try:
+                    buffer += os.read(reader, 4096).decode("utf-8", "replace")
+                except BlockingIOError:
+                    continue
+                match = OTP_CODE_PATTERN.search(buffer)
+                if match:
+                    self.deliver(account_id, match.group(1))
+                    return
+        finally:
+            os.close(writer)
+            os.close(reader)
+
+    def _watch(self, account_id: str, path: str, future: Future) -> None:
+        while not future.done():
+            if os.path.exists(path):
+                if stat.S_ISFIFO(os.stat(path).st_mode):
+                    try:
+                        self._watch_fifo(account_id, path, future)
+                    except OSError as e:
+                        print(f"⚠️ Could not read OTP FIFO {path}: {e}")
+                    return
+                code = self._read(path)
+                if code:
+                    self.deliver(account_id, code)
+                    return
+            time.sleep(self.poll_interval)
+
+
+class HttpOtpProvider(OtpProvider):
+    """Local HTTP receiver: POST /otp/<account_id> with the code."""
+
+    def __init__(self, host: str, port: int):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self._server = None
+        self._server_lock = threading.Lock()
+
+    def request_code(self, account_id: str) -> Future:
+        self._ensure_server()
+        print(f"🌐 Waiting for OTP at http://{self.host}:{self.port}/otp/{account_id}")
+        return super().request_code(account_id)
+
+    def _ensure_server(self) -> None:
+        with self._server_lock:
+            if self._server:
+                return
+            provider = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    self._respond(provider.handle(self.path, b""))
+
+                def do_POST(self):
+                    length = int(self.headers.get("Content-Length") or 0)
+                    self._respond(provider.handle(self.path, self.rfile.read(length)))
+
+                def _respond(self, accepted: bool):
+                    self.send_response(200 if accepted else 404)
+                    self.end_headers()
+                    self.wfile.write(b"ok\n" if accepted else b"no account waiting\n")
+
+                def log_message(self, format, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def handle(self, path: str, body: bytes) -> bool:
+        """
+        Handles one request to the receiver.
+
+        Args:
+            path: Request path and query string.
+            body: Request body.
+
+        Returns:
+            True if the code was delivered to a waiting account.
+        """
+        parsed = urlparse(path)
+        parts = [p for p in parsed.path.split("/") if p]
+        if len(parts) != 2 or parts[0] != "otp":
+            return False
+        text = parse_qs(parsed.query).get("code", [""])[0] or body.decode("utf-8", "replace")
+        try:
+            text = str(json.loads(text).get("code", ""))
+        except (ValueError, AttributeError):
+            pass
+        match = OTP_CODE_PATTERN.search(text)
+        return bool(match) and self.deliver(parts[1], match.group(1))
+
+    def shutdown(self) -> None:
+        with self._server_lock:
+            if self._server:
+                self._server.shutdown()
+                self._server.server_close()
+                self._server = None
+
+
+class SmsWebhookOtpProvider(HttpOtpProvider):
+    """
+    Stand-in for an SMS-forwarder webhook: POST /sms with the forwarded message.
+
+    Accepts JSON or form bodies with the message in 'text', 'message' or
+    'body' and the recipient in 'to' or 'recipient'. The recipient is matched
+    against account ids derived from phone numbers.
+    """
+
+    def handle(self, path: str, body: bytes) -> bool:
+        if urlparse(path).path.rstrip("/") != "/sms":
+            return super().handle(path, body)
+        raw = body.decode("utf-8", "replace")
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            payload = {k: v[0] for k, v in parse_qs(raw).items()}
+        if not isinstance(payload, dict):
+            return False
+
+        message = str(payload.get("text") or payload.get("message") or payload.get("body") or "")
+        match = OTP_CODE_PATTERN.search(message)
+        if not match:
+            return False
+        recipient = payload.get("to") or payload.get("recipient")
+        account_id = re.sub(r"[^a-z0-9]+", "_", str(recipient).lower()).strip("_") if recipient else None
+        if account_id and self.deliver(account_id, match.group(1)):
+            return True
+        # Forwarders often omit or reformat the recipient
+        return self.deliver(None, match.group(1))
+
+
+_provider: Optional[OtpProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_otp_provider() -> OtpProvider:
+    """
+    Returns the process-wide provider selected by OTP_PROVIDER.
+
+    Returns:
+        The shared OtpProvider, so concurrent accounts use one receiver.
+    """
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            name = os.getenv("OTP_PROVIDER", "manual").lower()
+            if name not in SUPPORTED_PROVIDERS:
+                print(f"⚠️ Unknown OTP_PROVIDER '{name}', using 'manual'")
+                name = "manual"
+            host = os.getenv("OTP_HTTP_HOST", "127.0.0.1")
+            port = int(os.getenv("OTP_HTTP_PORT", "8765"))
+            if name == "file":
+                _provider = FileOtpProvider(os.getenv("OTP_DROP_DIR", "~/.naukri-automation/otp"))
+            elif name == "http":
+                _provider = HttpOtpProvider(host, port)
+            elif name == "sms_webhook":
+                _provider = SmsWebhookOtpProvider(host, port)
+            else:
+                _provider = ManualOtpProvider()
+        return _provider
+
+
+def get_otp_timeout() -> float:
+    """Returns OTP_TIMEOUT in seconds."""
+    return float(os.getenv("OTP_TIMEOUT", "300"))
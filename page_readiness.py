@@ -0,0 +1,365 @@
+"""
+Page-load strategy and per-page readiness contracts for the Naukri automation.
+
+With Selenium's default 'normal' strategy every driver.get() blocks until the
+load event, long after the elements the flows need are usable. This module
+switches Chrome to the 'eager' (or 'none') strategy and pairs it with a
+readiness contract per known page: the URL patterns and elements that mean
+the page is ready. navigate() returns as soon as the contract is met and
+records how long the full load event would have taken on top of that.
+
+Configuration (environment variables):
+    PAGE_LOAD_STRATEGY: normal, eager (default) or none.
+"""
+
+import os
+import re
+import time
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from page_replay import capture_page
+from stealth import INJECTION_TIMINGS_EXPRESSION, record_injection_timings
+
+
+SUPPORTED_STRATEGIES = ("normal", "eager", "none")
+
+PAGE_URLS = {
+    "home": "https://www.naukri.com/",
+    "login": "https://www.naukri.com/nlogin/login",
+    "profile": "https://www.naukri.com/mnjuser/profile",
+    "homepage": "https://www.naukri.com/mnjuser/homepage",
+    "dashboard": "https://www.naukri.com/mnjuser/dashboard",
+}
+
+
+class ReadinessContract:
+    """
+    The minimal conditions under which a page counts as ready.
+
+    A page is ready when the current URL matches one of url_patterns and at
+    least one of the selectors is present, or as soon as the URL matches one
+    of redirect_patterns or the title contains one of blocked_titles (the
+    navigation settled somewhere else and the caller has to handle it).
+    """
+
+    def __init__(self, url_patterns: List[str], selectors: List[Tuple[str, str]],
+                 redirect_patterns: Optional[List[str]] = None,
+                 blocked_titles: Optional[List[str]] = None):
+        self.url_patterns = url_patterns
+        self.selectors = selectors
+        self.redirect_patterns = redirect_patterns or []
+        self.blocked_titles = blocked_titles or ["Access Denied"]
+
+
+READINESS_CONTRACTS: Dict[str, ReadinessContract] = {
+    "home": ReadinessContract(
+        url_patterns=[r"naukri\.com/?(\?.*)?$"],
+        selectors=[
+            (By.CSS_SELECTOR, "a[href*='login']"),
+            (By.CSS_SELECTOR, "#login_Layer"),
+            (By.XPATH, "//a[contains(text(), 'Login')]"),
+        ],
+    ),
+    "login": ReadinessContract(
+        url_patterns=[r"/nlogin/login"],
+        selectors=[
+            (By.CSS_SELECTOR, "input[type='password']"),
+            (By.CSS_SELECTOR, "input[type='text']"),
+            (By.CSS_SELECTOR, "input[type='tel']"),
+        ],
+        redirect_patterns=[r"/mnjuser/"],
+    ),
+    "profile": ReadinessContract(
+        url_patterns=[r"/mnjuser/profile"],
+        selectors=[
+            (By.CSS_SELECTOR, "input[type='file']"),
+            (By.XPATH, "//*[contains(@class, 'profile')]"),
+        ],
+        redirect_patterns=[r"login", r"signin"],
+    ),
+    "homepage": ReadinessContract(
+        url_patterns=[r"/mnjuser/homepage"],
+        selectors=[
+            (By.CSS_SELECTOR, "a[href*='mnjuser']"),
+            (By.XPATH, "//*[contains(@class, 'user')]"),
+        ],
+        redirect_patterns=[r"login", r"signin"],
+    ),
+    "dashboard": ReadinessContract(
+        url_patterns=[r"/mnjuser/dashboard"],
+        selectors=[
+            (By.CSS_SELECTOR, "a[href*='mnjuser']"),
+        ],
+        redirect_patterns=[r"login", r"signin", r"/mnjuser/homepage"],
+    ),
+}
+
+# Evaluates a contract in a single round-trip: returns the URL, title,
+# whether any selector matched and performance.now() at the time of the check.
+_CONTRACT_CHECK_SCRIPT = """
+const selectors = arguments[0];
+let found = false;
+for (const s of selectors) {
+    try {
+        if (s.xpath) {
+            const r = document.evaluate(s.xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+            if (r.singleNodeValue) { found = true; break; }
+        } else if (document.querySelector(s.css)) {
+            found = true; break;
+        }
+    } catch (e) {}
+}
+return {url: location.href, title: document.title, found: found,
+        readyState: document.readyState, now: performance.now(), origin: performance.timeOrigin};
+"""
+
+_LOAD_EVENT_SCRIPT = f"""
+const nav = performance.getEntriesByType('navigation')[0];
+return {{loadEventEnd: nav ? nav.loadEventEnd : 0, now: performance.now(), origin: performance.timeOrigin,
+         injections: {INJECTION_TIMINGS_EXPRESSION}}};
+"""
+
+# Per-driver navigation records: pending entry for the current page plus
+# completed entries with the measured savings.
+_navigations: "weakref.WeakKeyDictionary[WebDriver, Dict]" = weakref.WeakKeyDictionary()
+
+
+def get_page_load_strategy() -> str:
+    """
+    Returns the configured Selenium page-load strategy.
+
+    Returns:
+        One of 'normal', 'eager' or 'none'.
+    """
+    strategy = os.getenv("PAGE_LOAD_STRATEGY", "eager").lower()
+    if strategy not in SUPPORTED_STRATEGIES:
+        print(f"⚠️ Unknown PAGE_LOAD_STRATEGY '{strategy}', using 'eager'")
+        strategy = "eager"
+    return strategy
+
+
+def _selector_payload(selectors: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+    payload = []
+    for by, value in selectors:
+        if by == By.XPATH:
+            payload.append({"xpath": value})
+        elif by == By.CSS_SELECTOR:
+            payload.append({"css": value})
+        elif by == By.ID:
+            payload.append({"css": f"#{value}"})
+        elif by == By.NAME:
+            payload.append({"css": f"[name='{value}']"})
+        elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            payload.append({"xpath": f"//a[contains(text(), '{value}')]"})
+    return payload
+
+
+def _is_ready(state: Dict, contract: Optional[ReadinessContract]) -> bool:
+    if contract is None:
+        return state.get("readyState") in ("interactive", "complete")
+    title = state.get("title") or ""
+    url = state.get("url") or ""
+    if any(blocked in title for blocked in contract.blocked_titles):
+        return True
+    if any(re.search(pattern, url) for pattern in contract.redirect_patterns):
+        return True
+    return state.get("found") and any(re.search(pattern, url) for pattern in contract.url_patterns)
+
+
+def _settle_previous_navigation(driver: WebDriver) -> None:
+    """Measures the load event of the page we are about to leave."""
+    record = _navigations.get(driver)
+    if not record or not record.get("pending"):
+        return
+
+    pending = record.pop("pending")
+    try:
+        timing = driver.execute_script(_LOAD_EVENT_SCRIPT)
+    except Exception:
+        return
+
+    record_injection_timings(driver, timing.get("injections"))
+    # A click-driven navigation since then replaced the document; its clock has a different origin
+    if timing.get("origin") != pending["origin"]:
+        return
+    load_event_end = timing.get("loadEventEnd") or 0
+    if load_event_end > 0:
+        saved_ms = max(0.0, load_event_end - pending["ready_ms"])
+        complete = True
+    else:
+        # Still loading when we moved on: the saving is at least this much
+        saved_ms = max(0.0, timing.get("now", 0) - pending["ready_ms"])
+        complete = False
+
+    record["completed"].append({
+        "page": pending["page"],
+        "ready_seconds": pending["ready_seconds"],
+        "saved_seconds": saved_ms / 1000.0,
+        "load_event_observed": complete,
+    })
+
+
+def navigate(driver: WebDriver, page: Optional[str], url: Optional[str] = None, timeout: float = 30) -> float:
+    """
+    Navigates to a page and returns as soon as its readiness contract is met.
+
+    Args:
+        driver: The webdriver instance.
+        page: A READINESS_CONTRACTS key, or None to only wait for the DOM.
+        url: URL to load; defaults to PAGE_URLS[page].
+        timeout: Maximum seconds to wait for the contract.
+
+    Returns:
+        Seconds from the start of navigation until the page was ready.
+    """
+    target_url = url or PAGE_URLS[page]
+    contract = READINESS_CONTRACTS.get(page) if page else None
+    selectors = _selector_payload(contract.selectors) if contract else []
+
+    _settle_previous_navigation(driver)
+
+    start = time.time()
+    driver.get(target_url)
+
+    state = {}
+    while time.time() - start < timeout:
+        try:
+            state = driver.execute_script(_CONTRACT_CHECK_SCRIPT, selectors) or {}
+        except Exception:
+            state = {}
+        if _is_ready(state, contract):
+            break
+        time.sleep(0.25)
+    else:
+        print(f"⚠️ Readiness contract for '{page or target_url}' not met within {timeout}s")
+
+    elapsed = time.time() - start
+    record = _navigations.setdefault(driver, {"completed": []})
+    if state.get("now") is not None:
+        record["pending"] = {"page": page or target_url, "ready_seconds": elapsed, "ready_ms": state["now"],
+                             "origin": state.get("origin")}
+    print(f"⚡ '{page or target_url}' ready after {elapsed:.1f}s")
+    capture_page(driver, page or "page")
+    return elapsed
+
+
+def _probe_outcome(state: Dict, contract: ReadinessContract) -> Optional[bool]:
+    """True when a probe tab is authenticated, False when it was bounced, None while loading."""
+    url = (state.get("url") or "").lower()
+    title = state.get("title") or ""
+    if "login" in url or "signin" in url or any(blocked in title for blocked in contract.blocked_titles):
+        return False
+    if "/mnjuser/" not in url:
+        return None
+    if state.get("found") or state.get("readyState") == "complete":
+        return True
+    return None
+
+
+def probe_pages(driver: WebDriver, pages: List[str], timeout: float = 30,
+                prepare_tab: Optional[Callable[[WebDriver], None]] = None) -> Optional[str]:
+    """
+    Loads several authenticated pages in parallel tabs and keeps the first that works.
+
+    Each page gets its own tab in the same session (and browser context) and
+    all of them load at once. The most preferred tab to reach an authenticated
+    page becomes the current window and every other tab, including the one
+    the driver started in, is closed. If none succeeds the probe tabs are closed and the driver is left
+    on its original tab.
+
+    Args:
+        driver: The webdriver instance.
+        pages: READINESS_CONTRACTS keys to try, most preferred first, e.g.
+            ['profile', 'homepage', 'dashboard'].
+        timeout: Maximum seconds to wait for any tab.
+        prepare_tab: Called after switching to each new tab and before it
+            loads, to apply per-tab setup such as injection bundles.
+
+    Returns:
+        The page that loaded authenticated, or None.
+    """
+    _settle_previous_navigation(driver)
+    original = driver.current_window_handle
+    tabs: Dict[str, str] = {}
+    start = time.time()
+
+    for page in pages:
+        try:
+            driver.switch_to.new_window("tab")
+            if prepare_tab:
+                prepare_tab(driver)
+            # Assigning location returns immediately, unlike driver.get()
+            driver.execute_script("window.location.href = arguments[0];", PAGE_URLS[page])
+            tabs[driver.current_window_handle] = page
+        except Exception as e:
+            print(f"⚠️ Could not open probe tab for '{page}': {e}")
+    print(f"🔀 Probing {len(tabs)} pages in parallel tabs: {', '.join(tabs.values())}")
+
+    # Pages are in order of preference: a later page that authenticates first only
+    # wins once every earlier page has been redirected away or the timeout passes
+    order = {handle: pages.index(page) for handle, page in tabs.items()}
+    winner = None
+    live = dict(tabs)
+    authenticated = set()
+    while live and time.time() - start < timeout:
+        for handle, page in list(live.items()):
+            contract = READINESS_CONTRACTS[page]
+            try:
+                driver.switch_to.window(handle)
+                state = driver.execute_script(_CONTRACT_CHECK_SCRIPT, _selector_payload(contract.selectors)) or {}
+            except Exception:
+                continue
+            outcome = _probe_outcome(state, contract)
+            if outcome:
+                authenticated.add(handle)
+                del live[handle]
+            elif outcome is False:
+                print(f"⚠️ '{page}' redirected to {state.get('url')}")
+                del live[handle]
+        best = min(authenticated, key=order.get, default=None)
+        if best and all(order[handle] > order[best] for handle in live):
+            break
+        time.sleep(0.25)
+    winner = min(authenticated, key=order.get, default=None)
+
+    keep = winner or original
+    for handle in [original] + list(tabs):
+        if handle == keep:
+            continue
+        try:
+            driver.switch_to.window(handle)
+            driver.close()
+        except Exception:
+            pass
+    driver.switch_to.window(keep)
+
+    if winner is None:
+        print(f"❌ No probed page was authenticated after {time.time() - start:.1f}s")
+        return None
+    print(f"🎯 '{tabs[winner]}' authenticated after {time.time() - start:.1f}s")
+    return tabs[winner]
+
+
+def report_page_load_savings(driver: WebDriver) -> Dict:
+    """
+    Prints and returns how much time readiness contracts saved this run.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        Dict with total_saved_seconds and per-navigation entries.
+    """
+    _settle_previous_navigation(driver)
+    record = _navigations.pop(driver, None)
+    if not record or not record["completed"]:
+        return {}
+
+    total_saved = sum(entry["saved_seconds"] for entry in record["completed"])
+    print(f"⚡ Readiness contracts saved ~{total_saved:.1f}s against full page loads "
+          f"({len(record['completed'])} navigations)")
+    return {"total_saved_seconds": total_saved, "navigations": record["completed"]}
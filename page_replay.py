@@ -0,0 +1,503 @@
+"""
+Record-and-replay of real Naukri pages for offline benchmarking.
+
+Naukri serves several variants of the same pages (OTP tab first, password
+tab, CAPTCHA, malformed `URL=//` redirects) and the flows' fallback selectors
+exist for them, but the variants can't be produced on demand. With
+RECORD_PAGES enabled a real run records:
+
+    pages/NN-<label>.html  a sanitised DOM snapshot of every page visited
+                           and of every variant the flows detect
+    bodies/<sha1>          sanitised bodies of documents, scripts, styles and XHRs
+    recording.har          HAR 1.2 log of the run's requests; log.pages lists
+                           the snapshots
+
+`python page_replay.py serve <recording>` serves a recording back
+deterministically: a page request gets its snapshot (scripts removed, so the
+DOM is what the flows saw), any other recorded request its recorded body, and
+anything unrecorded a 404. Runs started with REPLAY_ADDRESS pointing at the
+server resolve naukri.com and naukimg.com to it and every other host to
+nothing, so login and refresh can be timed and regression-tested offline
+(e.g. `python main.py --profile`). Logins can't succeed against a recording;
+the flows see the recorded pages and markup, not Naukri's backend.
+
+Sanitising removes cookies and authorization headers, form values and POST
+bodies, masks e-mail addresses, phone numbers, the configured credentials and
+token-like query parameters. Profile pages still show the account's name and
+career details; review a recording before sharing it.
+
+Configuration (environment variables):
+    RECORD_PAGES: true to record the run (default: false).
+    RECORDINGS_DIR: Where recordings are written (default: recordings).
+    REPLAY_ADDRESS: host:port of a running replay server to use instead of
+        the live site (default: unset).
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import ssl
+import subprocess
+import sys
+import time
+import weakref
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from cdp_events import drain_events, subscribe
+
+
+# Hosts served from a recording; everything else is unreachable during replay
+REPLAY_HOSTS = ("naukri.com", "*.naukri.com", "*.naukimg.com")
+
+# Resource types whose bodies are recorded
+BODY_TYPES = ("Document", "Script", "Stylesheet", "XHR", "Fetch")
+MAX_BODY_BYTES = 2 * 1024 * 1024
+
+DROPPED_HEADERS = ("cookie", "set-cookie", "authorization", "proxy-authorization")
+# Headers whose value is a URL; redirect targets can carry tokens and OTPs in the query
+URL_HEADERS = ("location", "content-location", "referer")
+SENSITIVE_KEY = re.compile(r"token|otp|pass|email|mobile|phone|auth|session|key|secret", re.IGNORECASE)
+EMAIL = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+PHONE = re.compile(r"(?<![\d.])(?:\+?91[\s-]?)?[6-9]\d{9}(?![\d.])")
+
+# Clones the document without scripts, form values or event handlers and returns its HTML
+_SNAPSHOT_SCRIPT = """
+const root = document.documentElement.cloneNode(true);
+root.querySelectorAll('script, noscript').forEach(el => el.remove());
+root.querySelectorAll('input, textarea').forEach(el => {
+    if (!['button', 'submit', 'reset', 'checkbox', 'radio'].includes((el.type || '').toLowerCase())) {
+        el.removeAttribute('value');
+        el.textContent = '';
+    }
+});
+root.querySelectorAll('*').forEach(el => {
+    for (const attr of Array.from(el.attributes)) {
+        if (attr.name.startsWith('on')) el.removeAttribute(attr.name);
+    }
+});
+return '<!DOCTYPE html>\\n' + root.outerHTML;
+"""
+
+
+def recording_enabled() -> bool:
+    """Returns whether RECORD_PAGES is enabled."""
+    return os.getenv("RECORD_PAGES", "false").lower() in ("1", "true", "yes")
+
+
+def _secrets() -> List[str]:
+    names = ("NAUKRI_EMAIL", "NAUKRI_PASSWORD", "GOOGLE_EMAIL", "PHONE_NUMBER")
+    return [value for value in (os.getenv(name) for name in names) if value and len(value) > 3]
+
+
+def sanitize_text(text: str) -> str:
+    """
+    Masks credentials, e-mail addresses and phone numbers in recorded text.
+
+    Args:
+        text: HTML, JSON or script source.
+    """
+    for secret in _secrets():
+        text = text.replace(secret, "REDACTED")
+    text = EMAIL.sub("user@example.com", text)
+    return PHONE.sub("9000000000", text)
+
+
+def sanitize_url(url: str) -> str:
+    """
+    Masks token-like query parameters and personal data in a URL.
+
+    Replay applies the same function to incoming requests, so masked URLs still match.
+
+    Args:
+        url: The URL.
+    """
+    parts = urlparse(url)
+    query = [(key, "REDACTED" if SENSITIVE_KEY.search(key) else value)
+             for key, value in parse_qsl(parts.query, keep_blank_values=True)]
+    return sanitize_text(urlunparse(parts._replace(query=urlencode(query), fragment="")))
+
+
+def _sanitize_headers(headers: Dict) -> List[Dict]:
+    return [{"name": name, "value": (sanitize_url if name.lower() in URL_HEADERS else sanitize_text)(str(value))}
+            for name, value in (headers or {}).items()
+            if name.lower() not in DROPPED_HEADERS and not SENSITIVE_KEY.search(name)]
+
+
+class PageRecorder:
+    """Records one driver's pages and requests into a recording directory."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.pages: List[Dict] = []
+        self.entries: List[Dict] = []
+        self._requests: Dict[str, Dict] = {}
+        os.makedirs(os.path.join(directory, "pages"), exist_ok=True)
+        os.makedirs(os.path.join(directory, "bodies"), exist_ok=True)
+
+    def _new_entry(self, request_id: str, params: dict) -> Dict:
+        request = params.get("request", {})
+        entry = {
+            "request_id": request_id,
+            "type": params.get("type", "Other"),
+            "started": params.get("wallTime", time.time()),
+            "timestamp": params.get("timestamp", 0),
+            "method": request.get("method", "GET"),
+            "url": sanitize_url(request.get("url", "")),
+            "request_headers": _sanitize_headers(request.get("headers")),
+            "status": 0,
+            "response_headers": [],
+            "mime_type": "",
+            "size": 0,
+            "time_ms": 0.0,
+            "finished": False,
+        }
+        self.entries.append(entry)
+        return entry
+
+    def on_event(self, method: str, params: dict) -> None:
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            previous = self._requests.get(request_id)
+            redirect = params.get("redirectResponse")
+            if previous and redirect:
+                # The earlier hop ended in a redirect; record it as its own entry
+                self._set_response(previous, redirect)
+                previous["finished"] = True
+                previous["time_ms"] = (params.get("timestamp", 0) - previous["timestamp"]) * 1000
+            if params.get("request", {}).get("url", "").startswith(("http://", "https://")):
+                self._requests[request_id] = self._new_entry(request_id, params)
+        elif method == "Network.responseReceived":
+            entry = self._requests.get(request_id)
+            if entry:
+                self._set_response(entry, params.get("response", {}))
+        elif method == "Network.loadingFinished":
+            entry = self._requests.get(request_id)
+            if entry:
+                entry["finished"] = True
+                entry["size"] = int(params.get("encodedDataLength", 0))
+                entry["time_ms"] = (params.get("timestamp", 0) - entry["timestamp"]) * 1000
+        elif method == "Network.loadingFailed":
+            entry = self._requests.pop(request_id, None)
+            if entry:
+                entry["failed"] = params.get("errorText", "failed")
+
+    @staticmethod
+    def _set_response(entry: Dict, response: dict) -> None:
+        entry["status"] = response.get("status", 0)
+        entry["response_headers"] = _sanitize_headers(response.get("headers"))
+        entry["mime_type"] = response.get("mimeType", "")
+
+    def _store(self, data: bytes) -> str:
+        digest = hashlib.sha1(data).hexdigest()
+        path = os.path.join(self.directory, "bodies", digest)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(data)
+        return digest
+
+    def fetch_bodies(self, driver: WebDriver) -> None:
+        """Stores the bodies of finished requests, while Chrome still holds them."""
+        for request_id, entry in list(self._requests.items()):
+            if not entry["finished"]:
+                continue
+            del self._requests[request_id]
+            if entry["type"] not in BODY_TYPES or entry["size"] > MAX_BODY_BYTES or entry["method"] != "GET":
+                continue
+            try:
+                result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            except Exception:
+                continue
+            body = result.get("body", "")
+            data = base64.b64decode(body) if result.get("base64Encoded") else sanitize_text(body).encode()
+            entry["body"] = self._store(data)
+
+    def add_snapshot(self, label: str, url: str, html: str) -> None:
+        index = len(self.pages) + 1
+        filename = f"{index:02d}-{re.sub(r'[^a-z0-9_]+', '_', label.lower())}.html"
+        with open(os.path.join(self.directory, "pages", filename), "w") as f:
+            f.write(sanitize_text(html))
+        self.pages.append({"label": label, "url": sanitize_url(url), "file": filename,
+                           "captured_at": datetime.now(timezone.utc).isoformat()})
+        print(f"🎞️ Recorded page '{label}' ({sanitize_url(url)[:80]})")
+
+    def write_har(self) -> str:
+        def iso(wall_time):
+            return datetime.fromtimestamp(wall_time, timezone.utc).isoformat()
+
+        entries = []
+        for entry in self.entries:
+            if not entry["finished"]:
+                continue
+            content = {"size": entry["size"], "mimeType": entry["mime_type"]}
+            if "body" in entry:
+                content["_file"] = os.path.join("bodies", entry["body"])
+            entries.append({
+                "startedDateTime": iso(entry["started"]),
+                "time": round(entry["time_ms"], 1),
+                "request": {"method": entry["method"], "url": entry["url"], "httpVersion": "",
+                            "headers": entry["request_headers"], "queryString": [], "cookies": [],
+                            "headersSize": -1, "bodySize": -1},
+                "response": {"status": entry["status"], "statusText": "", "httpVersion": "",
+                             "headers": entry["response_headers"], "cookies": [], "content": content,
+                             "redirectURL": "", "headersSize": -1, "bodySize": entry["size"]},
+                "cache": {},
+                "timings": {"send": 0, "wait": round(entry["time_ms"], 1), "receive": 0},
+                "_resourceType": entry["type"],
+            })
+        har = {"log": {
+            "version": "1.2",
+            "creator": {"name": "naukri-automation page_replay", "version": "1"},
+            "pages": [{"id": page["file"], "title": page["label"], "startedDateTime": page["captured_at"],
+                       "pageTimings": {}, "_url": page["url"], "_snapshot": os.path.join("pages", page["file"])}
+                      for page in self.pages],
+            "entries": entries,
+        }}
+        path = os.path.join(self.directory, "recording.har")
+        with open(path, "w") as f:
+            json.dump(har, f, indent=1)
+        return path
+
+
+_recorders: "weakref.WeakKeyDictionary[WebDriver, PageRecorder]" = weakref.WeakKeyDictionary()
+
+
+def start_recording(driver: WebDriver, account_id: str) -> None:
+    """
+    Starts recording a driver's run if RECORD_PAGES is enabled.
+
+    Args:
+        driver: The webdriver instance.
+        account_id: The account the run belongs to, used in the directory name.
+    """
+    if not recording_enabled() or driver in _recorders:
+        return
+    root = os.getenv("RECORDINGS_DIR", "recordings")
+    safe_account = re.sub(r"[^A-Za-z0-9_.-]+", "_", account_id)
+    recorder = PageRecorder(os.path.join(root, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{safe_account}"))
+    _recorders[driver] = recorder
+    subscribe(driver, recorder.on_event)
+    print(f"🎞️ Recording pages to {recorder.directory}")
+
+
+def capture_page(driver: WebDriver, label: str) -> None:
+    """
+    Records a sanitised snapshot of the current page and the bodies loaded so far.
+
+    Does nothing unless the driver is being recorded.
+
+    Args:
+        driver: The webdriver instance.
+        label: What the page is, e.g. 'login' or 'captcha'.
+    """
+    recorder = _recorders.get(driver)
+    if recorder is None:
+        return
+    try:
+        drain_events(driver)
+        recorder.add_snapshot(label, driver.current_url, driver.execute_script(_SNAPSHOT_SCRIPT) or "")
+        recorder.fetch_bodies(driver)
+    except Exception as e:
+        print(f"⚠️ Could not record page '{label}': {e}")
+
+
+def finish_recording(driver: WebDriver) -> Optional[str]:
+    """
+    Writes a driver's recording. Call before quitting.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        The recording directory, or None if the driver wasn't recorded.
+    """
+    recorder = _recorders.pop(driver, None)
+    if recorder is None:
+        return None
+    try:
+        drain_events(driver)
+        recorder.fetch_bodies(driver)
+    except Exception:
+        pass
+    recorder.write_har()
+    print(f"🎞️ Recording written to {recorder.directory} ({len(recorder.pages)} pages, "
+          f"{len(recorder.entries)} requests)")
+    return recorder.directory
+
+
+def configure_replay(chrome_options) -> None:
+    """
+    Points Chrome at the replay server in REPLAY_ADDRESS, if set.
+
+    Args:
+        chrome_options: The ChromeOptions instance being built.
+    """
+    address = os.getenv("REPLAY_ADDRESS")
+    if not address:
+        return
+    rules = [f"MAP {host} {address}" for host in REPLAY_HOSTS]
+    rules += ["MAP * ~NOTFOUND", "EXCLUDE localhost", "EXCLUDE 127.0.0.1"]
+    chrome_options.add_argument(f"--host-resolver-rules={', '.join(rules)}")
+    # The replay server's certificate is self-signed
+    chrome_options.add_argument("--ignore-certificate-errors")
+    print(f"🎞️ Replaying naukri.com from {address}")
+
+
+class Recording:
+    """A recording loaded for replay."""
+
+    def __init__(self, directory: str, variant: Optional[str] = None):
+        self.directory = directory
+        with open(os.path.join(directory, "recording.har")) as f:
+            log = json.load(f)["log"]
+        self.responses: Dict[Tuple[str, str], Dict] = {}
+        self.paths: Dict[Tuple[str, str], Dict] = {}
+        for entry in log["entries"]:
+            key = self._key(entry["request"]["method"], entry["request"]["url"])
+            # First response wins, so replay is the same whatever the order of requests
+            self.responses.setdefault(key, entry)
+            self.paths.setdefault((key[0], key[1].split("?")[0]), entry)
+
+        self.snapshots: Dict[str, Dict] = {}
+        pages = log.get("pages", [])
+        if variant:
+            # Snapshots of the requested variant take precedence for their URL
+            pages = sorted(pages, key=lambda page: page["title"] != variant)
+        for page in pages:
+            self.snapshots.setdefault(self._key("GET", page["_url"])[1], page)
+
+    @staticmethod
+    def _key(method: str, url: str) -> Tuple[str, str]:
+        parts = urlparse(sanitize_url(url))
+        # Ignore the port: replay may listen on any, the recording was made on 443
+        return method.upper(), f"{(parts.hostname or '').lower()}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+
+    def _read(self, relative: str) -> bytes:
+        with open(os.path.join(self.directory, relative), "rb") as f:
+            return f.read()
+
+    def lookup(self, method: str, url: str) -> Tuple[int, List[Tuple[str, str]], bytes, float]:
+        """
+        Returns the recorded response for a request.
+
+        Args:
+            method: HTTP method.
+            url: Absolute URL of the request.
+
+        Returns:
+            Tuple of status, headers, body and recorded time in ms.
+        """
+        key = self._key(method, url)
+        page = self.snapshots.get(key[1]) if key[0] == "GET" else None
+        entry = self.responses.get(key) or self.paths.get((key[0], key[1].split("?")[0]))
+        if page:
+            return 200, [("Content-Type", "text/html; charset=utf-8")], self._read(page["_snapshot"]), \
+                entry["time"] if entry else 0.0
+        if not entry:
+            return 404, [("Content-Type", "text/plain")], b"not recorded\n", 0.0
+
+        response = entry["response"]
+        skipped = ("content-encoding", "content-length", "transfer-encoding", "connection")
+        headers = [(h["name"], h["value"]) for h in response["headers"] if h["name"].lower() not in skipped]
+        content = response["content"]
+        body = self._read(content["_file"]) if content.get("_file") else b""
+        if not any(name.lower() == "content-type" for name, _ in headers) and content.get("mimeType"):
+            headers.append(("Content-Type", content["mimeType"]))
+        return response["status"] or 200, headers, body, entry["time"]
+
+
+def _certificate(directory: str) -> Tuple[str, str]:
+    cert, key = os.path.join(directory, "replay-cert.pem"), os.path.join(directory, "replay-key.pem")
+    if not os.path.exists(cert):
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "365",
+                        "-subj", "/CN=naukri-replay", "-keyout", key, "-out", cert],
+                       check=True, capture_output=True)
+    return cert, key
+
+
+def serve_recording(directory: str, host: str = "127.0.0.1", port: int = 8443, variant: Optional[str] = None,
+                    recorded_latency: bool = False, use_tls: bool = True) -> None:
+    """
+    Serves a recording until interrupted.
+
+    Args:
+        directory: The recording directory.
+        host: Listen address.
+        port: Listen port.
+        variant: Snapshot label to prefer where several were recorded for one URL.
+        recorded_latency: Delay each response by its recorded time.
+        use_tls: Serve HTTPS with a self-signed certificate, as Chrome expects for naukri.com.
+    """
+    recording = Recording(directory, variant)
+
+    class Handler(BaseHTTPRequestHandler):
+        def _replay(self):
+            scheme = "https" if use_tls else "http"
+            status, headers, body, recorded_ms = recording.lookup(
+                self.command, f"{scheme}://{self.headers.get('Host', 'www.naukri.com')}{self.path}")
+            if recorded_latency and recorded_ms:
+                time.sleep(recorded_ms / 1000)
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        do_GET = do_POST = do_HEAD = do_PUT = do_OPTIONS = _replay
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    if use_tls:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*_certificate(directory))
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    print(f"🎞️ Replaying {directory} ({len(recording.snapshots)} pages, {len(recording.responses)} responses) "
+          f"on {host}:{port}; run with REPLAY_ADDRESS={host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Record-and-replay of Naukri pages")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Serve a recording")
+    serve_parser.add_argument("recording")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8443)
+    serve_parser.add_argument("--variant", help="Prefer snapshots with this label, e.g. captcha")
+    serve_parser.add_argument("--recorded-latency", action="store_true",
+                              help="Delay responses by their recorded time")
+    serve_parser.add_argument("--no-tls", action="store_true", help="Serve plain HTTP")
+    list_parser = subparsers.add_parser("list", help="List a recording's pages")
+    list_parser.add_argument("recording")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve_recording(args.recording, args.host, args.port, args.variant, args.recorded_latency,
+                        not args.no_tls)
+        return 0
+    with open(os.path.join(args.recording, "recording.har")) as f:
+        log = json.load(f)["log"]
+    for page in log["pages"]:
+        print(f"{page['title']:<24} {page['_url']}")
+    print(f"{len(log['entries'])} recorded requests")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+"""
+Preflight probe for the Naukri automation.
+
+A run finds out that the site is blocking us, or that the login markup has
+changed, only after launching Chrome, sleeping, navigating and typing
+credentials. The preflight answers the same questions in seconds: it fetches
+the homepage and login page over plain HTTP, checks reachability and the
+blocked / "Access Denied" state, and evaluates every selector list the login
+flow relies on (utility.HOME_LOGIN_SELECTORS, EMAIL_INPUT_SELECTORS, ...)
+against the markup in one pass per page. Selectors that can't be settled from
+the static HTML (the login form is rendered by JavaScript) are checked in a
+headless browser, one script evaluation per page.
+
+The result is go or no-go with reasons; the CLI exits with NO_GO_EXIT_CODE
+on no-go, so a crash of the probe itself (exit 1) isn't mistaken for one.
+Schedulers use it to skip doomed runs: run_naukri_automation.sh with
+PREFLIGHT=true, `python job_queue.py work --preflight`.
+
+Static XPath evaluation uses lxml (a requirement); in an environment without
+it every selector is checked in the browser. A static match settles a group,
+but a miss doesn't: the form may only be rendered by JavaScript, so groups
+without a static match are always checked in the browser.
+
+Configuration (environment variables):
+    PREFLIGHT: true to run the preflight before scheduled runs (default: false).
+    PREFLIGHT_TIMEOUT: Seconds allowed per HTTP request and per page render (default: 10).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+from page_readiness import PAGE_URLS
+from utility import (CAPTCHA_SELECTORS, EMAIL_INPUT_SELECTORS, HOME_LOGIN_SELECTORS, LOGIN_SUBMIT_SELECTORS,
+                     OTP_TAB_INDICATORS, PASSWORD_INPUT_SELECTOR, PASSWORD_TAB_SWITCH_SELECTORS)
+
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_etree = lxml_html = None
+
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# Exit status of the CLI on no-go; anything else non-zero is a failure of the probe itself
+NO_GO_EXIT_CODE = 3
+
+# Markers of Naukri's bot protection on an otherwise successful response
+BLOCK_MARKERS = ("Access Denied", "Reference #", "errors.edgesuite.net")
+
+# Selector groups per page: (name, selectors, rule). 'required' groups need a
+# match, 'blocker' groups must not match, 'optional' groups warn when they
+# don't match and 'warning' groups warn when they do.
+SELECTOR_GROUPS = {
+    "home": [
+        ("login_link", HOME_LOGIN_SELECTORS, "optional"),
+    ],
+    "login": [
+        ("email_input", EMAIL_INPUT_SELECTORS, "required"),
+        # The password field, or a tab switch that reveals it when the form opens on OTP
+        ("password_entry", [PASSWORD_INPUT_SELECTOR] + PASSWORD_TAB_SWITCH_SELECTORS, "required"),
+        ("login_submit", LOGIN_SUBMIT_SELECTORS, "required"),
+        ("otp_tab", OTP_TAB_INDICATORS, "info"),
+        # The markup of a challenge widget is often on the page without one being shown
+        ("captcha", CAPTCHA_SELECTORS, "warning"),
+    ],
+}
+
+# Counts matches of every selector in one round-trip; -1 marks an invalid selector
+_EVALUATE_SCRIPT = """
+const groups = arguments[0];
+const result = {};
+for (const [name, selectors] of Object.entries(groups)) {
+    result[name] = selectors.map(([kind, value]) => {
+        try {
+            if (kind === 'css') return document.querySelectorAll(value).length;
+            return document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+        } catch (e) {
+            return -1;
+        }
+    });
+}
+const text = document.body ? document.body.innerText : '';
+return {groups: result, title: document.title, url: location.href,
+        blocked: /Access Denied/i.test(document.title) || /Access Denied/.test(text.slice(0, 2000))};
+"""
+
+
+def _xpath_literal(text: str) -> str:
+    return f"'{text}'" if "'" not in text else f'"{text}"'
+
+
+def normalize_selector(selector) -> Tuple[str, str]:
+    """
+    Converts a flow selector to ('xpath' | 'css', expression).
+
+    Args:
+        selector: An XPath string or a (By, value) tuple.
+    """
+    if isinstance(selector, str):
+        return "xpath", selector
+    by, value = selector
+    if by == By.LINK_TEXT:
+        return "xpath", f"//a[normalize-space(.)={_xpath_literal(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return "xpath", f"//a[contains(., {_xpath_literal(value)})]"
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    return "xpath", value
+
+
+def _timeout() -> float:
+    return float(os.getenv("PREFLIGHT_TIMEOUT", "10"))
+
+
+def fetch_page(url: str) -> Dict:
+    """
+    Fetches a page over plain HTTP.
+
+    Args:
+        url: The page URL.
+
+    Returns:
+        Dict with status, seconds, blocked, html and error.
+    """
+    request = urllib.request.Request(url, headers={
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    })
+    start = time.time()
+    result = {"url": url, "status": None, "blocked": False, "html": "", "error": None}
+    try:
+        with urllib.request.urlopen(request, timeout=_timeout()) as response:
+            result["status"] = response.status
+            result["html"] = response.read(2 * 1024 * 1024).decode("utf-8", "replace")
+    except urllib.error.HTTPError as e:
+        result["status"] = e.code
+        result["html"] = e.read(64 * 1024).decode("utf-8", "replace")
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = round(time.time() - start, 2)
+    result["blocked"] = result["status"] in (403, 429) or any(m in result["html"][:20000] for m in BLOCK_MARKERS)
+    return result
+
+
+def evaluate_static(html: str, groups: List[Tuple[str, List, str]]) -> Dict[str, List[Optional[int]]]:
+    """
+    Counts selector matches in static HTML.
+
+    Args:
+        html: The page source.
+        groups: The page's SELECTOR_GROUPS entry.
+
+    Returns:
+        Match counts per group and selector; None where the static HTML can't
+        tell (no lxml, CSS selector), -1 for an invalid selector.
+    """
+    if lxml_html is None or not html.strip():
+        return {name: [None] * len(selectors) for name, selectors, _ in groups}
+    document = lxml_html.fromstring(html)
+    counts = {}
+    for name, selectors, _ in groups:
+        counts[name] = []
+        for kind, value in map(normalize_selector, selectors):
+            if kind != "xpath":
+                counts[name].append(None)
+                continue
+            try:
+                counts[name].append(len(document.xpath(value)))
+            except lxml_etree.XPathError:
+                counts[name].append(-1)
+    return counts
+
+
+def evaluate_in_browser(driver, url: str, groups: List[Tuple[str, List, str]]) -> Dict:
+    """
+    Loads a page and counts selector matches once the required groups appear or the timeout passes.
+
+    Args:
+        driver: A webdriver instance.
+        url: The page URL.
+        groups: The page's SELECTOR_GROUPS entry.
+
+    Returns:
+        The evaluation script's result: groups, title, url and blocked.
+    """
+    payload = {name: [list(normalize_selector(s)) for s in selectors] for name, selectors, _ in groups}
+    required = [name for name, _, rule in groups if rule == "required"]
+    driver.get(url)
+    deadline = time.time() + _timeout()
+    result = {}
+    while time.time() < deadline:
+        result = driver.execute_script(_EVALUATE_SCRIPT, payload) or {}
+        counts = result.get("groups", {})
+        if result.get("blocked") or all(any(c > 0 for c in counts.get(name, [])) for name in required):
+            break
+        time.sleep(0.5)
+    return result
+
+
+def _judge(page: str, groups: List[Tuple[str, List, str]], counts: Dict[str, List[Optional[int]]],
+           reasons: List[str], warnings: List[str], rendered: bool = False) -> List[str]:
+    """
+    Applies the group rules; returns the groups the counts couldn't settle.
+
+    Counts from static HTML only settle a group they match; a miss there may be
+    markup that JavaScript renders later. Counts from a rendered page settle
+    every group.
+    """
+    unresolved = []
+    for name, selectors, rule in groups:
+        group_counts = counts.get(name, [None] * len(selectors))
+        for selector, count in zip(selectors, group_counts):
+            if count == -1:
+                warnings.append(f"{page}: invalid selector in {name}: {normalize_selector(selector)[1]}")
+        matched = any(c and c > 0 for c in group_counts)
+        settled = matched or rendered
+        if rule == "blocker" and matched:
+            reasons.append(f"{page}: {name} present")
+        elif rule == "warning" and matched:
+            warnings.append(f"{page}: {name} markup present; the run may be challenged")
+        elif rule in ("required", "optional") and not matched:
+            if not settled:
+                unresolved.append(name)
+            elif rule == "required":
+                reasons.append(f"{page}: no {name} selector matches the current markup")
+            else:
+                warnings.append(f"{page}: no {name} selector matches; the flow will fall back")
+    return unresolved
+
+
+def run_preflight(use_browser: bool = True) -> Dict:
+    """
+    Checks reachability, blocking and the login flow's selectors.
+
+    Args:
+        use_browser: Check selectors the static HTML can't settle in a headless browser.
+
+    Returns:
+        Dict with go, reasons, warnings, per-page details and seconds.
+    """
+    start = time.time()
+    reasons: List[str] = []
+    warnings: List[str] = []
+    pages: Dict[str, Dict] = {}
+    pending: Dict[str, List[str]] = {}
+
+    for page, groups in SELECTOR_GROUPS.items():
+        fetched = fetch_page(PAGE_URLS[page])
+        pages[page] = {"status": fetched["status"], "seconds": fetched["seconds"], "mode": "http"}
+        if fetched["error"]:
+            reasons.append(f"{page}: unreachable ({fetched['error']})")
+            continue
+        if fetched["blocked"]:
+            reasons.append(f"{page}: blocked (HTTP {fetched['status']}, Access Denied)")
+            continue
+        if fetched["status"] and fetched["status"] >= 400:
+            reasons.append(f"{page}: HTTP {fetched['status']}")
+            continue
+        counts = evaluate_static(fetched["html"], groups)
+        pages[page]["selectors"] = counts
+        unresolved = _judge(page, groups, counts, reasons, warnings)
+        if unresolved:
+            pending[page] = unresolved
+
+    # Blocked or unreachable is decided without paying for a browser
+    if pending and not reasons:
+        if use_browser:
+            _check_in_browser(pending, pages, reasons, warnings)
+        else:
+            warnings += [f"{page}: {', '.join(names)} not in the static HTML and not checked in a browser"
+                         for page, names in pending.items()]
+
+    return {"go": not reasons, "reasons": reasons, "warnings": warnings, "pages": pages,
+            "seconds": round(time.time() - start, 1)}
+
+
+def _check_in_browser(pending: Dict[str, List[str]], pages: Dict[str, Dict], reasons: List[str],
+                      warnings: List[str]) -> None:
+    from driver_backend import create_driver
+    from utility import build_chrome_options
+
+    driver = None
+    try:
+        driver = create_driver(build_chrome_options(is_ci=True))
+        for page, names in pending.items():
+            groups = [group for group in SELECTOR_GROUPS[page]
+                      if group[0] in names or group[2] in ("blocker", "warning")]
+            result = evaluate_in_browser(driver, PAGE_URLS[page], groups)
+            pages[page].update({"mode": "browser", "selectors": result.get("groups", {}),
+                                "title": result.get("title")})
+            if result.get("blocked"):
+                reasons.append(f"{page}: blocked (Access Denied in the browser)")
+                continue
+            # Everything the browser reports is settled, so unmatched groups are real misses
+            _judge(page, groups, result.get("groups", {}), reasons, warnings, rendered=True)
+    except Exception as e:
+        reasons.append(f"browser check failed: {e}")
+    finally:
+        if driver:
+            driver.quit()
+
+
+def preflight_enabled() -> bool:
+    """Returns whether PREFLIGHT is enabled for scheduled runs."""
+    return os.getenv("PREFLIGHT", "false").lower() in ("1", "true", "yes")
+
+
+def print_result(result: Dict) -> None:
+    """Prints a preflight result."""
+    print(f"{'🟢 GO' if result['go'] else '🔴 NO-GO'} (preflight took {result['seconds']}s)")
+    for reason in result["reasons"]:
+        print(f"   ❌ {reason}")
+    for warning in result["warnings"]:
+        print(f"   ⚠️ {warning}")
+
+
+def main() -> int:
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description="Check that a run can succeed before starting it")
+    parser.add_argument("--http-only", action="store_true", help="Don't fall back to a headless browser")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    parser.add_argument("--if-enabled", action="store_true", help="Report go without checking unless PREFLIGHT=true")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if args.if_enabled and not preflight_enabled():
+        return 0
+    result = run_preflight(use_browser=not args.http_only)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_result(result)
+    return 0 if result["go"] else NO_GO_EXIT_CODE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
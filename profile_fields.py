@@ -0,0 +1,316 @@
+"""
+Declarative profile-field updates for the Naukri automation.
+
+Keeps the headline, key skills, preferred locations and notice period of
+each account in line with a spec file instead of editing every profile by
+hand. After the refresh, the current values are read from the profile page
+in one script call and compared with the spec; only the forms with a changed
+field are opened, each form is edited and saved once for all of its fields,
+and unchanged fields are skipped without touching the page. A field whose
+current value can't be read is reported and left alone, since writing it
+blind could clobber a value the page simply failed to show. The values are
+read again in one call afterwards to confirm what was written.
+
+Spec file (JSON, or YAML when PyYAML is installed):
+
+    {"default": {"notice_period": "15 Days or less"},
+     "accounts": {"jane_doe_example_com": {"headline": "Product manager, payments",
+                                            "key_skills": ["Product strategy", "SQL"],
+                                            "preferred_locations": ["Bengaluru", "Remote"]}}}
+
+Fields under "default" apply to every account unless its own entry sets
+them. Lists are compared without regard to order or case.
+
+Configuration (environment variables):
+    PROFILE_SPEC_PATH: The spec file (default: unset, no updates).
+"""
+
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from command_counter import command_phase
+from refresh_strategy import SECTION_EDIT_SELECTORS, open_section_editor, save_section_editor
+from run_report import add_report_section
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+# Where each field's current value is shown on the profile page (CSS, tried
+# in order) and, for lists, the chip selector inside it. A list section that
+# is shown without chips reads as an empty list, a missing one as unreadable.
+FIELD_READ_SELECTORS = {
+    "headline": (None, [".resumeHeadline .prefill", "#lazyResumeHead .prefill"]),
+    "key_skills": (".chip", [".keySkills", "#lazyKeySkills"]),
+    "preferred_locations": (".chip", ["[class*='prefLoc']"]),
+    "notice_period": (None, ["[name='noticePeriod']", "[class*='noticePeriod']"]),
+}
+
+# Forms of the profile page: the section's edit control and, per field, how
+# it is set ('text', 'chips' or 'choice') and the input inside the open form
+PROFILE_FORMS = {
+    "resume_headline": {
+        "edit": SECTION_EDIT_SELECTORS["headline_resave"],
+        "fields": {"headline": ("text", "//form//textarea")},
+    },
+    "key_skills": {
+        "edit": [
+            "//span[normalize-space()='Key skills']/following-sibling::span[contains(@class, 'edit')]",
+            "//div[contains(@class, 'keySkills')]//span[contains(@class, 'edit')]",
+        ],
+        "fields": {"key_skills": ("chips", "//form//input[contains(@id, 'keySkill')]")},
+    },
+    "career_profile": {
+        "edit": [
+            "//span[normalize-space()='Career profile']/following-sibling::span[contains(@class, 'edit')]",
+            "//div[contains(@class, 'careerProfile')]//span[contains(@class, 'edit')]",
+        ],
+        "fields": {"preferred_locations": ("chips", "//form//input[contains(@id, 'location')]")},
+    },
+    "basic_details": {
+        "edit": [
+            "//div[contains(@class, 'hdn')]//em[contains(@class, 'edit')]",
+            "//div[contains(@class, 'profile-name')]//*[contains(@class, 'edit')]",
+        ],
+        "fields": {"notice_period": ("choice", "//form//*[contains(@id, 'noticePeriod')]")},
+    },
+}
+
+FIELD_FORMS = {field: form for form, spec in PROFILE_FORMS.items() for field in spec["fields"]}
+
+CHIP_SELECTOR = ".//*[contains(@class, 'chip')]"
+CHIP_REMOVE_SELECTOR = ".//*[contains(@class, 'close') or contains(@class, 'cross')]"
+
+# Reads every field in one round-trip: field -> text, list of chip texts or null
+_READ_FIELDS_SCRIPT = """
+const fields = arguments[0];
+const clean = (element) => (element.innerText || element.value || '').replace(/\\s+/g, ' ').trim();
+const values = {};
+for (const [field, [chip, selectors]] of Object.entries(fields)) {
+    values[field] = null;
+    for (const selector of selectors) {
+        const elements = Array.from(document.querySelectorAll(selector));
+        if (!elements.length) continue;
+        if (chip) {
+            // Sections can nest (class*= matches), so collect each chip once
+            const chips = new Set(elements.flatMap((section) => Array.from(section.querySelectorAll(chip))));
+            values[field] = Array.from(chips).map(clean).filter(Boolean);
+        } else {
+            values[field] = clean(elements[0]);
+        }
+        break;
+    }
+}
+return values;
+"""
+
+# Sets an input's value the way typing would, so the page's framework sees the change
+_SET_VALUE_SCRIPT = """
+const [element, value] = arguments;
+const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value').set;
+setter.call(element, value);
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+
+def load_profile_spec(account_id: str) -> Dict[str, Any]:
+    """
+    Returns the desired profile fields for an account from PROFILE_SPEC_PATH.
+
+    Args:
+        account_id: The account.
+
+    Returns:
+        Field -> desired value; empty without a spec or if it can't be read.
+    """
+    path = os.getenv("PROFILE_SPEC_PATH")
+    if not path:
+        return {}
+    path = os.path.expanduser(path)
+    try:
+        with open(path) as f:
+            if path.endswith((".yaml", ".yml")):
+                if yaml is None:
+                    print(f"⚠️ PyYAML is not installed, can't read {path} (pip install pyyaml, or use JSON)")
+                    return {}
+                spec = yaml.safe_load(f) or {}
+            else:
+                spec = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read profile spec from {path}: {e}")
+        return {}
+    fields = dict(spec.get("default") or {})
+    fields.update((spec.get("accounts") or {}).get(account_id) or {})
+    return fields
+
+
+def _normalize(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return sorted({re.sub(r"\s+", " ", str(v)).strip().lower() for v in value})
+    return re.sub(r"\s+", " ", str(value)).strip().lower()
+
+
+def read_profile_fields(driver: WebDriver, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Reads the current profile field values in one script call.
+
+    Args:
+        driver: The webdriver instance, on the profile page.
+        fields: Fields to read; every FIELD_READ_SELECTORS entry if not given.
+
+    Returns:
+        Field -> current value, None where the page doesn't show it.
+    """
+    selectors = {field: FIELD_READ_SELECTORS[field] for field in (fields or FIELD_READ_SELECTORS)}
+    return driver.execute_script(_READ_FIELDS_SCRIPT, selectors) or {}
+
+
+def diff_profile_fields(desired: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the desired fields whose current value differs.
+
+    Args:
+        desired: Field -> desired value.
+        current: Field -> current value from read_profile_fields().
+
+    Returns:
+        Field -> desired value for the fields to write. A field the page
+        doesn't show (None) is left out; see unreadable_profile_fields().
+    """
+    return {field: value for field, value in desired.items()
+            if current.get(field) is not None and _normalize(current[field]) != _normalize(value)}
+
+
+def unreadable_profile_fields(desired: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    Returns the desired fields whose current value couldn't be read.
+
+    Args:
+        desired: Field -> desired value.
+        current: Field -> current value from read_profile_fields().
+    """
+    return sorted(field for field in desired if current.get(field) is None)
+
+
+def _set_text(driver: WebDriver, element, value: str) -> None:
+    driver.execute_script(_SET_VALUE_SCRIPT, element, str(value))
+
+
+def _set_chips(driver: WebDriver, element, values: List[str]) -> None:
+    desired = {_normalize(v): v for v in values}
+    form = element.find_element(By.XPATH, "./ancestor::form[1]")
+    present = set()
+    for chip in form.find_elements(By.XPATH, CHIP_SELECTOR):
+        text = _normalize(chip.text)
+        if text in desired:
+            present.add(text)
+            continue
+        remove = chip.find_elements(By.XPATH, CHIP_REMOVE_SELECTOR)
+        if remove:
+            driver.execute_script("arguments[0].click();", remove[0])
+    for key, value in desired.items():
+        if key in present:
+            continue
+        element.send_keys(str(value))
+        time.sleep(0.5)  # Let the suggestion list catch up before confirming
+        element.send_keys(Keys.ENTER)
+
+
+def _set_choice(driver: WebDriver, element, value: str) -> None:
+    driver.execute_script("arguments[0].click();", element)
+    literal = f"'{value}'" if "'" not in value else f'"{value}"'
+    option = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(
+        (By.XPATH, f"//form//li[normalize-space()={literal}] | //form//option[normalize-space()={literal}]")))
+    option.click()
+
+
+SETTERS = {"text": _set_text, "chips": _set_chips, "choice": _set_choice}
+
+
+def write_profile_form(driver: WebDriver, form: str, values: Dict[str, Any]) -> None:
+    """
+    Opens one profile form, sets the given fields and saves it once.
+
+    Args:
+        driver: The webdriver instance, on the profile page.
+        form: A PROFILE_FORMS key.
+        values: Field -> value for fields of that form.
+    """
+    spec = PROFILE_FORMS[form]
+    open_section_editor(driver, spec["edit"])
+    for field, value in values.items():
+        kind, selector = spec["fields"][field]
+        element = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.XPATH, selector)))
+        SETTERS[kind](driver, element, value)
+    save_section_editor(driver)
+
+
+@command_phase("update_profile_fields")
+def update_profile_fields(driver: WebDriver, account_id: str, desired: Optional[Dict[str, Any]] = None) -> Dict:
+    """
+    Brings the profile's fields in line with the account's spec.
+
+    Args:
+        driver: The webdriver instance, on the profile page.
+        account_id: The account.
+        desired: Field -> desired value; loaded with load_profile_spec() if not given.
+
+    Returns:
+        Dict with 'written', 'skipped', 'failed' (field -> error), 'unreadable'
+        (not shown on the page, so not written), 'unsupported' and
+        'unconfirmed' fields and the number of 'forms_submitted'; empty
+        without a spec.
+    """
+    desired = load_profile_spec(account_id) if desired is None else desired
+    if not desired:
+        return {}
+    unsupported = sorted(field for field in desired if field not in FIELD_FORMS)
+    desired = {field: value for field, value in desired.items() if field in FIELD_FORMS}
+
+    current = read_profile_fields(driver, list(desired))
+    changes = diff_profile_fields(desired, current)
+    unreadable = unreadable_profile_fields(desired, current)
+    result = {"written": [], "skipped": sorted(set(desired) - set(changes) - set(unreadable)), "failed": {},
+              "unreadable": unreadable, "unsupported": unsupported, "unconfirmed": [], "forms_submitted": 0}
+
+    by_form: Dict[str, Dict[str, Any]] = {}
+    for field, value in changes.items():
+        by_form.setdefault(FIELD_FORMS[field], {})[field] = value
+    for form, values in by_form.items():
+        try:
+            write_profile_form(driver, form, values)
+            result["written"] += sorted(values)
+            result["forms_submitted"] += 1
+        except Exception as e:
+            for field in values:
+                result["failed"][field] = str(e)[:200]
+
+    if result["written"]:
+        after = read_profile_fields(driver, result["written"])
+        written = {f: changes[f] for f in result["written"]}
+        result["unconfirmed"] = sorted(set(diff_profile_fields(written, after))
+                                       | set(unreadable_profile_fields(written, after)))
+
+    print(f"🗂️ Profile fields: {len(result['written'])} written in {result['forms_submitted']} forms, "
+          f"{len(result['skipped'])} unchanged and skipped"
+          + (f", {len(result['failed'])} failed" if result["failed"] else "")
+          + (f", not readable and left alone: {', '.join(unreadable)}" if unreadable else "")
+          + (f", not shown after saving: {', '.join(result['unconfirmed'])}" if result["unconfirmed"] else ""))
+    for field in unsupported:
+        print(f"⚠️ Unsupported profile field in spec: {field} (supported: {', '.join(FIELD_FORMS)})")
+    add_report_section(driver, "profile_fields", result)
+    return result
@@ -0,0 +1,246 @@
+"""
+Profiling mode for the Naukri automation (`python main.py --profile`).
+
+Shows where a slow run spends its time: in Python, in WebDriver round-trips,
+in humanisation sleeps or in the page itself. The Python side is profiled
+with cProfile on the main thread; a Chrome performance trace is recorded over
+the navigation and login window. With chromedriver the trace comes from the
+performance log (traceCategories), with the direct DevTools backend from
+CDP Tracing.start/end. Both are written to one directory per run with a
+summary of the top time sinks:
+
+    python.prof        pstats dump (snakeviz, `python -m pstats`)
+    chrome_trace.json  Trace Event file (chrome://tracing, Perfetto)
+    summary.txt        the printed summary
+
+When profiling is off every hook returns immediately: no profiler, no trace
+categories and no event subscription.
+
+Configuration (environment variables):
+    PROFILE_DIR: Where profile directories are written (default: logs/profiles).
+    PROFILE_TRACE_CATEGORIES: Chrome trace categories to record
+        (default: TRACE_CATEGORIES).
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import weakref
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from cdp_driver import CdpDriver
+from cdp_events import drain_events, subscribe, unsubscribe
+
+
+TRACE_CATEGORIES = ",".join([
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "v8.execute",
+    "blink.user_timing",
+    "loading",
+])
+
+TOP_ENTRIES = 15
+
+
+class ProfileSession:
+    """One profiled run: the Python profiler and the browser traces recorded in it."""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.started = time.time()
+        self.profiler = cProfile.Profile()
+        self.trace_events: List[Dict] = []
+        self.trace_seconds = 0.0
+
+
+class BrowserTrace:
+    """Trace events collected for one driver between start and stop."""
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.started = time.time()
+        self.events: List[Dict] = []
+        self.complete = False
+
+    def on_event(self, method: str, params: dict) -> None:
+        if method == "Tracing.dataCollected":
+            # CDP batches events in 'value'; chromedriver logs one event per entry
+            if "value" in params:
+                self.events.extend(params["value"])
+            else:
+                self.events.append(params)
+        elif method == "Tracing.tracingComplete":
+            self.complete = True
+
+
+_session: Optional[ProfileSession] = None
+_traces: "weakref.WeakKeyDictionary[WebDriver, BrowserTrace]" = weakref.WeakKeyDictionary()
+
+
+def profiling_enabled() -> bool:
+    """Returns whether this process is running in profiling mode."""
+    return _session is not None
+
+
+def trace_categories() -> Optional[str]:
+    """
+    Returns the trace categories to record into the performance log.
+
+    Returns:
+        The categories in profiling mode, else None so no trace is recorded.
+    """
+    if _session is None:
+        return None
+    return os.getenv("PROFILE_TRACE_CATEGORIES", TRACE_CATEGORIES)
+
+
+def start_profiling() -> ProfileSession:
+    """
+    Enters profiling mode and starts profiling the calling thread.
+
+    Returns:
+        The profile session.
+    """
+    global _session
+    root = os.getenv("PROFILE_DIR", os.path.join("logs", "profiles"))
+    _session = ProfileSession(os.path.join(root, datetime.now().strftime("%Y%m%d-%H%M%S")))
+    print(f"🔬 Profiling enabled, output in {_session.output_dir}")
+    _session.profiler.enable()
+    return _session
+
+
+def start_browser_trace(driver: WebDriver) -> None:
+    """
+    Starts recording a Chrome performance trace for a driver.
+
+    Args:
+        driver: The webdriver instance.
+    """
+    if _session is None or driver in _traces:
+        return
+    trace = BrowserTrace(driver)
+    # Events logged before the window belong to launch, not to navigation
+    drain_events(driver)
+    subscribe(driver, trace.on_event)
+    _traces[driver] = trace
+    if isinstance(driver, CdpDriver):
+        try:
+            driver.execute_cdp_cmd("Tracing.start", {"categories": trace_categories(),
+                                                     "transferMode": "ReportEvents"})
+        except Exception as e:
+            print(f"⚠️ Could not start browser trace: {e}")
+
+
+def stop_browser_trace(driver: WebDriver) -> None:
+    """
+    Stops a driver's trace and adds its events to the profile session.
+
+    Args:
+        driver: The webdriver instance.
+    """
+    trace = _traces.pop(driver, None)
+    if trace is None:
+        return
+    if isinstance(driver, CdpDriver):
+        try:
+            driver.execute_cdp_cmd("Tracing.end", {})
+            deadline = time.time() + 10
+            while not trace.complete and time.time() < deadline:
+                time.sleep(0.2)
+                drain_events(driver)
+        except Exception as e:
+            print(f"⚠️ Could not stop browser trace: {e}")
+    else:
+        # chromedriver flushes the trace buffer into the performance log when it is read
+        drain_events(driver)
+    unsubscribe(driver, trace.on_event)
+    _session.trace_events.extend(trace.events)
+    _session.trace_seconds += time.time() - trace.started
+    print(f"🔬 Recorded {len(trace.events)} browser trace events over {time.time() - trace.started:.1f}s")
+
+
+def _python_summary(profiler: cProfile.Profile) -> List[str]:
+    stats = pstats.Stats(profiler)
+    webdriver_calls, webdriver_seconds, sleep_seconds = 0, 0.0, 0.0
+    for (filename, _, function), (_, calls, _, cumulative, _) in stats.stats.items():
+        if (filename.endswith("remote_connection.py") and function == "execute") or \
+                (filename.endswith("cdp_driver.py") and function == "_send"):
+            webdriver_calls += calls
+            webdriver_seconds += cumulative
+        elif function == "<built-in method time.sleep>":
+            sleep_seconds += cumulative
+
+    lines = [
+        f"Profiled wall time: {stats.total_tt:.1f}s on the main thread",
+        f"WebDriver round-trips: {webdriver_calls} commands, {webdriver_seconds:.1f}s",
+        f"Sleeps (humanisation delays and polling): {sleep_seconds:.1f}s",
+    ]
+    for sort_key, title in (("tottime", "own"), ("cumulative", "cumulative")):
+        lines += ["", f"Top {TOP_ENTRIES} functions by {title} time:"]
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats(sort_key).print_stats(TOP_ENTRIES)
+        lines.extend(_stats_rows(output.getvalue()))
+    return lines
+
+
+def _stats_rows(text: str) -> List[str]:
+    # Keep the table, not pstats' header about ordering and restrictions
+    rows = text.splitlines()
+    for i, row in enumerate(rows):
+        if row.strip().startswith("ncalls"):
+            return [r for r in rows[i:] if r.strip()]
+    return []
+
+
+def _browser_summary(events: List[Dict], window_seconds: float) -> List[str]:
+    totals: Dict[str, List[float]] = {}
+    for event in events:
+        if event.get("ph") == "X" and "dur" in event:
+            entry = totals.setdefault(event.get("name", "?"), [0, 0.0])
+            entry[0] += 1
+            entry[1] += event["dur"] / 1e6
+    lines = [f"Browser trace: {len(events)} events over a {window_seconds:.1f}s navigation and login window"]
+    if totals:
+        lines.append(f"Top {TOP_ENTRIES} trace events by total duration (nested events overlap):")
+        for name, (count, seconds) in sorted(totals.items(), key=lambda t: t[1][1], reverse=True)[:TOP_ENTRIES]:
+            lines.append(f"  {seconds:8.2f}s  {count:6d}x  {name}")
+    return lines
+
+
+def finish_profiling() -> Optional[str]:
+    """
+    Stops profiling and writes the profile, the browser trace and the summary.
+
+    Returns:
+        The output directory, or None outside profiling mode.
+    """
+    global _session
+    session, _session = _session, None
+    if session is None:
+        return None
+    session.profiler.disable()
+
+    os.makedirs(session.output_dir, exist_ok=True)
+    session.profiler.dump_stats(os.path.join(session.output_dir, "python.prof"))
+    lines = _python_summary(session.profiler)
+    if session.trace_events:
+        with open(os.path.join(session.output_dir, "chrome_trace.json"), "w") as f:
+            json.dump({"traceEvents": session.trace_events}, f)
+        lines += [""] + _browser_summary(session.trace_events, session.trace_seconds)
+    else:
+        lines += ["", "Browser trace: no events recorded"]
+
+    summary = "\n".join(lines) + "\n"
+    with open(os.path.join(session.output_dir, "summary.txt"), "w") as f:
+        f.write(summary)
+    print(f"🔬 Profile summary ({time.time() - session.started:.1f}s run):")
+    print(summary)
+    print(f"🔬 Profile written to {session.output_dir}")
+    return session.output_dir
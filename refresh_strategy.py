@@ -0,0 +1,436 @@
+"""
+Profile refresh strategies for the Naukri automation.
+
+Naukri ranks recently updated profiles higher in recruiter searches, and any
+saved edit counts as an update, not only a new resume. Re-uploading a
+resume of a few hundred KB is the most expensive way to get there. This
+module offers several refresh actions:
+
+    headline_resave  open the resume headline editor and save it unchanged
+    summary_resave   the same for the profile summary
+    resume_upload    upload the (cached, optimised) resume again
+
+Each attempt is measured (seconds, requests, bytes sent and received on the
+CDP event stream) and confirmed by reading the profile's "last updated"
+marker before and after. Per-account results are kept in a state file; in
+auto mode the cheapest action that has been confirmed to work for the
+account runs first, and resume_upload is the fallback when nothing cheaper
+moves the marker.
+
+Configuration (environment variables):
+    REFRESH_STRATEGY: resume_upload, auto, headline_resave or summary_resave
+        (default: resume_upload). A named action runs first and falls back
+        to resume_upload.
+    REFRESH_STRATEGY_STATE: Per-account results
+        (default: ~/.naukri-automation/refresh_strategy.json).
+    REFRESH_CONFIRM_TIMEOUT: Seconds to wait for the marker to change (default: 10).
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from cdp_events import drain_events, subscribe, unsubscribe
+from page_readiness import navigate
+from resume_artifacts import prepare_resume
+from run_report import add_report_section
+
+
+FALLBACK_ACTION = "resume_upload"
+
+# Edit controls of the profile sections that can be re-saved unchanged
+SECTION_EDIT_SELECTORS = {
+    "headline_resave": [
+        "//span[normalize-space()='Resume headline']/following-sibling::span[contains(@class, 'edit')]",
+        "//div[contains(@class, 'resumeHeadline')]//span[contains(@class, 'edit')]",
+    ],
+    "summary_resave": [
+        "//span[normalize-space()='Profile summary']/following-sibling::span[contains(@class, 'edit')]",
+        "//div[contains(@class, 'profileSummary')]//span[contains(@class, 'edit')]",
+    ],
+}
+
+SAVE_BUTTON_SELECTORS = [
+    "//form//button[@type='submit' and normalize-space()='Save']",
+    "//button[normalize-space()='Save']",
+]
+
+# Consecutive unconfirmed or failed attempts before an action is set aside for an account
+RETIRE_AFTER = 2
+# Set-aside actions are tried again after this long, in case the site changed
+RETRY_AFTER_SECONDS = 7 * 24 * 3600
+
+# Elements known to hold the profile's "last updated" marker, checked before the text search
+FRESHNESS_MARKER_SELECTORS = [
+    ".mod-date",
+    "[class*='lastUpdated']",
+    "[class*='last-updated']",
+]
+
+# The profile header card that shows the marker; the text search stays inside
+# it so "updated" elsewhere on the page (job cards, notifications) can't match
+FRESHNESS_CONTAINER_SELECTORS = [
+    "[class*='profile-card']",
+    "[class*='profileHeader']",
+    "[class*='userDetails']",
+    ".hdn",
+]
+
+# Returns the text of the profile's "last updated" marker (e.g. "Profile last
+# updated - Today" or "Updated 3d ago"), or null when the page has none
+FRESHNESS_MARKER_SCRIPT = """
+const [markerSelectors, containerSelectors] = arguments;
+for (const selector of markerSelectors) {
+    const element = document.querySelector(selector);
+    if (element && element.innerText.trim()) return element.innerText.replace(/\\s+/g, ' ').trim();
+}
+const container = containerSelectors.map(s => document.querySelector(s)).find(Boolean);
+if (!container) return null;
+const result = document.evaluate(
+    ".//*[not(self::script) and not(self::style)][contains(translate(text(), 'UPDATED', 'updated'), 'updated')]",
+    container, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < result.snapshotLength; i++) {
+    const node = result.snapshotItem(i);
+    const text = (node.parentElement || node).innerText || '';
+    if (text && text.length < 80 && node.offsetParent !== null) return text.replace(/\\s+/g, ' ').trim();
+}
+return null;
+"""
+
+
+class RefreshNotConfirmed(Exception):
+    """Raised when the profile's last-updated marker did not move after a refresh."""
+
+
+_lock = threading.Lock()
+
+
+def refresh_strategy_mode() -> str:
+    """Returns the configured REFRESH_STRATEGY."""
+    mode = os.getenv("REFRESH_STRATEGY", FALLBACK_ACTION).lower()
+    if mode != "auto" and mode not in ACTIONS:
+        print(f"⚠️ Unknown REFRESH_STRATEGY '{mode}', using {FALLBACK_ACTION}")
+        return FALLBACK_ACTION
+    return mode
+
+
+def read_freshness(driver: WebDriver) -> Optional[str]:
+    """
+    Reads the profile's "last updated" marker in one script call, without reloading.
+
+    Args:
+        driver: The webdriver instance, on the profile page.
+
+    Returns:
+        The marker text, or None if the page has none.
+
+    Raises:
+        WebDriverException: If the script can't run; a failed read is not a missing marker.
+    """
+    return driver.execute_script(FRESHNESS_MARKER_SCRIPT, FRESHNESS_MARKER_SELECTORS,
+                                 FRESHNESS_CONTAINER_SELECTORS)
+
+
+def freshness_changed(before: Optional[str], after: Optional[str]) -> Optional[bool]:
+    """
+    Compares two marker readings.
+
+    Args:
+        before: Marker before the action.
+        after: Marker after the action.
+
+    Returns:
+        True if it moved, False if not or if either marker is missing, None
+        if the profile already showed an update today, so a refresh can't
+        move it.
+    """
+    if not before or not after:
+        return False
+    if before != after:
+        return True
+    if re.search(r"\btoday\b|\bjust now\b|\b\d+\s*(min|hour|hr)s?\b", before, re.IGNORECASE):
+        return None
+    return False
+
+
+def wait_for_freshness_change(driver: WebDriver, before: Optional[str]) -> Optional[str]:
+    """
+    Polls the marker until it differs from a previous reading or the timeout passes.
+
+    Args:
+        driver: The webdriver instance.
+        before: Marker before the action.
+
+    Returns:
+        The last marker read.
+    """
+    deadline = time.time() + float(os.getenv("REFRESH_CONFIRM_TIMEOUT", "10"))
+    after = read_freshness(driver)
+    while after == before and time.time() < deadline:
+        time.sleep(1)
+        after = read_freshness(driver)
+    return after
+
+
+class ActionMeter:
+    """Counts the requests and bytes of one refresh action from the CDP event stream."""
+
+    def __init__(self):
+        self.requests = 0
+        self.sent_bytes = 0
+        self.received_bytes = 0
+
+    def on_event(self, method: str, params: dict) -> None:
+        if method == "Network.requestWillBeSent" and "redirectResponse" not in params:
+            self.requests += 1
+            self.sent_bytes += len(params.get("request", {}).get("postData", "") or "")
+        elif method == "Network.loadingFinished":
+            self.received_bytes += int(params.get("encodedDataLength", 0))
+
+
+def upload_resume(driver: WebDriver, resume_path: str) -> int:
+    """
+    Uploads the prepared resume through the profile's file input.
+
+    Args:
+        driver: The webdriver instance.
+        resume_path: The configured resume path.
+
+    Returns:
+        Bytes uploaded that the CDP events don't show (the file itself).
+    """
+    artifact = prepare_resume(resume_path)
+    add_report_section(driver, "resume", artifact.summary())
+    upload_input = WebDriverWait(driver, 15).until(
+        EC.presence_of_element_located((By.XPATH, "//input[@type='file']"))
+    )
+    upload_input.send_keys(artifact.path)
+    print(f"📎 Resume re-uploaded ({artifact.bytes / 1024:.0f} KB).")
+    return artifact.bytes
+
+
+def open_section_editor(driver: WebDriver, edit_selectors: List[str]) -> None:
+    """
+    Opens a profile section's editor by clicking its edit control.
+
+    Args:
+        driver: The webdriver instance, on the profile page.
+        edit_selectors: XPaths of the section's edit control, tried in order.
+
+    Raises:
+        Exception: If no edit control is found.
+    """
+    for selector in edit_selectors:
+        elements = driver.find_elements(By.XPATH, selector)
+        if elements:
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();",
+                                  elements[0])
+            return
+    raise Exception(f"No edit control found ({edit_selectors[0]})")
+
+
+def save_section_editor(driver: WebDriver) -> None:
+    """
+    Saves the open section editor and waits for it to close.
+
+    Args:
+        driver: The webdriver instance.
+    """
+    wait = WebDriverWait(driver, 15)
+    save = wait.until(EC.element_to_be_clickable((By.XPATH, " | ".join(SAVE_BUTTON_SELECTORS))))
+    save.click()
+    # The editor closes once the save request has completed
+    wait.until(EC.staleness_of(save))
+
+
+def resave_section(driver: WebDriver, action: str) -> int:
+    """
+    Opens a profile section's editor and saves it without changes.
+
+    Args:
+        driver: The webdriver instance.
+        action: A SECTION_EDIT_SELECTORS key.
+
+    Returns:
+        0; the save request's body is in the CDP events.
+    """
+    open_section_editor(driver, SECTION_EDIT_SELECTORS[action])
+    save_section_editor(driver)
+    print(f"💾 Re-saved the profile section unchanged ({action}).")
+    return 0
+
+
+ACTIONS: Dict[str, Callable[[WebDriver, str], int]] = {
+    "headline_resave": lambda driver, resume_path: resave_section(driver, "headline_resave"),
+    "summary_resave": lambda driver, resume_path: resave_section(driver, "summary_resave"),
+    FALLBACK_ACTION: upload_resume,
+}
+
+
+def _state_path() -> str:
+    return os.path.expanduser(os.getenv("REFRESH_STRATEGY_STATE", "~/.naukri-automation/refresh_strategy.json"))
+
+
+def _load_state() -> Dict:
+    try:
+        with open(_state_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state: Dict) -> None:
+    path = _state_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _average(stats: Dict, key: str) -> float:
+    measured = stats.get("measured", 0)
+    return stats.get(key, 0) / measured if measured else 0.0
+
+
+def _retired(stats: Dict) -> bool:
+    return stats.get("streak", 0) >= RETIRE_AFTER and time.time() - stats.get("last_attempt", 0) < RETRY_AFTER_SECONDS
+
+
+def plan_actions(account_id: str, mode: Optional[str] = None) -> List[str]:
+    """
+    Orders the refresh actions to try for an account.
+
+    Args:
+        account_id: The account.
+        mode: REFRESH_STRATEGY; read from the environment if not given.
+
+    Returns:
+        Action names, cheapest first, always ending with resume_upload.
+    """
+    mode = mode or refresh_strategy_mode()
+    if mode == FALLBACK_ACTION:
+        return [FALLBACK_ACTION]
+    if mode != "auto":
+        return [mode, FALLBACK_ACTION]
+    history = _load_state().get(account_id, {})
+    candidates = [action for action in ACTIONS if action != FALLBACK_ACTION
+                  and not _retired(history.get(action, {}))]
+    # Untried actions cost nothing yet, so each gets tried once; then bytes decide, latency breaks ties
+    candidates.sort(key=lambda action: (_average(history.get(action, {}), "bytes"),
+                                        _average(history.get(action, {}), "seconds")))
+    return candidates + [FALLBACK_ACTION]
+
+
+def _record(account_id: str, action: str, attempt: Dict) -> None:
+    with _lock:
+        state = _load_state()
+        stats = state.setdefault(account_id, {}).setdefault(action, {})
+        stats["attempts"] = stats.get("attempts", 0) + 1
+        stats["last_attempt"] = time.time()
+        outcome = attempt["outcome"]
+        stats[outcome] = stats.get(outcome, 0) + 1
+        if outcome != "failed":
+            stats["measured"] = stats.get("measured", 0) + 1
+            stats["seconds"] = stats.get("seconds", 0.0) + attempt["seconds"]
+            stats["bytes"] = stats.get("bytes", 0) + attempt["sent_bytes"] + attempt["received_bytes"]
+        stats["streak"] = 0 if outcome == "confirmed" else \
+            stats.get("streak", 0) + (0 if outcome in ("unverified", "no_marker") else 1)
+        try:
+            _save_state(state)
+        except OSError as e:
+            print(f"⚠️ Could not save refresh strategy state: {e}")
+
+
+def run_action(driver: WebDriver, action: str, resume_path: str) -> Dict:
+    """
+    Runs one refresh action, measuring it and checking the freshness marker.
+
+    Args:
+        driver: The webdriver instance, on the profile page.
+        action: An ACTIONS key.
+        resume_path: The configured resume path.
+
+    Returns:
+        Dict with action, outcome ('confirmed', 'unconfirmed', 'unverified',
+        'no_marker' or 'failed'), seconds, requests, sent and received bytes,
+        and the marker before and after.
+    """
+    before = read_freshness(driver)
+    meter = ActionMeter()
+    drain_events(driver)
+    subscribe(driver, meter.on_event)
+    start = time.time()
+    error = None
+    extra_bytes = 0
+    try:
+        extra_bytes = ACTIONS[action](driver, resume_path)
+        after = wait_for_freshness_change(driver, before)
+    except Exception as e:
+        error, after = e, None
+    seconds = time.time() - start
+    drain_events(driver)
+    unsubscribe(driver, meter.on_event)
+
+    if error:
+        outcome = "failed"
+    elif not before or not after:
+        outcome = "no_marker"
+    else:
+        outcome = {True: "confirmed", False: "unconfirmed", None: "unverified"}[freshness_changed(before, after)]
+    attempt = {
+        "action": action,
+        "outcome": outcome,
+        "seconds": round(seconds, 2),
+        "requests": meter.requests,
+        "sent_bytes": meter.sent_bytes + extra_bytes,
+        "received_bytes": meter.received_bytes,
+        "marker_before": before,
+        "marker_after": after,
+    }
+    if error:
+        attempt["error"] = str(error)[:200]
+    return attempt
+
+
+def refresh_with_strategy(driver: WebDriver, account_id: str, resume_path: str) -> Dict:
+    """
+    Refreshes the profile with the cheapest action that works for the account.
+
+    The profile page is loaded first, so the marker is read from it whichever
+    authenticated page the login ended on.
+
+    Args:
+        driver: The webdriver instance.
+        account_id: The account, for per-account action history.
+        resume_path: The configured resume path.
+
+    Returns:
+        Dict with the 'action' that ran last, its 'outcome', every
+        'attempts' entry, and the marker before the first and after the
+        last attempt. Actions are tried until one is confirmed, unverified
+        (marker already "Today") or 'no_marker'; an 'unconfirmed' or 'failed'
+        outcome means the fallback didn't work either.
+    """
+    navigate(driver, "profile")
+    attempts = []
+    for action in plan_actions(account_id):
+        attempt = run_action(driver, action, resume_path)
+        attempts.append(attempt)
+        _record(account_id, action, attempt)
+        print(f"🔄 {action}: {attempt['outcome']} in {attempt['seconds']:.1f}s, "
+              f"{(attempt['sent_bytes'] + attempt['received_bytes']) / 1024:.0f} KB, "
+              f"marker {attempt['marker_before']!r} -> {attempt['marker_after']!r}")
+        # Without a usable marker another action couldn't be confirmed either
+        if attempt["outcome"] in ("confirmed", "unverified", "no_marker"):
+            break
+    return {"action": attempts[-1]["action"], "outcome": attempts[-1]["outcome"], "attempts": attempts,
+            "marker_before": attempts[0]["marker_before"], "marker_after": attempts[-1]["marker_after"]}
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Remote WebDriver execution for the Naukri automation.
+
+The 'remote' driver backend starts Chrome on a Selenium Grid or on any
+remote WebDriver endpoint (a bare chromedriver works too) instead of on this
+host, so refresh capacity grows by adding nodes. Every endpoint has its own
+concurrency limit; a new session goes to the healthy endpoint with the most
+free capacity, and an endpoint that fails its status check or session
+creation is skipped for a cool-down period while the session is retried
+elsewhere. The login and refresh flows are unchanged.
+
+A Selenium Grid hub balances its own nodes, so list it once with the total
+session count. For testing without Docker, `python remote_grid.py serve`
+starts a stand-in grid of local chromedriver processes.
+
+Usage:
+    python remote_grid.py serve [--nodes 3] [--base-port 9600] [--sessions 2]
+    python remote_grid.py status
+
+Configuration (environment variables):
+    REMOTE_WEBDRIVER_URLS: Comma-separated endpoints, each optionally
+        followed by |<max sessions>, e.g. http://hub:4444|8,http://10.0.0.5:9515|2.
+    REMOTE_NODE_CONCURRENCY: Sessions per endpoint without an explicit limit (default: 2).
+    REMOTE_NODE_COOLDOWN: Seconds a failed endpoint is skipped (default: 60).
+    REMOTE_ACQUIRE_TIMEOUT: Seconds to wait for free capacity (default: 300).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+import weakref
+from typing import List, Optional
+
+import urllib3
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.command import Command
+
+
+class RemoteChromeDriver(webdriver.Remote):
+    """webdriver.Remote with the Chrome-specific commands the flows use (CDP and logs)."""
+
+    def __init__(self, command_executor: str, options: webdriver.ChromeOptions):
+        connection = ChromiumRemoteConnection(command_executor, vendor_prefix="goog", browser_name="chrome")
+        super().__init__(command_executor=connection, options=options)
+
+    def get_log(self, log_type: str):
+        return self.execute(Command.GET_LOG, {"type": log_type})["value"]
+
+
+class GridNode:
+    """One remote WebDriver endpoint and its session accounting."""
+
+    def __init__(self, url: str, max_sessions: int):
+        self.url = url.rstrip("/")
+        self.max_sessions = max_sessions
+        self.active = 0
+        self.failures = 0
+        self.unavailable_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return self.active < self.max_sessions and time.time() >= self.unavailable_until
+
+    def is_healthy(self, timeout: float = 5) -> bool:
+        """Checks the endpoint's /status; both Grid and chromedriver report 'ready'."""
+        try:
+            with urllib.request.urlopen(f"{self.url}/status", timeout=timeout) as response:
+                return bool(json.load(response).get("value", {}).get("ready", True))
+        except Exception:
+            return False
+
+    def __repr__(self) -> str:
+        return f"GridNode({self.url}, {self.active}/{self.max_sessions})"
+
+
+class NodePool:
+    """Chooses endpoints for new sessions within their concurrency limits."""
+
+    def __init__(self, nodes: List[GridNode], cooldown: float = 60):
+        self.nodes = nodes
+        self.cooldown = cooldown
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout: float = 300, exclude: Optional[List[GridNode]] = None) -> GridNode:
+        """
+        Reserves a session slot on the least-loaded available endpoint.
+
+        Args:
+            timeout: Maximum seconds to wait for free capacity.
+            exclude: Endpoints not to use (already failed for this session).
+
+        Returns:
+            The reserved node; give it back with release().
+
+        Raises:
+            TimeoutError: If no endpoint had capacity in time.
+        """
+        exclude = exclude or []
+        deadline = time.time() + timeout
+        with self._condition:
+            while True:
+                candidates = [n for n in self.nodes if n.available and n not in exclude]
+                if candidates:
+                    node = min(candidates, key=lambda n: (n.active / n.max_sessions, n.failures))
+                    node.active += 1
+                    return node
+                remaining = deadline - time.time()
+                if remaining <= 0 or all(n in exclude for n in self.nodes):
+                    raise TimeoutError("No remote WebDriver endpoint has free capacity")
+                # Wake up for released slots or when a cool-down ends
+                self._condition.wait(min(remaining, 5))
+
+    def release(self, node: GridNode, lost: bool = False) -> None:
+        """
+        Frees a session slot.
+
+        Args:
+            node: The node from acquire().
+            lost: The node failed; skip it for the cool-down period.
+        """
+        with self._condition:
+            node.active = max(0, node.active - 1)
+            if lost:
+                node.failures += 1
+                node.unavailable_until = time.time() + self.cooldown
+                print(f"⚠️ Remote endpoint {node.url} unavailable, skipping it for {self.cooldown:.0f}s")
+            else:
+                node.failures = 0
+            self._condition.notify_all()
+
+
+def parse_nodes(spec: str, default_sessions: int) -> List[GridNode]:
+    """
+    Parses REMOTE_WEBDRIVER_URLS.
+
+    Args:
+        spec: Comma-separated 'url' or 'url|max_sessions' entries.
+        default_sessions: Limit for entries without one.
+
+    Returns:
+        The configured nodes.
+    """
+    nodes = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        url, _, limit = entry.partition("|")
+        nodes.append(GridNode(url.strip(), int(limit) if limit.strip() else default_sessions))
+    return nodes
+
+
+_pool: Optional[NodePool] = None
+_pool_lock = threading.Lock()
+_driver_nodes: "weakref.WeakKeyDictionary[webdriver.Remote, GridNode]" = weakref.WeakKeyDictionary()
+
+
+def get_node_pool() -> NodePool:
+    """
+    Returns the process-wide pool built from the environment.
+
+    Returns:
+        The shared NodePool, so concurrent accounts respect the same limits.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            spec = os.getenv("REMOTE_WEBDRIVER_URLS", "")
+            nodes = parse_nodes(spec, int(os.getenv("REMOTE_NODE_CONCURRENCY", "2")))
+            if not nodes:
+                raise ValueError("REMOTE_WEBDRIVER_URLS is required for the remote driver backend")
+            _pool = NodePool(nodes, cooldown=float(os.getenv("REMOTE_NODE_COOLDOWN", "60")))
+        return _pool
+
+
+def create_remote_driver(chrome_options: webdriver.ChromeOptions) -> RemoteChromeDriver:
+    """
+    Starts a Chrome session on the best available remote endpoint.
+
+    Endpoints that fail the status check or session creation are marked lost
+    and the session is retried on the next one.
+
+    Args:
+        chrome_options: The ChromeOptions built by build_chrome_options().
+
+    Returns:
+        A remote Chrome driver.
+    """
+    pool = get_node_pool()
+    timeout = float(os.getenv("REMOTE_ACQUIRE_TIMEOUT", "300"))
+    # The local Chrome path means nothing on a remote node
+    chrome_options.binary_location = ""
+
+    tried: List[GridNode] = []
+    last_error: Optional[Exception] = None
+    while len(tried) < len(pool.nodes):
+        try:
+            node = pool.acquire(timeout, exclude=tried)
+        except TimeoutError as e:
+            last_error = last_error or e
+            break
+        tried.append(node)
+        if not node.is_healthy():
+            last_error = Exception(f"{node.url} failed its status check")
+            pool.release(node, lost=True)
+            continue
+        try:
+            print(f"🛰️ Starting remote Chrome on {node.url} ({node.active}/{node.max_sessions} sessions)")
+            driver = RemoteChromeDriver(node.url, chrome_options)
+        except Exception as e:
+            print(f"⚠️ Session creation on {node.url} failed: {e}")
+            last_error = e
+            pool.release(node, lost=True)
+            continue
+        _driver_nodes[driver] = node
+        return driver
+
+    raise Exception(f"No remote WebDriver endpoint could start Chrome: {last_error}")
+
+
+# Errors meaning the endpoint itself went away, as opposed to a failure of the page or flow
+CONNECTION_FAILURE_MARKERS = ("max retries exceeded", "connection refused", "connection reset",
+                              "connection aborted", "remote end closed connection", "failed to establish",
+                              "invalid session id")
+
+
+def is_connection_failure(error) -> bool:
+    """
+    Returns whether an error (exception or message) means the WebDriver endpoint was lost.
+
+    Args:
+        error: An exception, an error message or None.
+    """
+    if error is None:
+        return False
+    if isinstance(error, (ConnectionError, urllib3.exceptions.HTTPError)):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in CONNECTION_FAILURE_MARKERS)
+
+
+def release_remote_node(driver, error=None) -> None:
+    """
+    Returns a finished session's slot to the pool. Call after quitting the driver.
+
+    Args:
+        driver: The webdriver instance; non-remote drivers are ignored.
+        error: The run's or quit()'s error, if any; a connection failure marks
+            the node lost so new sessions avoid it for the cool-down.
+    """
+    node = _driver_nodes.pop(driver, None)
+    if node is not None and _pool is not None:
+        lost = is_connection_failure(error)
+        if lost:
+            print(f"⚠️ Lost the session on {node.url}: {error}")
+        _pool.release(node, lost=lost)
+
+
+def serve_local_grid(nodes: int, base_port: int, sessions: int) -> None:
+    """
+    Runs a stand-in grid of local chromedriver processes until interrupted.
+
+    Args:
+        nodes: Number of chromedriver endpoints.
+        base_port: Port of the first endpoint.
+        sessions: Concurrency limit to advertise per endpoint.
+    """
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    chromedriver = ChromeDriverManager().install()
+    processes = []
+    urls = []
+    try:
+        for index in range(nodes):
+            port = base_port + index
+            processes.append(subprocess.Popen([chromedriver, f"--port={port}"],
+                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            urls.append(f"http://127.0.0.1:{port}|{sessions}")
+        print(f"🛰️ Local grid running with {nodes} chromedriver endpoints")
+        print(f"export DRIVER_BACKEND=remote REMOTE_WEBDRIVER_URLS={','.join(urls)}")
+        while all(p.poll() is None for p in processes):
+            time.sleep(1)
+        print("❌ A chromedriver endpoint exited")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Remote WebDriver endpoints for the Naukri automation")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve = subparsers.add_parser("serve", help="Run a local stand-in grid of chromedriver endpoints")
+    serve.add_argument("--nodes", type=int, default=3)
+    serve.add_argument("--base-port", type=int, default=9600)
+    serve.add_argument("--sessions", type=int, default=2)
+    subparsers.add_parser("status", help="Check the endpoints in REMOTE_WEBDRIVER_URLS")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve_local_grid(args.nodes, args.base_port, args.sessions)
+        return 0
+
+    healthy = 0
+    for node in get_node_pool().nodes:
+        ok = node.is_healthy()
+        healthy += ok
+        print(f"{'✅' if ok else '❌'} {node.url} (max {node.max_sessions} sessions)")
+    return 0 if healthy else 1
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+Resume artifacts for the Naukri automation.
+
+refresh_profile() used to upload the configured resume as-is on every run.
+The artifact manager prepares each account's resume once per content change
+instead: it validates the file, optimises a PDF losslessly (document info and
+XMP metadata removed, streams recompressed, objects packed into object
+streams) and stores the result in a cache keyed by the SHA-256 of the
+original and its file name. The upload step is handed the cached file, which
+keeps the original's file name because Naukri shows it to recruiters; the
+same bytes under two names are two artifacts, so each account keeps its own.
+
+A small index maps each source path to its size, modification time and hash,
+so an unchanged resume is not even re-read on later runs.
+
+Optimisation needs pikepdf (in requirements.txt); without it the validated
+original is cached unchanged. DOC, DOCX and RTF resumes are validated and
+cached but not optimised.
+
+Configuration (environment variables):
+    RESUME_FILE_PATH: Resume to upload, unless an account in ACCOUNTS_FILE sets resume_path.
+    RESUME_CACHE_DIR: Where prepared resumes are cached (default: ~/.naukri-automation/resumes).
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
+
+# Naukri rejects resumes larger than this
+RESUME_MAX_BYTES = 2 * 1024 * 1024
+RESUME_EXTENSIONS = (".pdf", ".doc", ".docx", ".rtf")
+
+INDEX_FILE = "index.json"
+
+_lock = threading.Lock()
+
+
+class ResumeArtifact:
+    """A validated, optimised resume ready for upload."""
+
+    def __init__(self, path: str, source: str, sha256: str, original_bytes: int, optimizer: Optional[str],
+                 cached: bool):
+        self.path = path
+        self.source = source
+        self.sha256 = sha256
+        self.original_bytes = original_bytes
+        self.bytes = os.path.getsize(path)
+        self.optimizer = optimizer
+        self.cached = cached
+
+    def summary(self) -> Dict:
+        return {
+            "source": self.source,
+            "sha256": self.sha256,
+            "original_bytes": self.original_bytes,
+            "upload_bytes": self.bytes,
+            "saved_bytes": self.original_bytes - self.bytes,
+            "optimizer": self.optimizer,
+            "cache_hit": self.cached,
+        }
+
+
+def _cache_dir() -> str:
+    return os.path.expanduser(os.getenv("RESUME_CACHE_DIR", "~/.naukri-automation/resumes"))
+
+
+@contextmanager
+def _locked_index() -> Iterator[None]:
+    # Runs for several accounts share the cache; hold the lock across load, prepare and save
+    os.makedirs(_cache_dir(), exist_ok=True)
+    with _lock, open(os.path.join(_cache_dir(), f"{INDEX_FILE}.lock"), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _load_index() -> Dict:
+    try:
+        with open(os.path.join(_cache_dir(), INDEX_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"sources": {}, "artifacts": {}}
+
+
+def _save_index(index: Dict) -> None:
+    path = os.path.join(_cache_dir(), INDEX_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _artifact_key(sha256: str, source: str) -> str:
+    return f"{sha256}:{os.path.basename(source)}"
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def validate_resume_file(path: str) -> None:
+    """
+    Checks that a resume is a non-empty, complete document of a type Naukri accepts.
+
+    Args:
+        path: Absolute resume path.
+
+    Raises:
+        ValueError: If the resume can't be uploaded.
+        OSError: If it can't be read.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in RESUME_EXTENSIONS:
+        raise ValueError(f"Resume must be one of {', '.join(RESUME_EXTENSIONS)}: {path}")
+    size = os.path.getsize(path)
+    if size == 0:
+        raise ValueError(f"Resume is empty: {path}")
+    if extension != ".pdf":
+        return
+    with open(path, "rb") as f:
+        header = f.read(5)
+        f.seek(max(0, size - 1024))
+        tail = f.read()
+    if header != b"%PDF-":
+        raise ValueError(f"Resume does not look like a PDF: {path}")
+    if b"%%EOF" not in tail:
+        raise ValueError(f"Resume PDF is truncated (no %%EOF marker): {path}")
+
+
+def optimize_pdf(source: str, destination: str) -> Optional[str]:
+    """
+    Writes a losslessly optimised copy of a PDF.
+
+    Page content, fonts and images are kept as they are; only metadata is
+    removed and streams are recompressed and packed.
+
+    Args:
+        source: The original PDF.
+        destination: Where to write the optimised PDF.
+
+    Returns:
+        The optimiser used, or None if the original was copied unchanged
+        (pikepdf missing, PDF encrypted or not smaller after optimisation).
+
+    Raises:
+        ValueError: If pikepdf can't parse the PDF.
+    """
+    if pikepdf is None:
+        shutil.copyfile(source, destination)
+        return None
+    try:
+        with pikepdf.open(source) as pdf:
+            if pdf.is_encrypted:
+                shutil.copyfile(source, destination)
+                return None
+            if "/Metadata" in pdf.Root:
+                del pdf.Root.Metadata
+            if "/Info" in pdf.trailer:
+                del pdf.trailer.Info
+            pdf.save(destination, compress_streams=True, recompress_flate=True,
+                     object_stream_mode=pikepdf.ObjectStreamMode.generate)
+    except pikepdf.PdfError as e:
+        raise ValueError(f"Resume PDF could not be parsed: {e}") from e
+    if os.path.getsize(destination) >= os.path.getsize(source):
+        shutil.copyfile(source, destination)
+        return None
+    return f"pikepdf {pikepdf.__version__}"
+
+
+def prepare_resume(path: str) -> ResumeArtifact:
+    """
+    Returns the upload-ready artifact for a resume, preparing it on the first call after a change.
+
+    Args:
+        path: The configured resume path.
+
+    Returns:
+        The cached artifact.
+
+    Raises:
+        ValueError: If the resume can't be uploaded.
+        OSError: If it can't be read.
+    """
+    source = os.path.abspath(os.path.expanduser(path))
+    stat = os.stat(source)
+    with _locked_index():
+        index = _load_index()
+        known = index["sources"].get(source)
+        if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+            artifact = index["artifacts"].get(_artifact_key(known["sha256"], source))
+            if artifact and os.path.exists(artifact["path"]):
+                return ResumeArtifact(artifact["path"], source, known["sha256"], artifact["original_bytes"],
+                                      artifact["optimizer"], cached=True)
+
+        sha256 = _sha256(source)
+        index["sources"][source] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        key = _artifact_key(sha256, source)
+        artifact = index["artifacts"].get(key)
+        if artifact and os.path.exists(artifact["path"]):
+            # Same content and name under a new path or timestamp
+            _save_index(index)
+            return ResumeArtifact(artifact["path"], source, sha256, artifact["original_bytes"],
+                                  artifact["optimizer"], cached=True)
+
+        validate_resume_file(source)
+        # Keep the original file name: Naukri shows it on the profile
+        directory = os.path.join(_cache_dir(), sha256[:16])
+        os.makedirs(directory, exist_ok=True)
+        destination = os.path.join(directory, os.path.basename(source))
+        # A run killed mid-write must not leave a partial file where the index will point
+        tmp_path = f"{destination}.{os.getpid()}.tmp"
+        try:
+            if source.lower().endswith(".pdf"):
+                optimizer = optimize_pdf(source, tmp_path)
+            else:
+                shutil.copyfile(source, tmp_path)
+                optimizer = None
+            if os.path.getsize(tmp_path) > RESUME_MAX_BYTES:
+                raise ValueError(f"Resume is {os.path.getsize(tmp_path) / 1024 / 1024:.1f} MB, "
+                                 f"Naukri accepts up to {RESUME_MAX_BYTES // 1024 // 1024} MB: {source}")
+            os.replace(tmp_path, destination)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        index["artifacts"][key] = {"path": destination, "original_bytes": stat.st_size, "optimizer": optimizer}
+        _save_index(index)
+        prepared = ResumeArtifact(destination, source, sha256, stat.st_size, optimizer, cached=False)
+    if optimizer:
+        print(f"📄 Resume optimised: {prepared.original_bytes / 1024:.0f} KB -> {prepared.bytes / 1024:.0f} KB")
+    else:
+        print(f"📄 Resume validated and cached ({prepared.bytes / 1024:.0f} KB"
+              f"{', install pikepdf to optimise it' if pikepdf is None and source.lower().endswith('.pdf') else ''})")
+    return prepared
@@ -62,17 +62,17 @@ def main():
     print("\n✅ Environment check passed!")
     
     # Check if resume file exists
-    resume_path = "/Users/mac/Documents/Job Material/Prakhar_PM_resume.pdf"
-    if not os.path.exists(resume_path):
-        print(f"⚠️ Resume file not found at: {resume_path}")
-        print("💡 Please update the resume path in main.py")
+    resume_path = os.getenv("RESUME_FILE_PATH", "")
+    if not os.path.exists(os.path.expanduser(resume_path)):
+        print(f"⚠️ Resume file not found at: {resume_path or '(RESUME_FILE_PATH not set)'}")
+        print("💡 Set RESUME_FILE_PATH in .env")
         
         # Ask for alternative path
         alt_path = input("📄 Enter path to your resume file (or press Enter to skip): ").strip()
         if alt_path and os.path.exists(alt_path):
             print(f"✅ Using resume: {alt_path}")
-            # Update the path in main.py temporarily
-            update_resume_path(alt_path)
+            # main.py reads the path from the environment; load_dotenv() won't override it
+            os.environ["RESUME_FILE_PATH"] = alt_path
         else:
             print("⚠️ Continuing without resume upload...")
     
@@ -92,23 +92,6 @@ def main():
         print("4. Check if Naukri.com is accessible")
         sys.exit(1)
 
-def update_resume_path(new_path):
-    """Update resume path in main.py."""
-    try:
-        with open('main.py', 'r') as f:
-            content = f.read()
-        
-        # Replace the hardcoded path
-        old_path = "/Users/mac/Documents/Job Material/Prakhar_PM_resume.pdf"
-        content = content.replace(old_path, new_path)
-        
-        with open('main.py', 'w') as f:
-            f.write(content)
-        
-        print(f"✅ Updated resume path to: {new_path}")
-    except Exception as e:
-        print(f"⚠️ Could not update resume path: {e}")
-
 if __name__ == "__main__":
     main()
 
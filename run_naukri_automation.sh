@@ -52,6 +52,19 @@ if [ ! -f ".env" ]; then
     exit 1
 fi
 
+# Skip the run when the preflight probe reports no-go (only with PREFLIGHT=true in .env)
+log_message "🛫 Running preflight probe..."
+python preflight.py --if-enabled 2>&1 | tee -a "$LOG_FILE"
+PREFLIGHT_CODE=${PIPESTATUS[0]}
+# 3 is preflight.NO_GO_EXIT_CODE; any other failure is the probe's own and doesn't cancel the run
+if [ $PREFLIGHT_CODE -eq 3 ]; then
+    log_message "⏭️ Preflight reported no-go, skipping this run"
+    deactivate
+    exit 0
+elif [ $PREFLIGHT_CODE -ne 0 ]; then
+    log_message "⚠️ Preflight failed with exit code $PREFLIGHT_CODE, running anyway"
+fi
+
 # Run the Python script
 log_message "🐍 Running Naukri automation script..."
 python main.py 2>&1 | tee -a "$LOG_FILE"
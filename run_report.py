@@ -0,0 +1,150 @@
+"""
+Structured per-run output for the Naukri automation.
+
+The reports printed at the end of a run (network savings, page loads,
+injection overhead, cache, traffic) are also collected into one JSON
+document per run, together with how long each phase (setup, login,
+refresh) took, counted events such as retries and CAPTCHAs, and the run's
+outcome, so runs can be compared and aggregated without parsing console
+output.
+
+Configuration (environment variables):
+    RUN_REPORT_DIR: Directory for run reports (default: logs). Set to an
+        empty value to disable.
+"""
+
+import json
+import os
+import time
+import weakref
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from traffic_accounting import set_traffic_phase
+
+
+_reports: "weakref.WeakKeyDictionary[WebDriver, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_phase_starts: "weakref.WeakKeyDictionary[WebDriver, Tuple[Optional[str], float]]" = weakref.WeakKeyDictionary()
+
+
+def start_run_report(driver: WebDriver, account_id: str) -> None:
+    """
+    Starts the report for a driver's run.
+
+    Args:
+        driver: The webdriver instance.
+        account_id: The account the run belongs to.
+    """
+    _reports[driver] = {
+        "account_id": account_id,
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "succeeded": False,
+        "phases": {},
+        "events": {},
+    }
+    _phase_starts[driver] = (None, time.time())
+
+
+def _close_phase(driver: WebDriver, report: Dict[str, Any]) -> None:
+    phase, started = _phase_starts.pop(driver, (None, time.time()))
+    if phase:
+        phases = report.setdefault("phases", {})
+        phases[phase] = round(phases.get(phase, 0.0) + time.time() - started, 3)
+
+
+def set_run_phase(driver: WebDriver, phase: str) -> None:
+    """
+    Marks the start of a phase of the driver's run.
+
+    Time and network traffic from now on are attributed to this phase.
+
+    Args:
+        driver: The webdriver instance.
+        phase: Phase name: 'setup', 'login' or 'refresh'.
+    """
+    report = _reports.setdefault(driver, {})
+    current = _phase_starts.get(driver, (None, 0))[0]
+    if current != phase:
+        _close_phase(driver, report)
+        _phase_starts[driver] = (phase, time.time())
+    set_traffic_phase(driver, phase)
+
+
+def count_run_event(driver: WebDriver, name: str, count: int = 1) -> None:
+    """
+    Counts an event of the driver's run, such as a retry or a CAPTCHA.
+
+    Args:
+        driver: The webdriver instance.
+        name: Event name.
+        count: How many to add.
+    """
+    events = _reports.setdefault(driver, {}).setdefault("events", {})
+    events[name] = events.get(name, 0) + count
+
+
+def mark_run_succeeded(driver: WebDriver) -> None:
+    """Marks the driver's run as having refreshed the profile."""
+    _reports.setdefault(driver, {})["succeeded"] = True
+
+
+def record_run_error(driver: WebDriver, error: BaseException) -> None:
+    """
+    Records the error that failed the driver's run. The first error is kept.
+
+    Args:
+        driver: The webdriver instance.
+        error: The exception.
+    """
+    report = _reports.setdefault(driver, {})
+    report.setdefault("error", {
+        "type": type(error).__name__,
+        "message": str(error)[:500],
+        "phase": _phase_starts.get(driver, (None, 0))[0],
+    })
+
+
+def add_report_section(driver: WebDriver, name: str, data: Any) -> None:
+    """
+    Adds a section to the driver's run report. Empty sections are skipped.
+
+    Args:
+        driver: The webdriver instance.
+        name: Section name.
+        data: JSON-serialisable section content.
+    """
+    if data:
+        _reports.setdefault(driver, {})[name] = data
+
+
+def finish_run_report(driver: WebDriver) -> Optional[Dict[str, Any]]:
+    """
+    Completes the driver's run report and writes it to RUN_REPORT_DIR.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        The report, or None if the driver had none.
+    """
+    report = _reports.pop(driver, None)
+    if not report:
+        return None
+    _close_phase(driver, report)
+    report["finished_at"] = datetime.now().isoformat(timespec="seconds")
+
+    directory = os.getenv("RUN_REPORT_DIR", "logs")
+    if not directory:
+        return report
+    account_id = report.get("account_id", "default")
+    path = os.path.join(directory, f"run-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{account_id}.json")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"🧾 Run report written to {path}")
+    except OSError as e:
+        print(f"⚠️ Could not write run report: {e}")
+    return report
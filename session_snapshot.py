@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Encrypted browser-session snapshots for ephemeral runners.
+
+GitHub Actions runners and containers start with an empty browser, so every
+run pays for a cold start and a full login. This module exports the minimal
+authenticated state (naukri.com cookies, local storage and a few small
+profile files) into a compressed, AES-GCM encrypted archive with integrity
+and expiry metadata, and restores it in setup_driver() so a valid session
+skips the login flow entirely.
+
+Usage:
+    python session_snapshot.py keygen
+    python session_snapshot.py export --out session.snapshot
+    python session_snapshot.py inspect session.snapshot
+
+Configuration (environment variables):
+    SESSION_SNAPSHOT_KEY: Base64 AES-256 key (generate with 'keygen').
+    SESSION_SNAPSHOT_PATH: Snapshot to restore in setup_driver(), if present.
+    SESSION_SNAPSHOT_EXPORT: Where main.py writes a fresh snapshot after login.
+    SESSION_SNAPSHOT_TTL_HOURS: Snapshot lifetime (default: 72).
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+SNAPSHOT_MAGIC = b"NKSNAP1"
+SNAPSHOT_ORIGIN = "https://www.naukri.com"
+COOKIE_DOMAIN_FILTER = "naukri"
+
+# Small profile files worth carrying over when a persistent profile is used
+PROFILE_FILES = [
+    "Local State",
+    os.path.join("Default", "Preferences"),
+    os.path.join("Default", "TransportSecurity"),
+]
+
+_restored: "weakref.WeakKeyDictionary[WebDriver, bool]" = weakref.WeakKeyDictionary()
+
+
+def _aesgcm(key: str):
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        raise Exception("Session snapshots require the 'cryptography' package: pip install cryptography")
+    raw_key = base64.urlsafe_b64decode(key)
+    if len(raw_key) != 32:
+        raise ValueError("SESSION_SNAPSHOT_KEY must be a base64-encoded 32-byte key")
+    return AESGCM(raw_key)
+
+
+def generate_key() -> str:
+    """
+    Generates a new snapshot encryption key.
+
+    Returns:
+        A base64-encoded 32-byte key.
+    """
+    return base64.urlsafe_b64encode(os.urandom(32)).decode()
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def export_snapshot(driver: WebDriver, path: str, key: str, ttl_hours: float = 72,
+                    account_id: str = "default", profile_path: Optional[str] = None) -> Dict:
+    """
+    Writes the driver's authenticated state to an encrypted snapshot.
+
+    The driver should be on a naukri.com page so local storage can be read.
+
+    Args:
+        driver: A logged-in webdriver instance.
+        path: Output file.
+        key: Base64 AES-256 key.
+        ttl_hours: Hours until the snapshot expires.
+        account_id: Account the session belongs to.
+        profile_path: Persistent profile directory to take PROFILE_FILES from.
+
+    Returns:
+        The snapshot manifest.
+    """
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+    cookies = [c for c in cookies if COOKIE_DOMAIN_FILTER in c.get("domain", "")]
+
+    local_storage = {}
+    if driver.current_url.startswith(SNAPSHOT_ORIGIN):
+        local_storage = driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+
+    entries = {
+        "cookies.json": json.dumps(cookies).encode(),
+        "local_storage.json": json.dumps(local_storage).encode(),
+    }
+    if profile_path:
+        for relative in PROFILE_FILES:
+            file_path = os.path.join(profile_path, relative)
+            if os.path.isfile(file_path):
+                with open(file_path, "rb") as f:
+                    entries[f"profile/{relative}"] = f.read()
+
+    created = datetime.now(timezone.utc)
+    manifest = {
+        "version": 1,
+        "account_id": account_id,
+        "origin": SNAPSHOT_ORIGIN,
+        "created_at": created.isoformat(timespec="seconds"),
+        "expires_at": (created + timedelta(hours=ttl_hours)).isoformat(timespec="seconds"),
+        "sha256": {name: hashlib.sha256(data).hexdigest() for name, data in entries.items()},
+    }
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:xz") as tar:
+        _add_bytes(tar, "manifest.json", json.dumps(manifest).encode())
+        for name, data in entries.items():
+            _add_bytes(tar, name, data)
+
+    nonce = os.urandom(12)
+    ciphertext = _aesgcm(key).encrypt(nonce, buffer.getvalue(), SNAPSHOT_MAGIC)
+    with open(path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC + nonce + ciphertext)
+
+    print(f"📦 Exported session snapshot ({len(cookies)} cookies, {len(local_storage)} storage keys, "
+          f"{os.path.getsize(path) / 1024:.1f} KB) to {path}")
+    return manifest
+
+
+def load_snapshot(path: str, key: str, allow_expired: bool = False) -> Dict:
+    """
+    Decrypts and verifies a snapshot.
+
+    Args:
+        path: Snapshot file.
+        key: Base64 AES-256 key.
+        allow_expired: Return expired snapshots instead of raising.
+
+    Returns:
+        Dict with 'manifest', 'cookies', 'local_storage' and 'profile_files'.
+
+    Raises:
+        ValueError: If the file is not a snapshot, fails integrity checks or has expired.
+    """
+    with open(path, "rb") as f:
+        blob = f.read()
+    if not blob.startswith(SNAPSHOT_MAGIC):
+        raise ValueError(f"{path} is not a session snapshot")
+
+    nonce = blob[len(SNAPSHOT_MAGIC):len(SNAPSHOT_MAGIC) + 12]
+    try:
+        plaintext = _aesgcm(key).decrypt(nonce, blob[len(SNAPSHOT_MAGIC) + 12:], SNAPSHOT_MAGIC)
+    except Exception:
+        raise ValueError("Snapshot decryption failed - wrong key or corrupted file")
+
+    files = {}
+    with tarfile.open(fileobj=io.BytesIO(plaintext), mode="r:xz") as tar:
+        for member in tar.getmembers():
+            if member.isfile():
+                files[member.name] = tar.extractfile(member).read()
+
+    manifest = json.loads(files.pop("manifest.json"))
+    for name, digest in manifest["sha256"].items():
+        if hashlib.sha256(files.get(name, b"")).hexdigest() != digest:
+            raise ValueError(f"Snapshot integrity check failed for {name}")
+
+    expires_at = datetime.fromisoformat(manifest["expires_at"])
+    if expires_at < datetime.now(timezone.utc) and not allow_expired:
+        raise ValueError(f"Snapshot expired at {manifest['expires_at']}")
+
+    return {
+        "manifest": manifest,
+        "cookies": json.loads(files["cookies.json"]),
+        "local_storage": json.loads(files["local_storage.json"]),
+        "profile_files": {name[len("profile/"):]: data for name, data in files.items() if name.startswith("profile/")},
+    }
+
+
+def stage_profile_files(snapshot: Dict, profile_path: str) -> None:
+    """
+    Writes the snapshot's profile files into a profile before Chrome starts.
+
+    Existing files are left untouched.
+
+    Args:
+        snapshot: A snapshot from load_snapshot().
+        profile_path: The profile directory.
+    """
+    for relative, data in snapshot["profile_files"].items():
+        target = os.path.join(profile_path, relative)
+        if os.path.exists(target):
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "wb") as f:
+            f.write(data)
+
+
+def settable_cookies(cookies: List[Dict]) -> List[Dict]:
+    """
+    Strips the read-only fields Network.setCookies rejects from getAllCookies output.
+
+    Args:
+        cookies: Cookies from Network.getAllCookies.
+
+    Returns:
+        Cookies accepted by Network.setCookies.
+    """
+    read_only = ("size", "session", "priority", "sourceScheme", "sourcePort", "partitionKey")
+    return [{k: v for k, v in cookie.items() if k not in read_only} for cookie in cookies]
+
+
+def restore_snapshot(driver: WebDriver, snapshot: Dict) -> None:
+    """
+    Loads snapshot cookies and local storage into a fresh browser.
+
+    Args:
+        driver: The webdriver instance, before the first naukri.com navigation.
+        snapshot: A snapshot from load_snapshot().
+    """
+    cookies = settable_cookies(snapshot["cookies"])
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    if snapshot["local_storage"]:
+        # Seed local storage before the page's own scripts run on first visit
+        seed = (
+            "(function(){if(location.origin!==%s||sessionStorage.getItem('__naukriRestored'))return;"
+            "var d=%s;for(var k in d){try{localStorage.setItem(k,d[k]);}catch(e){}}"
+            "sessionStorage.setItem('__naukriRestored','1');})();"
+        ) % (json.dumps(snapshot["manifest"]["origin"]), json.dumps(snapshot["local_storage"]))
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": seed})
+
+    print(f"📦 Restored session snapshot from {snapshot['manifest']['created_at']} "
+          f"({len(cookies)} cookies, {len(snapshot['local_storage'])} storage keys)")
+
+
+def mark_session_restored(driver: WebDriver) -> None:
+    """
+    Records that the driver already holds an authenticated session.
+
+    Args:
+        driver: The webdriver instance.
+    """
+    _restored[driver] = True
+
+
+def session_restored(driver: WebDriver) -> bool:
+    """
+    Returns whether setup_driver() restored a valid session for this driver.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        True if login can be skipped.
+    """
+    return _restored.get(driver, False)
+
+
+def load_configured_snapshot(account_id: str) -> Optional[Dict]:
+    """
+    Loads the snapshot named by SESSION_SNAPSHOT_PATH, if usable for an account.
+
+    Args:
+        account_id: The account being run; snapshots of other accounts are refused.
+
+    Returns:
+        The snapshot, or None when not configured, missing, expired, invalid
+        or exported for another account.
+    """
+    path = os.getenv("SESSION_SNAPSHOT_PATH")
+    key = os.getenv("SESSION_SNAPSHOT_KEY")
+    if not path or not key or not os.path.exists(path):
+        return None
+    try:
+        snapshot = load_snapshot(path, key)
+    except Exception as e:
+        print(f"⚠️ Ignoring session snapshot: {e}")
+        return None
+    if snapshot["manifest"].get("account_id") != account_id:
+        print(f"⚠️ Ignoring session snapshot: it belongs to account "
+              f"'{snapshot['manifest'].get('account_id')}', not '{account_id}'")
+        return None
+    return snapshot
+
+
+def export_configured_snapshot(driver: WebDriver, account_id: str, profile_path: Optional[str] = None) -> None:
+    """
+    Exports a snapshot to SESSION_SNAPSHOT_EXPORT when configured.
+
+    Args:
+        driver: A logged-in webdriver instance.
+        account_id: Account the session belongs to.
+        profile_path: Persistent profile directory, if any.
+    """
+    path = os.getenv("SESSION_SNAPSHOT_EXPORT")
+    key = os.getenv("SESSION_SNAPSHOT_KEY")
+    if not path or not key:
+        return
+    try:
+        ttl_hours = float(os.getenv("SESSION_SNAPSHOT_TTL_HOURS", "72"))
+        export_snapshot(driver, path, key, ttl_hours=ttl_hours, account_id=account_id, profile_path=profile_path)
+    except Exception as e:
+        print(f"⚠️ Could not export session snapshot: {e}")
+
+
+def _inspect(path: str, key: str) -> None:
+    snapshot = load_snapshot(path, key, allow_expired=True)
+    manifest = snapshot["manifest"]
+    expired = datetime.fromisoformat(manifest["expires_at"]) < datetime.now(timezone.utc)
+    print(f"📦 Snapshot: {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+    print(f"👤 Account: {manifest['account_id']}")
+    print(f"🕐 Created: {manifest['created_at']}")
+    print(f"⏳ Expires: {manifest['expires_at']}{' (EXPIRED)' if expired else ''}")
+    print(f"🍪 Cookies: {len(snapshot['cookies'])}")
+    print(f"🗄️ Local storage keys: {len(snapshot['local_storage'])}")
+    print(f"📁 Profile files: {', '.join(snapshot['profile_files']) or 'none'}")
+
+
+def _export(out_path: str, key: str) -> None:
+    from dotenv import load_dotenv
+    from accounts import current_account_id
+    from utility import cleanup, login, setup_driver
+
+    load_dotenv()
+    login_method = os.getenv("LOGIN_METHOD", "email_password").lower()
+    driver = setup_driver()
+    try:
+        if not session_restored(driver):
+            login(driver, login_method,
+                  email=os.getenv("GOOGLE_EMAIL") if login_method == "google" else os.getenv("NAUKRI_EMAIL"),
+                  password=os.getenv("NAUKRI_PASSWORD"),
+                  phone_number=os.getenv("PHONE_NUMBER"))
+        ttl_hours = float(os.getenv("SESSION_SNAPSHOT_TTL_HOURS", "72"))
+        export_snapshot(driver, out_path, key, ttl_hours=ttl_hours, account_id=current_account_id())
+    finally:
+        cleanup(driver)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Export, restore and inspect Naukri session snapshots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("keygen", help="Print a new SESSION_SNAPSHOT_KEY")
+    export_parser = subparsers.add_parser("export", help="Log in and export a snapshot")
+    export_parser.add_argument("--out", default="session.snapshot")
+    inspect_parser = subparsers.add_parser("inspect", help="Verify a snapshot and show its metadata")
+    inspect_parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "keygen":
+        print(generate_key())
+        return 0
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    key = os.getenv("SESSION_SNAPSHOT_KEY")
+    if not key:
+        print("❌ SESSION_SNAPSHOT_KEY is not set")
+        print("💡 Run: python session_snapshot.py keygen")
+        return 1
+
+    try:
+        if args.command == "export":
+            _export(args.out, key)
+        else:
+            _inspect(args.path, key)
+    except Exception as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -58,12 +58,18 @@ def setup_environment():
             print("❌ Phone number is required")
             return False
     
+    resume_path = input("📄 Enter the path to your resume (PDF, DOC, DOCX or RTF): ").strip()
+    if not resume_path:
+        print("❌ Resume path is required")
+        return False
+    
     # Create environment file content
     env_content = f"""# Naukri Automation Environment Variables
 # Generated by setup_env.py
 
 # Login Configuration
 LOGIN_METHOD={login_method}
+RESUME_FILE_PATH={resume_path}
 
 """
     
@@ -98,6 +104,7 @@ PHONE_NUMBER={phone}
             print("🔒 Password: [HIDDEN]")
         elif login_method == "otp":
             print(f"📱 Phone number: {phone}")
+        print(f"📄 Resume: {resume_path}")
             
         print("\n🚀 You can now run: python main.py")
         return True
@@ -113,6 +120,7 @@ def show_current_config():
     
     login_method = os.getenv("LOGIN_METHOD", "Not set")
     print(f"LOGIN_METHOD: {login_method}")
+    print(f"RESUME_FILE_PATH: {os.getenv('RESUME_FILE_PATH', 'Not set')}")
     
     if login_method == "google":
         email = os.getenv("GOOGLE_EMAIL", "Not set")
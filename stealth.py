@@ -0,0 +1,344 @@
+"""
+Pre-document script injection for the Naukri automation.
+
+Scripts run through driver.execute_script() only affect the current document
+and are lost on the next navigation. This module registers named, versioned
+injection bundles once per browser through CDP
+Page.addScriptToEvaluateOnNewDocument, so they run before any page script in
+every document and frame. Each bundle is minified once and cached, and its
+wrapper records how long it took to run so the overhead per navigation can
+be reported.
+
+Configuration (environment variables):
+    INJECTION_BUNDLES: Comma-separated bundle names (default: stealth,instrumentation).
+"""
+
+import json
+import os
+import weakref
+from functools import lru_cache
+from typing import Dict, List
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class InjectionBundle:
+    """A named, versioned script injected into every new document."""
+
+    def __init__(self, name: str, version: str, source: str):
+        self.name = name
+        self.version = version
+        self.source = source
+
+
+STEALTH_SCRIPT = """
+    // Override automation indicators (fixed to avoid redefinition error)
+    try {
+        Object.defineProperty(navigator, 'webdriver', {get: () => false, configurable: true});
+    } catch(e) {
+        // Property already defined, skip
+    }
+    Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5], configurable: true});
+    Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+    Object.defineProperty(navigator, 'permissions', {get: () => ({query: () => Promise.resolve({state: 'granted'})})});
+
+    // Override Chrome runtime
+    if (window.chrome && window.chrome.runtime) {
+        Object.defineProperty(window.chrome.runtime, 'onConnect', {get: () => undefined});
+        Object.defineProperty(window.chrome.runtime, 'onMessage', {get: () => undefined});
+    }
+
+    // Override automation flags
+    try {
+        Object.defineProperty(navigator, 'automation', {get: () => false, configurable: true});
+    } catch(e) {
+        // Property already defined, skip
+    }
+
+    // Mock realistic plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => ({
+            length: 3,
+            0: {name: 'Chrome PDF Plugin', description: 'Portable Document Format'},
+            1: {name: 'Chrome PDF Viewer', description: 'Portable Document Format'},
+            2: {name: 'Native Client', description: 'Native Client Executable'}
+        })
+    });
+
+    // Mock realistic screen properties
+    Object.defineProperty(screen, 'availHeight', {get: () => 1040});
+    Object.defineProperty(screen, 'availWidth', {get: () => 1920});
+    Object.defineProperty(screen, 'colorDepth', {get: () => 24});
+    Object.defineProperty(screen, 'height', {get: () => 1080});
+    Object.defineProperty(screen, 'width', {get: () => 1920});
+
+    // Mock realistic timezone
+    Object.defineProperty(Intl.DateTimeFormat.prototype, 'resolvedOptions', {
+        value: function() { return {timeZone: 'America/New_York'}; }
+    });
+
+    // Override getParameter to hide automation
+    const originalGetParameter = WebGLRenderingContext.prototype.getParameter;
+    WebGLRenderingContext.prototype.getParameter = function(parameter) {
+        if (parameter === 37445) {
+            return 'Intel Inc.';
+        }
+        if (parameter === 37446) {
+            return 'Intel(R) Iris(TM) Graphics 6100';
+        }
+        return originalGetParameter.call(this, parameter);
+    };
+
+    // Mock realistic connection
+    Object.defineProperty(navigator, 'connection', {
+        get: () => ({
+            effectiveType: '4g',
+            rtt: 50,
+            downlink: 10
+        })
+    });
+
+    // Override Date to appear more human
+    const originalDate = Date;
+    Date = class extends originalDate {
+        constructor(...args) {
+            if (args.length === 0) {
+                super(originalDate.now() + Math.random() * 1000);
+            } else {
+                super(...args);
+            }
+        }
+    };
+
+    // Mock realistic battery API
+    if (navigator.getBattery) {
+        navigator.getBattery = () => Promise.resolve({
+            charging: true,
+            chargingTime: 0,
+            dischargingTime: Infinity,
+            level: 0.8
+        });
+    }
+
+    // Override canvas fingerprinting
+    const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
+    HTMLCanvasElement.prototype.toDataURL = function() {
+        const context = this.getContext('2d');
+        if (context) {
+            context.fillStyle = 'rgba(255, 255, 255, 0.01)';
+            context.fillRect(0, 0, 1, 1);
+        }
+        return originalToDataURL.apply(this, arguments);
+    };
+
+    // Mock realistic hardware concurrency
+    Object.defineProperty(navigator, 'hardwareConcurrency', {get: () => 8});
+
+    // Override notification permission
+    Object.defineProperty(Notification, 'permission', {get: () => 'default'});
+
+    // Mock realistic memory
+    Object.defineProperty(navigator, 'deviceMemory', {get: () => 8});
+
+    // Override speech synthesis
+    if (window.speechSynthesis) {
+        Object.defineProperty(window.speechSynthesis, 'getVoices', {
+            value: () => [
+                {name: 'Google US English', lang: 'en-US', default: true},
+                {name: 'Microsoft David Desktop', lang: 'en-US'},
+                {name: 'Microsoft Zira Desktop', lang: 'en-US'}
+            ]
+        });
+    }
+
+    // Remove automation indicators from window
+    delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
+    delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
+    delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
+
+    // Mock realistic touch support
+    Object.defineProperty(navigator, 'maxTouchPoints', {get: () => 0});
+
+    // Override geolocation
+    if (navigator.geolocation) {
+        navigator.geolocation.getCurrentPosition = () => {};
+        navigator.geolocation.watchPosition = () => {};
+    }
+"""
+
+# Hooks the automation itself relies on: uncaught page errors are kept for
+# debugging failed runs.
+INSTRUMENTATION_SCRIPT = """
+window.__naukriErrors = [];
+window.addEventListener('error', function(event) {
+    if (window.__naukriErrors.length < 50) {
+        window.__naukriErrors.push(String(event.message));
+    }
+});
+"""
+
+INJECTION_BUNDLES: Dict[str, InjectionBundle] = {
+    "stealth": InjectionBundle("stealth", "2", STEALTH_SCRIPT),
+    "instrumentation": InjectionBundle("instrumentation", "1", INSTRUMENTATION_SCRIPT),
+}
+
+# Read back after each navigation to measure injection overhead
+INJECTION_TIMINGS_EXPRESSION = "window.__naukriInjected || {}"
+
+# Registered script identifiers per driver: bundle name -> (version, identifier)
+_registered: "weakref.WeakKeyDictionary[WebDriver, Dict[str, tuple]]" = weakref.WeakKeyDictionary()
+_timings: "weakref.WeakKeyDictionary[WebDriver, List[float]]" = weakref.WeakKeyDictionary()
+
+
+def minify_script(source: str) -> str:
+    """
+    Strips comment lines and indentation from a script.
+
+    Newlines are kept so automatic semicolon insertion still works.
+
+    Args:
+        source: JavaScript source.
+
+    Returns:
+        The minified source.
+    """
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        lines.append(line)
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def build_bundle_source(name: str, version: str) -> str:
+    """
+    Returns the minified, timing-wrapped source for a bundle version.
+
+    Args:
+        name: The bundle name.
+        version: The bundle version (part of the cache key).
+
+    Returns:
+        JavaScript ready to pass to Page.addScriptToEvaluateOnNewDocument.
+    """
+    bundle = INJECTION_BUNDLES[name]
+    return (
+        "(function(){var __t0=performance.now();try{\n"
+        + minify_script(bundle.source)
+        + "\n}catch(e){}var __r=window.__naukriInjected=window.__naukriInjected||{};"
+        + f"__r[{json.dumps(name)}]={{v:{json.dumps(version)},ms:performance.now()-__t0}};}})();"
+    )
+
+
+def get_enabled_bundles() -> List[str]:
+    """
+    Returns the names of the bundles to inject.
+
+    Returns:
+        Known bundle names from INJECTION_BUNDLES.
+    """
+    names = os.getenv("INJECTION_BUNDLES", "stealth,instrumentation")
+    enabled = []
+    for name in (n.strip() for n in names.split(",")):
+        if not name:
+            continue
+        if name not in INJECTION_BUNDLES:
+            print(f"⚠️ Unknown injection bundle '{name}', skipping")
+            continue
+        enabled.append(name)
+    return enabled
+
+
+def register_injection_bundles(driver: WebDriver) -> None:
+    """
+    Registers the enabled bundles to run on every new document and frame.
+
+    A bundle already registered at the same version is left alone; an older
+    version is replaced.
+
+    Args:
+        driver: The webdriver instance.
+    """
+    registered = _registered.setdefault(driver, {})
+
+    for name in get_enabled_bundles():
+        bundle = INJECTION_BUNDLES[name]
+        current = registered.get(name)
+        if current and current[0] == bundle.version:
+            continue
+
+        try:
+            if current:
+                driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": current[1]})
+            result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": build_bundle_source(name, bundle.version),
+                "runImmediately": True,
+            })
+            registered[name] = (bundle.version, result.get("identifier"))
+            print(f"💉 Registered injection bundle '{name}' v{bundle.version}")
+        except Exception as e:
+            # Without CDP fall back to the current document only
+            print(f"⚠️ Could not register bundle '{name}' ({e}), applying to current page only")
+            driver.execute_script(build_bundle_source(name, bundle.version))
+
+
+def register_bundles_for_tab(driver: WebDriver) -> None:
+    """
+    Registers the enabled bundles for the window the driver just switched to.
+
+    CDP script registrations belong to one tab, so tabs opened after
+    register_injection_bundles() need their own. Nothing is recorded for
+    replacement: these tabs are short-lived.
+
+    Args:
+        driver: The webdriver instance, switched to the new tab.
+    """
+    for name in get_enabled_bundles():
+        bundle = INJECTION_BUNDLES[name]
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                "source": build_bundle_source(name, bundle.version),
+                "runImmediately": True,
+            })
+        except Exception as e:
+            print(f"⚠️ Could not register bundle '{name}' in new tab: {e}")
+
+
+def record_injection_timings(driver: WebDriver, timings: Dict) -> None:
+    """
+    Records the per-bundle run times read back from a loaded document.
+
+    Args:
+        driver: The webdriver instance.
+        timings: The value of INJECTION_TIMINGS_EXPRESSION for the page.
+    """
+    if not timings:
+        return
+    total_ms = sum(entry.get("ms", 0) for entry in timings.values() if isinstance(entry, dict))
+    _timings.setdefault(driver, []).append(total_ms)
+
+
+def report_injection_overhead(driver: WebDriver) -> Dict:
+    """
+    Prints and returns the injection overhead measured across navigations.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        Dict with navigations, average_ms and max_ms.
+    """
+    samples = _timings.pop(driver, [])
+    if not samples:
+        return {}
+
+    summary = {
+        "navigations": len(samples),
+        "average_ms": sum(samples) / len(samples),
+        "max_ms": max(samples),
+    }
+    print(f"💉 Injection overhead: {summary['average_ms']:.2f} ms/navigation "
+          f"(max {summary['max_ms']:.2f} ms over {summary['navigations']} navigations)")
+    return summary
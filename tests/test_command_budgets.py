@@ -0,0 +1,134 @@
+"""
+Drives open_naukri() and login_with_email_password() against a local stub
+site and checks their WebDriver round-trips against command_budgets.json.
+
+The stub serves just enough markup for the flows' selectors and readiness
+contracts; Chrome reaches it through REPLAY_ADDRESS, the same host mapping
+used for replaying recordings. Needs Chrome and openssl, and is skipped
+where Chrome is not installed.
+
+With COMMAND_BUDGETS_RECORD=true the test measures instead of asserting: it
+writes the counts of this run, with BUDGET_HEADROOM on top for polling that
+varies between runs, to command_budgets.json. Review and commit the result
+when a change adds round-trips on purpose.
+"""
+
+import json
+import math
+import os
+import shutil
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGETS_PATH = os.path.join(ROOT, "command_budgets.json")
+
+# Phases and command types that get a budget when recording
+BUDGET_PHASES = ("setup_driver", "login_with_email_password")
+BUDGET_COMMANDS = ("findElement", "findElements", "sendKeysToElement")
+# Readiness polls and the login wait loop vary a little between runs
+BUDGET_HEADROOM = 1.2
+
+PROFILE_PAGE = """<html><head><title>Profile | Mynaukri</title></head><body>
+<div class="user-profile"><a href="/mnjuser/profile">Profile</a><a href="/mnjuser/homepage">Home</a>
+<input type="file" id="attachCV"></div></body></html>"""
+
+STUB_PAGES = {
+    "/": """<html><head><title>Jobs - Recruitment - Job Search</title></head><body>
+<a id="login_Layer" href="/nlogin/login">Login</a></body></html>""",
+    "/nlogin/login": """<html><head><title>Login | Naukri</title></head><body>
+<form method="post" action="/mnjuser/homepage">
+<input type="text" id="usernameField" placeholder="Email ID">
+<input type="password" id="passwordField">
+<button type="submit">Login</button>
+</form></body></html>""",
+    "/mnjuser/homepage": PROFILE_PAGE,
+    "/mnjuser/profile": PROFILE_PAGE,
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def _serve(self):
+        body = STUB_PAGES.get(self.path.split("?", 1)[0])
+        self.send_response(200 if body is not None else 404)
+        body = (body or "").encode()
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _serve
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_site(tmp_path):
+    from page_replay import _certificate
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(*_certificate(str(tmp_path)))
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def record_budgets(counts):
+    """Writes the measured counts, with headroom, as the new budgets."""
+    budgets = {}
+    for phase in BUDGET_PHASES:
+        used = counts[phase]
+        limits = {"total": math.ceil(used["commands"] * BUDGET_HEADROOM)}
+        for command in BUDGET_COMMANDS:
+            count = used["by_command"].get(command, {}).get("count", 0)
+            if count:
+                limits[command] = math.ceil(count * BUDGET_HEADROOM)
+        budgets[phase] = limits
+    with open(BUDGETS_PATH, "w") as f:
+        json.dump(budgets, f, indent=2)
+        f.write("\n")
+    print(f"📝 Recorded command budgets to {BUDGETS_PATH}: {budgets}")
+
+
+@pytest.mark.skipif(not any(shutil.which(name) for name in ("google-chrome", "chromium", "chromium-browser")),
+                    reason="Chrome is not installed")
+def test_login_flow_stays_within_command_budgets(stub_site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("REPLAY_ADDRESS", stub_site)
+    monkeypatch.setenv("COMMAND_BUDGETS_PATH", BUDGETS_PATH)
+    monkeypatch.setenv("DELAY_STATE_PATH", str(tmp_path / "delay_state.json"))
+    for name in ("PERSISTENT_PROFILE", "SESSION_SNAPSHOT_PATH", "RECORD_PAGES", "LOGIN_RACE"):
+        monkeypatch.delenv(name, raising=False)
+
+    from command_counter import assert_command_budgets, command_counts
+    from utility import cleanup, launch_driver, login_with_email_password, open_naukri
+
+    with open(BUDGETS_PATH) as f:
+        budgets = json.load(f)
+
+    driver, _ = launch_driver("stub_example_com")
+    try:
+        # Missing fallback selectors would otherwise each wait out the implicit wait
+        driver.implicitly_wait(0)
+        open_naukri(driver)
+        login_with_email_password(driver, "stub@example.com", "stub-password")
+        assert "/mnjuser/" in driver.current_url
+        counts = command_counts(driver)
+        with open(tmp_path / "command_counts.json", "w") as f:
+            json.dump(counts, f, indent=2)
+        if os.getenv("COMMAND_BUDGETS_RECORD", "false").lower() == "true":
+            record_budgets(counts)
+            return
+        assert set(budgets) <= set(counts), f"phases not run: {set(budgets) - set(counts)}"
+        assert_command_budgets(driver, budgets)
+    finally:
+        cleanup(driver)
@@ -0,0 +1,165 @@
+"""
+Per-run network traffic accounting for the Naukri automation.
+
+Counts what one refresh costs on the wire, split by phase of the run
+(setup, login, refresh): requests, bytes transferred (encoded, as billed
+for bandwidth) and decoded, the slowest requests, and the share of requests
+and bytes that went to third parties. Data comes from the Network events on
+the shared CDP event stream; switching phase drains pending events first so
+they are attributed to the phase they happened in.
+"""
+
+import weakref
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from cdp_events import drain_events, subscribe
+
+
+# Hosts served by Naukri itself; anything else counts as third party
+FIRST_PARTY_DOMAINS = ("naukri.com", "naukimg.com")
+
+SLOWEST_REQUESTS = 5
+
+
+def is_first_party(url: str) -> bool:
+    """Returns whether a URL belongs to one of FIRST_PARTY_DOMAINS."""
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == domain or host.endswith("." + domain) for domain in FIRST_PARTY_DOMAINS)
+
+
+class PhaseTraffic:
+    """Traffic totals for one phase of the run."""
+
+    def __init__(self):
+        self.requests = 0
+        self.failed = 0
+        self.transferred_bytes = 0
+        self.decoded_bytes = 0
+        self.third_party_requests = 0
+        self.third_party_bytes = 0
+        self.by_type: Dict[str, int] = {}
+        self.slowest: List[Dict] = []
+
+    def summary(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "failed_requests": self.failed,
+            "transferred_bytes": self.transferred_bytes,
+            "decoded_bytes": self.decoded_bytes,
+            "third_party_request_share": self.third_party_requests / self.requests if self.requests else 0.0,
+            "third_party_byte_share": self.third_party_bytes / self.transferred_bytes if self.transferred_bytes else 0.0,
+            "requests_by_type": dict(self.by_type),
+            "slowest_requests": self.slowest,
+        }
+
+
+class TrafficAccounting:
+    """Aggregates Network events into per-phase totals."""
+
+    def __init__(self, phase: str):
+        self.phase = phase
+        self.phases: Dict[str, PhaseTraffic] = {}
+        self._requests: Dict[str, Dict] = {}
+
+    def _current(self, phase: str) -> PhaseTraffic:
+        return self.phases.setdefault(phase, PhaseTraffic())
+
+    def on_event(self, method: str, params: dict) -> None:
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            if request_id in self._requests:
+                # Redirects reuse the request id; keep one entry, timed from the first hop
+                self._requests[request_id]["url"] = params.get("request", {}).get("url", "")
+                return
+            url = params.get("request", {}).get("url", "")
+            traffic = self._current(self.phase)
+            traffic.requests += 1
+            resource_type = params.get("type", "Other")
+            traffic.by_type[resource_type] = traffic.by_type.get(resource_type, 0) + 1
+            first_party = is_first_party(url)
+            if not first_party:
+                traffic.third_party_requests += 1
+            self._requests[request_id] = {"phase": self.phase, "url": url, "type": resource_type,
+                                          "start": params.get("timestamp", 0), "first_party": first_party}
+        elif method == "Network.dataReceived":
+            request = self._requests.get(request_id)
+            if request:
+                self._current(request["phase"]).decoded_bytes += params.get("dataLength", 0)
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            request = self._requests.pop(request_id, None)
+            if not request:
+                return
+            traffic = self._current(request["phase"])
+            if method == "Network.loadingFailed":
+                traffic.failed += 1
+                return
+            size = int(params.get("encodedDataLength", 0))
+            traffic.transferred_bytes += size
+            if not request["first_party"]:
+                traffic.third_party_bytes += size
+            duration_ms = (params.get("timestamp", 0) - request["start"]) * 1000
+            traffic.slowest.append({"url": request["url"][:200], "type": request["type"],
+                                    "duration_ms": round(duration_ms, 1), "bytes": size})
+            traffic.slowest = sorted(traffic.slowest, key=lambda r: r["duration_ms"], reverse=True)[:SLOWEST_REQUESTS]
+
+
+_accounting: "weakref.WeakKeyDictionary[WebDriver, TrafficAccounting]" = weakref.WeakKeyDictionary()
+
+
+def set_traffic_phase(driver: WebDriver, phase: str) -> None:
+    """
+    Attributes the driver's traffic from now on to a phase.
+
+    Args:
+        driver: The webdriver instance.
+        phase: Phase name, e.g. 'setup', 'login' or 'refresh'.
+    """
+    accounting = _accounting.get(driver)
+    if accounting is None:
+        accounting = _accounting[driver] = TrafficAccounting(phase)
+        subscribe(driver, accounting.on_event)
+        return
+    if accounting.phase != phase:
+        drain_events(driver)
+        accounting.phase = phase
+
+
+def report_traffic(driver: WebDriver) -> Optional[Dict]:
+    """
+    Prints and returns the run's traffic per phase. Call before quitting.
+
+    Args:
+        driver: The webdriver instance.
+
+    Returns:
+        Dict of phase summaries plus a 'total' entry, or None without accounting.
+    """
+    accounting = _accounting.pop(driver, None)
+    if accounting is None:
+        return None
+    drain_events(driver)
+
+    summaries = {phase: traffic.summary() for phase, traffic in accounting.phases.items()}
+    total_requests = sum(s["requests"] for s in summaries.values())
+    total_bytes = sum(s["transferred_bytes"] for s in summaries.values())
+    third_party_bytes = sum(t.third_party_bytes for t in accounting.phases.values())
+    summaries["total"] = {
+        "requests": total_requests,
+        "transferred_bytes": total_bytes,
+        "decoded_bytes": sum(s["decoded_bytes"] for s in summaries.values()),
+        "third_party_byte_share": third_party_bytes / total_bytes if total_bytes else 0.0,
+    }
+
+    print(f"📶 Traffic: {total_requests} requests, {total_bytes / 1024:.0f} KB transferred "
+          f"({summaries['total']['third_party_byte_share']:.0%} third-party)")
+    for phase, summary in summaries.items():
+        if phase == "total":
+            continue
+        slowest = summary["slowest_requests"][0] if summary["slowest_requests"] else None
+        print(f"   - {phase}: {summary['requests']} requests, {summary['transferred_bytes'] / 1024:.0f} KB, "
+              f"{summary['third_party_request_share']:.0%} third-party requests"
+              + (f", slowest {slowest['duration_ms']:.0f} ms ({slowest['url'][:60]})" if slowest else ""))
+    return summaries
@@ -1,13 +1,128 @@
 from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver # Import WebDriver for type hinting
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By # Keep By import if used in functions
 import time
 import os
 from datetime import datetime
+from typing import Optional, Tuple
+
+from accounts import account_id_for, current_account_id
+from browser_profile import (acquire_profile, attach_profile, configure_profile, leased_profile_path,
+                             persistent_profiles_enabled, release_profile, report_profile_cache)
+from cdp_events import enable_performance_logging
+from command_counter import attach_command_counter, command_phase, report_command_counts
+from delay_controller import attach_delays, delays_for, finish_delays
+from driver_backend import create_driver, get_driver_backend
+from login_race import LoginCancelled, login_race_enabled, mark_race_pending, race_login, race_pending
+from metrics import record_run_metrics
+from network_policy import apply_network_policy, report_network_savings
+from otp_provider import get_otp_provider, get_otp_timeout
+from page_readiness import get_page_load_strategy, navigate, probe_pages, report_page_load_savings
+from page_replay import capture_page, configure_replay, finish_recording, start_recording
+from profile_fields import update_profile_fields
+from profiler import start_browser_trace, stop_browser_trace, trace_categories
+from refresh_strategy import RefreshNotConfirmed, refresh_with_strategy
+from remote_grid import release_remote_node
+from run_report import (add_report_section, count_run_event, finish_run_report, mark_run_succeeded,
+                        record_run_error, set_run_phase, start_run_report)
+from session_snapshot import (load_configured_snapshot, mark_session_restored, restore_snapshot,
+                              session_restored, stage_profile_files)
+from stealth import register_bundles_for_tab, register_injection_bundles, report_injection_overhead
+from traffic_accounting import report_traffic
+
+
+# Authenticated pages tried in parallel after an email/password login
+PROFILE_PROBE_PAGES = ["profile", "homepage", "dashboard"]
+
+# Login link or button on the homepage, tried in order
+HOME_LOGIN_SELECTORS = [
+    (By.LINK_TEXT, "Login"),
+    (By.PARTIAL_LINK_TEXT, "Login"),
+    (By.XPATH, "//a[contains(text(), 'Login')]"),
+    (By.XPATH, "//a[contains(text(), 'login')]"),
+    (By.XPATH, "//button[contains(text(), 'Login')]"),
+    (By.XPATH, "//button[contains(text(), 'login')]"),
+    (By.XPATH, "//a[@href*='login']"),
+    (By.XPATH, "//button[@class*='login']"),
+    (By.CSS_SELECTOR, "a[href*='login']"),
+    (By.CSS_SELECTOR, "button[class*='login']")
+]
+
+# Elements shown when the login form opens on the OTP tab
+OTP_TAB_INDICATORS = [
+    "//input[@type='tel' or @name='mobile' or contains(@placeholder, 'Mobile') or contains(@placeholder, 'Phone')]",
+    "//div[contains(text(), 'OTP')]",
+    "//button[contains(text(), 'Get OTP') or contains(text(), 'Send OTP')]",
+    "//div[contains(@class, 'otp') or contains(@id, 'otp')]"
+]
+
+# Controls that switch the login form from the OTP tab to email/password
+PASSWORD_TAB_SWITCH_SELECTORS = [
+    "//button[contains(text(), 'Login with Password') or contains(text(), 'Use Password')]",
+    "//a[contains(text(), 'Login with Password') or contains(text(), 'Use Password')]",
+    "//span[contains(text(), 'Login with Password') or contains(text(), 'Use Password')]",
+    "//button[contains(text(), 'Email') and not(contains(text(), 'OTP'))]",
+    "//a[contains(text(), 'Email') and not(contains(text(), 'OTP'))]",
+    "//div[contains(@class, 'tab') and contains(text(), 'Email')]",
+    "//div[contains(@class, 'tab') and contains(text(), 'Password')]",
+    "//button[contains(@class, 'password')]",
+    "//a[contains(@class, 'password')]",
+    "//div[@role='tab' and contains(text(), 'Email') or contains(text(), 'Password')]",
+    "//button[@role='tab' and contains(text(), 'Email') or contains(text(), 'Password')]",
+    # Naukri-specific patterns
+    "//div[contains(@class, 'emailLogin') or contains(@class, 'email-login')]",
+    "//button[contains(@class, 'emailLogin') or contains(@class, 'email-login')]"
+]
+
+# Email field of the login form, tried in order
+EMAIL_INPUT_SELECTORS = [
+    "//input[@type='text']",
+    "//input[@name='email']",
+    "//input[@id='email']",
+    "//input[@placeholder='Email ID']",
+    "//input[contains(@class, 'email')]"
+]
+
+# Password field of the login form
+PASSWORD_INPUT_SELECTOR = "//input[@type='password']"
+
+# Submit button of the login form, tried in order
+LOGIN_SUBMIT_SELECTORS = [
+    "//button[contains(text(), 'Login')]",
+    "//button[contains(text(), 'Sign In')]",
+    "//input[@type='submit']",
+    "//button[@type='submit']"
+]
+
+# CAPTCHA and verification challenges shown after a login attempt
+CAPTCHA_SELECTORS = [
+    "//div[contains(@class, 'captcha')]",
+    "//div[contains(@id, 'captcha')]",
+    "//img[contains(@src, 'captcha')]",
+    "//img[contains(@alt, 'captcha')]",
+    "//div[contains(@class, 'recaptcha')]",
+    "//div[contains(@id, 'recaptcha')]",
+    "//iframe[contains(@src, 'recaptcha')]",
+    "//div[contains(text(), 'captcha')]",
+    "//div[contains(text(), 'verification')]",
+    "//div[contains(text(), 'robot')]",
+    "//div[contains(text(), 'human')]",
+    "//div[contains(@class, 'challenge')]",
+    "//div[contains(@class, 'verification')]"
+]
+
+
+def prepare_probe_tab(driver: WebDriver) -> None:
+    """
+    Gives a freshly opened tab the stealth bundles and network policy of the main tab.
+
+    Args:
+        driver: The webdriver instance, switched to the new tab.
+    """
+    register_bundles_for_tab(driver)
+    apply_network_policy(driver, "profile")
 
 
 def switch_to_new_window(driver: WebDriver, timeout: int = 10) -> None:
@@ -31,155 +146,225 @@ def switch_to_new_window(driver: WebDriver, timeout: int = 10) -> None:
             break
 
 
-def setup_driver() -> WebDriver:
+def build_chrome_options(is_ci: bool) -> webdriver.ChromeOptions:
+    """
+    Builds the Chrome options shared by every driver backend.
+
+    Args:
+        is_ci: Whether we run in CI (headless mode and explicit binary path).
+
+    Returns:
+        The configured ChromeOptions instance.
+    """
+    import random
+    
+    # Chrome options for better compatibility
+    chrome_options = webdriver.ChromeOptions()
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--no-default-browser-check")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-extensions")
+    
+    # Advanced stealth Chrome options to avoid detection
+    # Enable headless mode ONLY in CI environments (required for GitHub Actions)
+    if is_ci:
+        print("🤖 Detected CI environment - enabling headless mode")
+        chrome_options.add_argument("--headless=new")
+        # Additional headless-specific options for CI
+        chrome_options.add_argument("--disable-software-rasterizer")
+        chrome_options.add_argument("--disable-setuid-sandbox")
+        chrome_options.add_argument("--remote-debugging-port=0")  # Disable remote debugging in headless
+    else:
+        print("💻 Running in local environment - using normal Chrome mode")
+    
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument("--disable-plugins")
+    chrome_options.add_argument("--disable-web-security")
+    chrome_options.add_argument("--allow-running-insecure-content")
+    chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+    # chrome_options.add_argument("--remote-debugging-port=9222")  # Commented out to avoid port conflicts
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    
+    # Enhanced anti-detection measures
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-extensions-file-access-check")
+    chrome_options.add_argument("--disable-extensions-http-throttling")
+    chrome_options.add_argument("--disable-extensions-except")
+    chrome_options.add_argument("--disable-component-extensions-with-background-pages")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--hide-scrollbars")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_argument("--disable-permissions-api")
+    chrome_options.add_argument("--disable-presentation-api")
+    chrome_options.add_argument("--disable-print-preview")
+    chrome_options.add_argument("--disable-speech-api")
+    chrome_options.add_argument("--disable-file-system")
+    chrome_options.add_argument("--disable-client-side-phishing-detection")
+    chrome_options.add_argument("--disable-component-update")
+    chrome_options.add_argument("--disable-domain-reliability")
+    chrome_options.add_argument("--disable-features=TranslateUI,BlinkGenPropertyTrees")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-breakpad")
+    chrome_options.add_argument("--disable-client-side-phishing-detection")
+    chrome_options.add_argument("--disable-component-extensions-with-background-pages")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-features=TranslateUI")
+    chrome_options.add_argument("--disable-hang-monitor")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-prompt-on-repost")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--disable-windows10-custom-titlebar")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--safebrowsing-disable-auto-update")
+    chrome_options.add_argument("--enable-automation")
+    chrome_options.add_argument("--password-store=basic")
+    chrome_options.add_argument("--use-mock-keychain")
+    
+    # Don't block driver.get() on the full load event; readiness contracts decide when a page is usable
+    chrome_options.page_load_strategy = get_page_load_strategy()
+    
+    # CDP events (blocked requests, network accounting) are read from the performance log;
+    # in profiling mode it also carries the Chrome trace
+    enable_performance_logging(chrome_options, trace_categories())
+    
+    # Offline runs resolve naukri.com to a replay server
+    configure_replay(chrome_options)
+    
+    # Randomize user agent from a pool of real browsers
+    import random
+    user_agents = [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0"
+    ]
+    selected_user_agent = random.choice(user_agents)
+    chrome_options.add_argument(f"--user-agent={selected_user_agent}")
+    
+    # Randomize language and locale
+    languages = ["en-US,en;q=0.9", "en-GB,en;q=0.9", "en-CA,en;q=0.9", "en-AU,en;q=0.9"]
+    selected_language = random.choice(languages)
+    chrome_options.add_argument(f"--accept-language={selected_language}")
+    
+    # Additional headers
+    chrome_options.add_argument("--accept-encoding=gzip, deflate, br")
+    chrome_options.add_argument("--accept=text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7")
+    chrome_options.add_argument("--sec-ch-ua=\"Not_A Brand\";v=\"8\", \"Chromium\";v=\"120\", \"Google Chrome\";v=\"120\"")
+    chrome_options.add_argument("--sec-ch-ua-mobile=?0")
+    chrome_options.add_argument("--sec-ch-ua-platform=\"Windows\"")
+    chrome_options.add_argument("--sec-fetch-dest=document")
+    chrome_options.add_argument("--sec-fetch-mode=navigate")
+    chrome_options.add_argument("--sec-fetch-site=none")
+    chrome_options.add_argument("--sec-fetch-user=?1")
+    chrome_options.add_argument("--upgrade-insecure-requests=1")
+    
+    # In CI environments, explicitly set Chrome binary path if available
+    if is_ci:
+        # Try common Chrome installation paths in CI
+        chrome_binary_paths = [
+            "/usr/bin/google-chrome",
+            "/usr/bin/google-chrome-stable",
+            "/usr/bin/chromium",
+            "/usr/bin/chromium-browser"
+        ]
+        for chrome_path in chrome_binary_paths:
+            if os.path.exists(chrome_path):
+                chrome_options.binary_location = chrome_path
+                print(f"📍 Using Chrome binary: {chrome_path}")
+                break
+    
+    print("🌐 Using cloud-optimized Chrome configuration")
+    
+    return chrome_options
+
+
+def setup_driver(account_id: str = None, driver_path: str = None) -> WebDriver:
     """
     Sets up and returns a configured Chrome webdriver instance.
 
+    Args:
+        account_id: Account whose persistent profile to use when
+            PERSISTENT_PROFILE is enabled. Defaults to the account in the environment.
+        driver_path: Already-resolved chromedriver path (see bootstrap.py).
+
     Returns:
         A configured Chrome webdriver instance.
     """
+    driver, snapshot = launch_driver(account_id, driver_path)
+    try:
+        return open_naukri(driver, snapshot)
+    except Exception as e:
+        print(f"❌ Setup failed: {e}")
+        try:
+            driver.quit()
+        except:
+            pass
+        release_profile(driver)
+        raise Exception(f"Failed to setup driver: {e}")
+
+
+def launch_driver(account_id: str = None, driver_path: str = None) -> Tuple[WebDriver, Optional[dict]]:
+    """
+    Starts Chrome with the automation's options and leaves it on about:blank.
+
+    Args:
+        account_id: Account whose persistent profile to use when
+            PERSISTENT_PROFILE is enabled. Defaults to the account in the environment.
+        driver_path: Already-resolved chromedriver path for the selenium backend.
+
+    Returns:
+        The started driver and the session snapshot to restore (or None).
+    """
     import os
     import platform
     import tempfile
     
+    profile_lease = None
     try:
         # Detect if we're running in CI/GitHub Actions
         is_ci = os.getenv('CI') == 'true' or os.getenv('GITHUB_ACTIONS') == 'true'
         
-        # Chrome options for better compatibility
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--no-first-run")
-        chrome_options.add_argument("--no-default-browser-check")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-extensions")
+        chrome_options = build_chrome_options(is_ci)
         
-        # Advanced stealth Chrome options to avoid detection
-        # Enable headless mode ONLY in CI environments (required for GitHub Actions)
-        if is_ci:
-            print("🤖 Detected CI environment - enabling headless mode")
-            chrome_options.add_argument("--headless=new")
-            # Additional headless-specific options for CI
-            chrome_options.add_argument("--disable-software-rasterizer")
-            chrome_options.add_argument("--disable-setuid-sandbox")
-            chrome_options.add_argument("--remote-debugging-port=0")  # Disable remote debugging in headless
-        else:
-            print("💻 Running in local environment - using normal Chrome mode")
+        # Reuse a locked per-account profile (HTTP cache, HSTS, cookies) across runs
+        if persistent_profiles_enabled() and get_driver_backend() == "remote":
+            print("⚠️ Persistent profiles live on this host - not used with the remote backend")
+        elif persistent_profiles_enabled():
+            profile_lease = acquire_profile(account_id or current_account_id())
+            configure_profile(chrome_options, profile_lease)
         
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--disable-web-security")
-        chrome_options.add_argument("--allow-running-insecure-content")
-        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-        # chrome_options.add_argument("--remote-debugging-port=9222")  # Commented out to avoid port conflicts
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        
-        # Enhanced anti-detection measures
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-extensions-file-access-check")
-        chrome_options.add_argument("--disable-extensions-http-throttling")
-        chrome_options.add_argument("--disable-extensions-except")
-        chrome_options.add_argument("--disable-component-extensions-with-background-pages")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-sync")
-        chrome_options.add_argument("--disable-translate")
-        chrome_options.add_argument("--hide-scrollbars")
-        chrome_options.add_argument("--mute-audio")
-        chrome_options.add_argument("--no-first-run")
-        chrome_options.add_argument("--disable-logging")
-        chrome_options.add_argument("--disable-permissions-api")
-        chrome_options.add_argument("--disable-presentation-api")
-        chrome_options.add_argument("--disable-print-preview")
-        chrome_options.add_argument("--disable-speech-api")
-        chrome_options.add_argument("--disable-file-system")
-        chrome_options.add_argument("--disable-client-side-phishing-detection")
-        chrome_options.add_argument("--disable-component-update")
-        chrome_options.add_argument("--disable-domain-reliability")
-        chrome_options.add_argument("--disable-features=TranslateUI,BlinkGenPropertyTrees")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-background-networking")
-        chrome_options.add_argument("--disable-breakpad")
-        chrome_options.add_argument("--disable-client-side-phishing-detection")
-        chrome_options.add_argument("--disable-component-extensions-with-background-pages")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-features=TranslateUI")
-        chrome_options.add_argument("--disable-hang-monitor")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-prompt-on-repost")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-sync")
-        chrome_options.add_argument("--disable-translate")
-        chrome_options.add_argument("--disable-windows10-custom-titlebar")
-        chrome_options.add_argument("--metrics-recording-only")
-        chrome_options.add_argument("--no-first-run")
-        chrome_options.add_argument("--safebrowsing-disable-auto-update")
-        chrome_options.add_argument("--enable-automation")
-        chrome_options.add_argument("--password-store=basic")
-        chrome_options.add_argument("--use-mock-keychain")
-        
-        # Randomize user agent from a pool of real browsers
-        import random
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0"
-        ]
-        selected_user_agent = random.choice(user_agents)
-        chrome_options.add_argument(f"--user-agent={selected_user_agent}")
-        
-        # Randomize language and locale
-        languages = ["en-US,en;q=0.9", "en-GB,en;q=0.9", "en-CA,en;q=0.9", "en-AU,en;q=0.9"]
-        selected_language = random.choice(languages)
-        chrome_options.add_argument(f"--accept-language={selected_language}")
-        
-        # Additional headers
-        chrome_options.add_argument("--accept-encoding=gzip, deflate, br")
-        chrome_options.add_argument("--accept=text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7")
-        chrome_options.add_argument("--sec-ch-ua=\"Not_A Brand\";v=\"8\", \"Chromium\";v=\"120\", \"Google Chrome\";v=\"120\"")
-        chrome_options.add_argument("--sec-ch-ua-mobile=?0")
-        chrome_options.add_argument("--sec-ch-ua-platform=\"Windows\"")
-        chrome_options.add_argument("--sec-fetch-dest=document")
-        chrome_options.add_argument("--sec-fetch-mode=navigate")
-        chrome_options.add_argument("--sec-fetch-site=none")
-        chrome_options.add_argument("--sec-fetch-user=?1")
-        chrome_options.add_argument("--upgrade-insecure-requests=1")
-        
-        # In CI environments, explicitly set Chrome binary path if available
-        if is_ci:
-            # Try common Chrome installation paths in CI
-            chrome_binary_paths = [
-                "/usr/bin/google-chrome",
-                "/usr/bin/google-chrome-stable",
-                "/usr/bin/chromium",
-                "/usr/bin/chromium-browser"
-            ]
-            for chrome_path in chrome_binary_paths:
-                if os.path.exists(chrome_path):
-                    chrome_options.binary_location = chrome_path
-                    print(f"📍 Using Chrome binary: {chrome_path}")
-                    break
-        
-        print("🌐 Using cloud-optimized Chrome configuration")
+        # An exported session snapshot lets ephemeral runners skip the login flow
+        snapshot = load_configured_snapshot(account_id or current_account_id())
+        if snapshot and profile_lease:
+            stage_profile_files(snapshot, profile_lease.path)
         
         # Start Chrome with robust error handling
         driver = None
@@ -187,13 +372,10 @@ def setup_driver() -> WebDriver:
         
         for attempt in range(max_retries):
             try:
-                print(f"🔍 Attempting to start Chrome (attempt {attempt + 1}/{max_retries})...")
+                print(f"🔍 Attempting to start Chrome (attempt {attempt + 1}/{max_retries}, {get_driver_backend()} backend)...")
                 
-                # Create service with better configuration
-                service = Service(ChromeDriverManager().install())
-                
-                # Create driver with explicit service (don't start service manually)
-                driver = webdriver.Chrome(service=service, options=chrome_options)
+                # Create driver on the configured backend (chromedriver or direct DevTools)
+                driver = create_driver(chrome_options, driver_path=driver_path)
                 
                 # Set timeouts for better stability
                 driver.set_page_load_timeout(30)
@@ -212,11 +394,6 @@ def setup_driver() -> WebDriver:
                     except:
                         pass
                     driver = None
-                if 'service' in locals():
-                    try:
-                        service.stop()
-                    except:
-                        pass
                 
                 if attempt < max_retries - 1:
                     print("🔄 Retrying with different configuration...")
@@ -228,291 +405,215 @@ def setup_driver() -> WebDriver:
         if not driver:
             raise Exception("Failed to create Chrome driver instance")
         
-        # Execute advanced stealth scripts to avoid detection
+        if profile_lease:
+            attach_profile(driver, profile_lease)
+        attach_command_counter(driver, "setup_driver")
+        attach_delays(driver, account_id or current_account_id())
+        start_run_report(driver, account_id or current_account_id())
+        start_recording(driver, account_id or current_account_id())
+        if attempt:
+            count_run_event(driver, "chrome_start_retry", attempt)
+        set_run_phase(driver, "setup")
+        
+        return driver, snapshot
+        
+    except Exception as e:
+        print(f"❌ Setup failed: {e}")
+        if 'driver' in locals() and driver:
+            try:
+                driver.quit()
+            except:
+                pass
+        if profile_lease:
+            release_profile(lease=profile_lease)
+        raise Exception(f"Failed to setup driver: {e}")
+
+
+@command_phase("setup_driver")
+def open_naukri(driver: WebDriver, snapshot: dict = None, cancelled=None) -> WebDriver:
+    """
+    Prepares a freshly started browser and opens the Naukri login page.
+
+    Registers the injection bundles, restores a session snapshot if given,
+    navigates to the homepage and clicks through to the login form.
+
+    Args:
+        driver: A started webdriver instance on about:blank.
+        snapshot: A session snapshot from load_configured_snapshot(), if any.
+        cancelled: A threading.Event that stops the navigation retries once
+            set (a fresh login that lost the login race).
+
+    Returns:
+        The same driver, on the login page or (for a valid restored session)
+        an authenticated page.
+    """
+    import random
+    
+    # Profiling mode traces the browser from here to the end of login
+    start_browser_trace(driver)
+    
+    # Register stealth and instrumentation scripts to run before every document and frame
+    try:
+        print("🕵️ Applying advanced stealth measures...")
+        register_injection_bundles(driver)
+        print("✅ Advanced stealth measures applied successfully")
+        
+    except Exception as e:
+        print(f"⚠️ Some stealth measures failed: {e}")
+        pass  # Continue even if stealth measures fail
+    
+    if snapshot:
         try:
-            print("🕵️ Applying advanced stealth measures...")
-            
-            # Comprehensive stealth script
-            stealth_script = """
-            // Override automation indicators (fixed to avoid redefinition error)
-            try {
-                Object.defineProperty(navigator, 'webdriver', {get: () => false, configurable: true});
-            } catch(e) {
-                // Property already defined, skip
-            }
-            Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-            Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-            Object.defineProperty(navigator, 'permissions', {get: () => ({query: () => Promise.resolve({state: 'granted'})})});
-            
-            // Override Chrome runtime
-            if (window.chrome && window.chrome.runtime) {
-                Object.defineProperty(window.chrome.runtime, 'onConnect', {get: () => undefined});
-                Object.defineProperty(window.chrome.runtime, 'onMessage', {get: () => undefined});
-            }
-            
-            // Override automation flags
-            try {
-                Object.defineProperty(navigator, 'automation', {get: () => false, configurable: true});
-            } catch(e) {
-                // Property already defined, skip
-            }
-            
-            // Mock realistic plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => ({
-                    length: 3,
-                    0: {name: 'Chrome PDF Plugin', description: 'Portable Document Format'},
-                    1: {name: 'Chrome PDF Viewer', description: 'Portable Document Format'},
-                    2: {name: 'Native Client', description: 'Native Client Executable'}
-                })
-            });
-            
-            // Mock realistic screen properties
-            Object.defineProperty(screen, 'availHeight', {get: () => 1040});
-            Object.defineProperty(screen, 'availWidth', {get: () => 1920});
-            Object.defineProperty(screen, 'colorDepth', {get: () => 24});
-            Object.defineProperty(screen, 'height', {get: () => 1080});
-            Object.defineProperty(screen, 'width', {get: () => 1920});
-            
-            // Mock realistic timezone
-            Object.defineProperty(Intl.DateTimeFormat.prototype, 'resolvedOptions', {
-                value: function() { return {timeZone: 'America/New_York'}; }
-            });
-            
-            // Override getParameter to hide automation
-            const originalGetParameter = WebGLRenderingContext.prototype.getParameter;
-            WebGLRenderingContext.prototype.getParameter = function(parameter) {
-                if (parameter === 37445) {
-                    return 'Intel Inc.';
-                }
-                if (parameter === 37446) {
-                    return 'Intel(R) Iris(TM) Graphics 6100';
-                }
-                return originalGetParameter.call(this, parameter);
-            };
-            
-            // Mock realistic connection
-            Object.defineProperty(navigator, 'connection', {
-                get: () => ({
-                    effectiveType: '4g',
-                    rtt: 50,
-                    downlink: 10
-                })
-            });
-            
-            // Override Date to appear more human
-            const originalDate = Date;
-            Date = class extends originalDate {
-                constructor(...args) {
-                    if (args.length === 0) {
-                        super(originalDate.now() + Math.random() * 1000);
-                    } else {
-                        super(...args);
-                    }
-                }
-            };
-            
-            // Mock realistic battery API
-            if (navigator.getBattery) {
-                navigator.getBattery = () => Promise.resolve({
-                    charging: true,
-                    chargingTime: 0,
-                    dischargingTime: Infinity,
-                    level: 0.8
-                });
-            }
-            
-            // Override canvas fingerprinting
-            const originalToDataURL = HTMLCanvasElement.prototype.toDataURL;
-            HTMLCanvasElement.prototype.toDataURL = function() {
-                const context = this.getContext('2d');
-                if (context) {
-                    context.fillStyle = 'rgba(255, 255, 255, 0.01)';
-                    context.fillRect(0, 0, 1, 1);
-                }
-                return originalToDataURL.apply(this, arguments);
-            };
-            
-            // Mock realistic hardware concurrency
-            Object.defineProperty(navigator, 'hardwareConcurrency', {get: () => 8});
-            
-            // Override notification permission
-            Object.defineProperty(Notification, 'permission', {get: () => 'default'});
-            
-            // Mock realistic memory
-            Object.defineProperty(navigator, 'deviceMemory', {get: () => 8});
-            
-            // Override speech synthesis
-            if (window.speechSynthesis) {
-                Object.defineProperty(window.speechSynthesis, 'getVoices', {
-                    value: () => [
-                        {name: 'Google US English', lang: 'en-US', default: true},
-                        {name: 'Microsoft David Desktop', lang: 'en-US'},
-                        {name: 'Microsoft Zira Desktop', lang: 'en-US'}
-                    ]
-                });
-            }
+            restore_snapshot(driver, snapshot)
+        except Exception as e:
+            print(f"⚠️ Could not restore session snapshot: {e}")
+            snapshot = None
+    
+    # Block trackers and other resources the flows never need
+    apply_network_policy(driver, "home")
+    
+    # Navigate to Naukri with session validation and retry logic
+    delays = delays_for(driver)
+    max_nav_retries = 3
+    for nav_attempt in range(max_nav_retries):
+        if cancelled is not None and cancelled.is_set():
+            raise LoginCancelled("Login race already decided")
+        try:
+            print(f"🌐 Navigating to Naukri.com (attempt {nav_attempt + 1}/{max_nav_retries})...")
             
-            // Remove automation indicators from window
-            delete window.cdc_adoQpoasnfa76pfcZLmcfl_Array;
-            delete window.cdc_adoQpoasnfa76pfcZLmcfl_Promise;
-            delete window.cdc_adoQpoasnfa76pfcZLmcfl_Symbol;
+            # Add human-like random delay to avoid rate limiting (scaled by past block rates)
+            delay = delays.delay("pre_navigation")
+            print(f"⏱️ Waiting {delay:.1f} seconds (human-like delay)...")
+            delays.wait(delay)
             
-            // Mock realistic touch support
-            Object.defineProperty(navigator, 'maxTouchPoints', {get: () => 0});
+            # Simulate human-like mouse movement before navigation
+            try:
+                from selenium.webdriver.common.action_chains import ActionChains
+                actions = ActionChains(driver)
+                # Random mouse movements
+                for _ in range(random.randint(2, 5)):
+                    x_offset = random.randint(-100, 100)
+                    y_offset = random.randint(-100, 100)
+                    actions.move_by_offset(x_offset, y_offset)
+                    actions.perform()
+                    time.sleep(random.uniform(0.1, 0.3))
+            except:
+                pass  # Continue if mouse simulation fails
             
-            // Override geolocation
-            if (navigator.geolocation) {
-                navigator.geolocation.getCurrentPosition = () => {};
-                navigator.geolocation.watchPosition = () => {};
-            }
+            navigate(driver, "home")
             
-            console.log('Stealth measures applied successfully');
-            """
+            # Simulate human-like scrolling behavior
+            try:
+                scroll_pause_time = delays.delay("scroll_pause")
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight/4);")
+                delays.wait(scroll_pause_time)
+                driver.execute_script("window.scrollTo(0, 0);")
+                delays.wait(scroll_pause_time)
+            except:
+                pass
             
-            driver.execute_script(stealth_script)
-            print("✅ Advanced stealth measures applied successfully")
+            # Validate session is still active
+            current_url = driver.current_url
+            page_title = driver.title
+            print(f"📍 Current URL: {current_url}")
+            print(f"📄 Page Title: {page_title}")
             
-        except Exception as e:
-            print(f"⚠️ Some stealth measures failed: {e}")
-            pass  # Continue even if stealth measures fail
-        
-        # Navigate to Naukri with session validation and retry logic
-        max_nav_retries = 3
-        for nav_attempt in range(max_nav_retries):
-            try:
-                print(f"🌐 Navigating to Naukri.com (attempt {nav_attempt + 1}/{max_nav_retries})...")
-                
-                # Add human-like random delay to avoid rate limiting
-                import random
-                delay = random.uniform(3, 8)  # Longer, more human-like delays
-                print(f"⏱️ Waiting {delay:.1f} seconds (human-like delay)...")
-                time.sleep(delay)
-                
-                # Simulate human-like mouse movement before navigation
-                try:
-                    from selenium.webdriver.common.action_chains import ActionChains
-                    actions = ActionChains(driver)
-                    # Random mouse movements
-                    for _ in range(random.randint(2, 5)):
-                        x_offset = random.randint(-100, 100)
-                        y_offset = random.randint(-100, 100)
-                        actions.move_by_offset(x_offset, y_offset)
-                        actions.perform()
-                        time.sleep(random.uniform(0.1, 0.3))
-                except:
-                    pass  # Continue if mouse simulation fails
-                
-                driver.get("https://www.naukri.com/")
-                
-                # Simulate human-like scrolling behavior
-                try:
-                    import random
-                    scroll_pause_time = random.uniform(0.5, 2.0)
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight/4);")
-                    time.sleep(scroll_pause_time)
-                    driver.execute_script("window.scrollTo(0, 0);")
-                    time.sleep(scroll_pause_time)
-                except:
-                    pass
-                
-                # Validate session is still active
-                current_url = driver.current_url
-                page_title = driver.title
-                print(f"📍 Current URL: {current_url}")
-                print(f"📄 Page Title: {page_title}")
-                
-                # Check if we got blocked
-                if "Access Denied" in page_title or "blocked" in page_title.lower():
-                    print(f"⚠️ Access denied on attempt {nav_attempt + 1}")
-                    if nav_attempt < max_nav_retries - 1:
-                        print("🔄 Retrying with different approach...")
-                        # Longer wait with exponential backoff
-                        wait_time = 15 + (nav_attempt * 10)
-                        print(f"⏱️ Waiting {wait_time} seconds before retry...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise Exception("Access denied - website is blocking automated requests")
-                
-                # Wait for page to load with human-like timing
-                load_time = random.uniform(3, 7)
-                print(f"⏱️ Waiting {load_time:.1f} seconds for page to load...")
-                time.sleep(load_time)
-                break
-                
-            except Exception as nav_error:
-                print(f"⚠️ Navigation attempt {nav_attempt + 1} failed: {nav_error}")
+            # Check if we got blocked
+            if "Access Denied" in page_title or "blocked" in page_title.lower():
+                print(f"⚠️ Access denied on attempt {nav_attempt + 1}")
+                delays.note("blocked")
+                count_run_event(driver, "access_denied")
                 if nav_attempt < max_nav_retries - 1:
-                    print("🔄 Retrying navigation...")
-                    retry_delay = random.uniform(5, 10)
-                    print(f"⏱️ Waiting {retry_delay:.1f} seconds before retry...")
-                    time.sleep(retry_delay)
+                    count_run_event(driver, "navigation_retry")
+                    print("🔄 Retrying with different approach...")
+                    # Longer wait with exponential backoff
+                    wait_time = delays.backoff(nav_attempt)
+                    print(f"⏱️ Waiting {wait_time:.0f} seconds before retry...")
+                    delays.wait(wait_time)
+                    continue
                 else:
-                    raise nav_error
-        
-        # Try to find and click login button with multiple selectors
-        print("🔍 Looking for login button...")
-        
-        # Wait for page to fully load
-        time.sleep(5)
-        
-        # Try multiple selectors for login button
-        login_selectors = [
-            (By.LINK_TEXT, "Login"),
-            (By.PARTIAL_LINK_TEXT, "Login"),
-            (By.XPATH, "//a[contains(text(), 'Login')]"),
-            (By.XPATH, "//a[contains(text(), 'login')]"),
-            (By.XPATH, "//button[contains(text(), 'Login')]"),
-            (By.XPATH, "//button[contains(text(), 'login')]"),
-            (By.XPATH, "//a[@href*='login']"),
-            (By.XPATH, "//button[@class*='login']"),
-            (By.CSS_SELECTOR, "a[href*='login']"),
-            (By.CSS_SELECTOR, "button[class*='login']")
-        ]
-        
-        login_button = None
-        for selector_type, selector_value in login_selectors:
-            try:
-                print(f"🔍 Trying selector: {selector_type} = '{selector_value}'")
-                login_button = driver.find_element(selector_type, selector_value)
-                print(f"✅ Found login button with: {selector_type} = '{selector_value}'")
-                break
-            except:
-                continue
-        
-        if not login_button:
-            print("❌ Could not find login button with any selector")
-            print("🔄 Trying direct navigation to login page...")
+                    raise Exception("Access denied - website is blocking automated requests")
             
-            # Try direct navigation to login page
-            try:
-                driver.get("https://www.naukri.com/nlogin/login")
-                time.sleep(5)
-                print("✅ Navigated directly to login page")
-            except Exception as nav_error:
-                print(f"❌ Direct navigation failed: {nav_error}")
-                print("🔍 Current page source preview:")
-                print(driver.page_source[:500] + "...")
-                raise Exception("Login button not found and direct navigation failed")
-        else:
-            # Click the login button
-            login_button.click()
-            print("✅ Login button clicked successfully")
-            time.sleep(3)
-        
+            # Wait for page to load with human-like timing
+            load_time = delays.delay("post_load")
+            print(f"⏱️ Waiting {load_time:.1f} seconds for page to load...")
+            delays.wait(load_time)
+            break
+            
+        except Exception as nav_error:
+            if cancelled is not None and cancelled.is_set():
+                raise LoginCancelled("Login race already decided") from nav_error
+            print(f"⚠️ Navigation attempt {nav_attempt + 1} failed: {nav_error}")
+            if nav_attempt < max_nav_retries - 1:
+                count_run_event(driver, "navigation_retry")
+                print("🔄 Retrying navigation...")
+                retry_delay = delays.delay("navigation_retry")
+                print(f"⏱️ Waiting {retry_delay:.1f} seconds before retry...")
+                delays.wait(retry_delay)
+            else:
+                raise nav_error
+    
+    # With racing enabled the saved session is validated alongside a fresh login
+    if (snapshot or leased_profile_path(driver)) and login_race_enabled():
+        mark_race_pending(driver)
+        print("🏁 Saved session will be raced against a fresh login")
         print("🚀 Driver setup completed successfully")
         return driver
+    
+    # A restored session goes straight to the authenticated pages
+    if snapshot:
+        print("🔍 Validating restored session...")
+        apply_network_policy(driver, "profile")
+        navigate(driver, "homepage")
+        if "login" not in driver.current_url.lower():
+            mark_session_restored(driver)
+            print("✅ Restored session is valid - skipping login")
+            print("🚀 Driver setup completed successfully")
+            return driver
+        print("⚠️ Restored session is no longer valid - continuing with fresh login")
+        navigate(driver, "home")
+    
+    # Try to find and click login button with multiple selectors
+    print("🔍 Looking for login button...")
+    
+    # The next page is the login form
+    apply_network_policy(driver, "login")
+    
+    login_button = None
+    for selector_type, selector_value in HOME_LOGIN_SELECTORS:
+        try:
+            print(f"🔍 Trying selector: {selector_type} = '{selector_value}'")
+            login_button = driver.find_element(selector_type, selector_value)
+            print(f"✅ Found login button with: {selector_type} = '{selector_value}'")
+            break
+        except:
+            continue
+    
+    if not login_button:
+        print("❌ Could not find login button with any selector")
+        print("🔄 Trying direct navigation to login page...")
         
-    except Exception as e:
-        print(f"❌ Setup failed: {e}")
-        if 'driver' in locals() and driver:
-            try:
-                driver.quit()
-            except:
-                pass
-        raise Exception(f"Failed to setup driver: {e}")
+        # Try direct navigation to login page
+        try:
+            navigate(driver, "login")
+            print("✅ Navigated directly to login page")
+        except Exception as nav_error:
+            print(f"❌ Direct navigation failed: {nav_error}")
+            print("🔍 Current page source preview:")
+            print(driver.page_source[:500] + "...")
+            raise Exception("Login button not found and direct navigation failed")
+    else:
+        # Click the login button
+        login_button.click()
+        print("✅ Login button clicked successfully")
+        time.sleep(3)
+        capture_page(driver, "login")
+    
+    print("🚀 Driver setup completed successfully")
+    return driver
 
+
+@command_phase("login_with_google")
 def login_with_google(driver: WebDriver, email: str) -> None:
     """
     Logs in to Naukri using Google OAuth authentication.
@@ -580,8 +681,8 @@ def login_with_google(driver: WebDriver, email: str) -> None:
                     time.sleep(2)
                 
                 # Navigate to profile page
-                driver.get("https://www.naukri.com/mnjuser/profile")
-                time.sleep(5)
+                apply_network_policy(driver, "profile")
+                navigate(driver, "profile")
                 print("🎯 Navigated to profile page")
                 return
                 
@@ -618,8 +719,8 @@ def login_with_google(driver: WebDriver, email: str) -> None:
             time.sleep(2)
         
         # Navigate to profile page
-        driver.get("https://www.naukri.com/mnjuser/profile")
-        time.sleep(5)
+        apply_network_policy(driver, "profile")
+        navigate(driver, "profile")
         print("🎯 Navigated to profile page")
         
     except Exception as e:
@@ -627,6 +728,7 @@ def login_with_google(driver: WebDriver, email: str) -> None:
         raise
 
 
+@command_phase("login_with_email_password")
 def login_with_email_password(driver: WebDriver, email: str, password: str) -> None:
     """
     Logs in to Naukri using email and password.
@@ -638,6 +740,7 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
     """
     import random
     wait = WebDriverWait(driver, 15)
+    delays = delays_for(driver)
     
     try:
         # Wait for login page to load
@@ -647,15 +750,8 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
         print("🔍 Checking which login tab is active...")
         
         # Look for OTP-related elements that indicate we're on OTP tab
-        otp_indicators = [
-            "//input[@type='tel' or @name='mobile' or contains(@placeholder, 'Mobile') or contains(@placeholder, 'Phone')]",
-            "//div[contains(text(), 'OTP')]",
-            "//button[contains(text(), 'Get OTP') or contains(text(), 'Send OTP')]",
-            "//div[contains(@class, 'otp') or contains(@id, 'otp')]"
-        ]
-        
         is_otp_tab = False
-        for indicator in otp_indicators:
+        for indicator in OTP_TAB_INDICATORS:
             try:
                 elements = driver.find_elements(By.XPATH, indicator)
                 if elements and any(el.is_displayed() for el in elements):
@@ -664,30 +760,14 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
                     break
             except:
                 continue
+        capture_page(driver, "login_otp_tab" if is_otp_tab else "login_password_tab")
         
         # If on OTP tab, look for button/tab to switch to email/password
         if is_otp_tab:
             print("🔄 Looking for email/password tab switch button...")
             # Comprehensive selectors for switching to email/password tab
-            switch_selectors = [
-                "//button[contains(text(), 'Login with Password') or contains(text(), 'Use Password')]",
-                "//a[contains(text(), 'Login with Password') or contains(text(), 'Use Password')]",
-                "//span[contains(text(), 'Login with Password') or contains(text(), 'Use Password')]",
-                "//button[contains(text(), 'Email') and not(contains(text(), 'OTP'))]",
-                "//a[contains(text(), 'Email') and not(contains(text(), 'OTP'))]",
-                "//div[contains(@class, 'tab') and contains(text(), 'Email')]",
-                "//div[contains(@class, 'tab') and contains(text(), 'Password')]",
-                "//button[contains(@class, 'password')]",
-                "//a[contains(@class, 'password')]",
-                "//div[@role='tab' and contains(text(), 'Email') or contains(text(), 'Password')]",
-                "//button[@role='tab' and contains(text(), 'Email') or contains(text(), 'Password')]",
-                # Naukri-specific patterns
-                "//div[contains(@class, 'emailLogin') or contains(@class, 'email-login')]",
-                "//button[contains(@class, 'emailLogin') or contains(@class, 'email-login')]"
-            ]
-            
             switched = False
-            for selector in switch_selectors:
+            for selector in PASSWORD_TAB_SWITCH_SELECTORS:
                 try:
                     elements = driver.find_elements(By.XPATH, selector)
                     for el in elements:
@@ -727,16 +807,8 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
 
         print("🔍 Looking for email input field...")
         # Find email input field with multiple possible selectors
-        email_selectors = [
-            "//input[@type='text']",
-            "//input[@name='email']", 
-            "//input[@id='email']",
-            "//input[@placeholder='Email ID']",
-            "//input[contains(@class, 'email')]"
-        ]
-        
         email_input = None
-        for selector in email_selectors:
+        for selector in EMAIL_INPUT_SELECTORS:
             try:
                 email_input = wait.until(EC.presence_of_element_located((By.XPATH, selector)))
                 print(f"✅ Found email input with selector: {selector}")
@@ -752,47 +824,40 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
         
         # Simulate human-like typing for email
         email_input.clear()
-        time.sleep(random.uniform(0.5, 1.5))  # Pause before typing
+        delays.sleep("before_typing")  # Pause before typing
         
         # Type email character by character with random delays
         for char in email:
             email_input.send_keys(char)
-            time.sleep(random.uniform(0.05, 0.2))  # Random typing speed
+            delays.sleep("keystroke")  # Random typing speed
         
         print(f"📧 Entered email: {email}")
         
         # Simulate human pause between fields
-        time.sleep(random.uniform(1, 3))
+        delays.sleep("between_fields")
         
         print("🔍 Looking for password input field...")
         # Find password input field
-        password_input = driver.find_element(By.XPATH, "//input[@type='password']")
+        password_input = driver.find_element(By.XPATH, PASSWORD_INPUT_SELECTOR)
         
         # Simulate human-like password entry
         password_input.clear()
-        time.sleep(random.uniform(0.5, 1.5))  # Pause before typing
+        delays.sleep("before_typing")  # Pause before typing
         
         # Type password character by character with random delays
         for char in password:
             password_input.send_keys(char)
-            time.sleep(random.uniform(0.08, 0.25))  # Slightly slower for password
+            delays.sleep("password_keystroke")  # Slightly slower for password
         
         print("🔒 Entered password")
         
         # Simulate human pause before clicking login
-        time.sleep(random.uniform(2, 4))
+        delays.sleep("before_submit")
         
         print("🔍 Looking for login button...")
         # Click login button with multiple possible selectors
-        login_selectors = [
-            "//button[contains(text(), 'Login')]",
-            "//button[contains(text(), 'Sign In')]",
-            "//input[@type='submit']",
-            "//button[@type='submit']"
-        ]
-        
         login_button = None
-        for selector in login_selectors:
+        for selector in LOGIN_SUBMIT_SELECTORS:
             try:
                 login_button = driver.find_element(By.XPATH, selector)
                 print(f"✅ Found login button with selector: {selector}")
@@ -895,19 +960,14 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
         except Exception as cookie_error:
             print(f"⚠️ Could not check cookies: {cookie_error}")
         
-        # Try to access a simple authenticated page first
+        # Probe the authenticated pages in parallel tabs; the first one that loads wins
         try:
-            print("🔍 Testing session with simple authenticated request...")
-            driver.get("https://www.naukri.com/mnjuser/homepage")
-            time.sleep(3)
-            
-            test_url = driver.current_url
-            test_title = driver.title
-            print(f"📍 Test URL: {test_url}")
-            print(f"📄 Test Title: {test_title}")
-            
-            if "login" not in test_url.lower() and "mynaukri" in test_title.lower():
+            print("🔍 Testing session against authenticated pages...")
+            page = probe_pages(driver, PROFILE_PROBE_PAGES, prepare_tab=prepare_probe_tab)
+            if page:
                 print("✅ Session is valid - can access authenticated pages")
+                if page != "profile":
+                    navigate(driver, "profile")
                 return  # Exit early if session is working
             else:
                 print("⚠️ Session test failed - still redirected to login")
@@ -959,6 +1019,7 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
             # Check if this is a redirect loop with malformed URL
             if "URL=//" in current_url:
                 print("🔧 Detected malformed redirect URL - attempting to fix...")
+                capture_page(driver, "malformed_redirect")
                 # Extract the target URL and fix it
                 try:
                     if "URL=//" in current_url:
@@ -967,8 +1028,7 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
                         if malformed_url.startswith("//"):
                             fixed_url = "https:" + malformed_url
                             print(f"🔧 Fixed URL: {fixed_url}")
-                            driver.get(fixed_url)
-                            time.sleep(5)
+                            navigate(driver, None, fixed_url)
                             
                             # Check if we can access the profile now
                             new_url = driver.current_url
@@ -993,24 +1053,8 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
             print("🔍 Checking for CAPTCHA and verification challenges...")
             
             # Multiple CAPTCHA detection patterns
-            captcha_selectors = [
-                "//div[contains(@class, 'captcha')]",
-                "//div[contains(@id, 'captcha')]",
-                "//img[contains(@src, 'captcha')]",
-                "//img[contains(@alt, 'captcha')]",
-                "//div[contains(@class, 'recaptcha')]",
-                "//div[contains(@id, 'recaptcha')]",
-                "//iframe[contains(@src, 'recaptcha')]",
-                "//div[contains(text(), 'captcha')]",
-                "//div[contains(text(), 'verification')]",
-                "//div[contains(text(), 'robot')]",
-                "//div[contains(text(), 'human')]",
-                "//div[contains(@class, 'challenge')]",
-                "//div[contains(@class, 'verification')]"
-            ]
-            
             captcha_found = False
-            for selector in captcha_selectors:
+            for selector in CAPTCHA_SELECTORS:
                 try:
                     elements = driver.find_elements(By.XPATH, selector)
                     if elements:
@@ -1021,6 +1065,7 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
                     continue
             
             if captcha_found:
+                capture_page(driver, "captcha")
                 print("🚫 CAPTCHA detected - this requires manual intervention")
                 print("💡 Possible solutions:")
                 print("   1. Use a different login method (Google OAuth)")
@@ -1084,52 +1129,17 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
         
         # Navigate to profile page with better error handling
         print("🔍 Navigating to profile page...")
+        apply_network_policy(driver, "profile")
         
-        # Try multiple approaches to access profile
-        profile_urls = [
-            "https://www.naukri.com/mnjuser/profile",
-            "https://www.naukri.com/mnjuser/homepage",
-            "https://www.naukri.com/mnjuser/dashboard"
-        ]
+        # Try every profile entry point at once in parallel tabs
+        profile_page = probe_pages(driver, PROFILE_PROBE_PAGES, prepare_tab=prepare_probe_tab)
         
-        profile_accessed = False
-        for profile_url in profile_urls:
-            try:
-                print(f"🔍 Trying to access: {profile_url}")
-                driver.get(profile_url)
-                time.sleep(5)
-                
-                # Check if we successfully accessed the profile
-                final_url = driver.current_url
-                page_title = driver.title
-                print(f"📍 Final URL: {final_url}")
-                print(f"📄 Final Page Title: {page_title}")
-                
-                # Check for success indicators
-                success_indicators = [
-                    "mynaukri" in final_url.lower(),
-                    "profile" in final_url.lower(),
-                    "dashboard" in final_url.lower(),
-                    "homepage" in final_url.lower(),
-                    "mynaukri" in page_title.lower(),
-                    "profile" in page_title.lower()
-                ]
-                
-                if any(success_indicators) and "login" not in final_url.lower():
-                    print("🎯 Successfully accessed profile page")
-                    print(f"Current URL: {final_url}")
-                    profile_accessed = True
-                    break
-                else:
-                    print(f"⚠️ Still on login page or redirected: {final_url}")
-                    
-            except Exception as nav_error:
-                print(f"⚠️ Failed to access {profile_url}: {nav_error}")
-                continue
-        
-        if not profile_accessed:
+        if profile_page is None:
             print("❌ Could not access any profile page - authentication failed")
             raise Exception("Authentication failed - unable to access profile page")
+        if profile_page != "profile":
+            # The session works, but the refresh needs the profile page itself
+            navigate(driver, "profile")
         
     except Exception as e:
         print(f"❌ Email/Password login failed: {e}")
@@ -1138,6 +1148,34 @@ def login_with_email_password(driver: WebDriver, email: str, password: str) -> N
         raise
 
 
+def enter_otp(driver: WebDriver, code: str) -> None:
+    """
+    Types an OTP into the login form, whether it is one field or one box per digit.
+
+    Args:
+        driver: The webdriver instance.
+        code: The OTP code.
+    """
+    otp_inputs = [
+        element for element in driver.find_elements(
+            By.XPATH,
+            "//input[contains(@id, 'otp') or contains(@name, 'otp') or contains(@class, 'otp')"
+            " or @autocomplete='one-time-code' or @maxlength='1']")
+        if element.is_displayed()
+    ]
+    if not otp_inputs:
+        raise Exception("OTP input field not found")
+    
+    if len(otp_inputs) >= len(code):
+        for element, digit in zip(otp_inputs, code):
+            element.send_keys(digit)
+    else:
+        otp_inputs[0].clear()
+        otp_inputs[0].send_keys(code)
+    print("🔑 Entered OTP")
+
+
+@command_phase("login_with_otp")
 def login_with_otp(driver: WebDriver, phone_number: str) -> None:
     """
     Logs in to Naukri using OTP (One Time Password) sent to phone.
@@ -1165,14 +1203,19 @@ def login_with_otp(driver: WebDriver, phone_number: str) -> None:
         phone_input.send_keys(phone_number)
         print(f"📱 Entered phone number: {phone_number}")
         
+        # Ask for the code before sending it so a fast delivery isn't missed
+        otp_provider = get_otp_provider()
+        pending_otp = otp_provider.request_code(account_id_for("otp", phone_number=phone_number))
+        
         # Click send OTP button
         send_otp_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Send OTP') or contains(text(), 'Get OTP')]")
         send_otp_button.click()
         print("📤 OTP sent to phone")
         
-        # Wait for user to enter OTP manually
-        print("⏳ Please enter the OTP received on your phone...")
-        input("Press Enter after entering the OTP in the browser...")
+        # Wait for the code; only this account's thread blocks
+        otp_code = otp_provider.wait_for_code(pending_otp, get_otp_timeout())
+        if otp_code:
+            enter_otp(driver, otp_code)
         
         # Click verify/login button
         verify_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Verify') or contains(text(), 'Login')]")
@@ -1181,8 +1224,8 @@ def login_with_otp(driver: WebDriver, phone_number: str) -> None:
         time.sleep(5)
         
         # Navigate to profile page
-        driver.get("https://www.naukri.com/mnjuser/profile")
-        time.sleep(5)
+        apply_network_policy(driver, "profile")
+        navigate(driver, "profile")
         print("🎯 Navigated to profile page")
         
     except Exception as e:
@@ -1190,20 +1233,28 @@ def login_with_otp(driver: WebDriver, phone_number: str) -> None:
         raise
 
 
-def login(driver: WebDriver, login_method: str, **kwargs) -> None:
+def login(driver: WebDriver, login_method: str, cancelled=None, **kwargs) -> None:
     """
     Main login function that routes to the appropriate login method.
 
     Args:
         driver: The webdriver instance.
         login_method: The login method to use ('google', 'email_password', 'otp').
+        cancelled: A threading.Event that stops the attempts once set (a
+            fresh login that lost the login race).
         **kwargs: Additional arguments for specific login methods.
+
+    Raises:
+        LoginCancelled: If cancelled was set before or during an attempt.
     """
     print(f"🔐 Starting login with method: {login_method}")
+    set_run_phase(driver, "login")
     
     max_login_attempts = 2  # Try primary method, then fallback
     
     for attempt in range(max_login_attempts):
+        if cancelled is not None and cancelled.is_set():
+            raise LoginCancelled("Login race already decided")
         try:
             if attempt == 0:
                 # Primary login method
@@ -1238,13 +1289,20 @@ def login(driver: WebDriver, login_method: str, **kwargs) -> None:
             
             # If we reach here, login was successful
             print("✅ Login completed successfully")
+            delays_for(driver).note("success")
             return
             
         except Exception as e:
+            if cancelled is not None and cancelled.is_set():
+                # The context was disposed under the attempt; that's not a login failure
+                raise LoginCancelled("Login race already decided") from e
             error_msg = str(e).lower()
             if "captcha" in error_msg or "verification" in error_msg:
                 print(f"⚠️ Login attempt {attempt + 1} failed due to CAPTCHA: {e}")
+                delays_for(driver).note("captcha")
+                count_run_event(driver, "captcha")
                 if attempt < max_login_attempts - 1:
+                    count_run_event(driver, "login_retry")
                     print("🔄 Trying fallback method...")
                     time.sleep(3)  # Wait before retry
                     continue
@@ -1253,32 +1311,84 @@ def login(driver: WebDriver, login_method: str, **kwargs) -> None:
                     raise Exception("Login failed: CAPTCHA detected on all attempts. Please try manual login or use different credentials.")
             else:
                 print(f"❌ Login attempt {attempt + 1} failed: {e}")
+                delays_for(driver).note("login_error")
                 if attempt < max_login_attempts - 1:
+                    count_run_event(driver, "login_retry")
                     print("🔄 Retrying...")
                     time.sleep(5)  # Wait before retry
                     continue
                 else:
                     raise e
 
-def refresh_profile(driver: WebDriver, resume_file_path: str) -> None:
+@command_phase("login")
+def login_and_refresh(driver: WebDriver, account) -> None:
+    """
+    Logs an account in (unless its session was restored) and refreshes its profile.
+
+    Args:
+        driver: A webdriver instance prepared by setup_driver() or open_naukri().
+        account: The accounts.Account to run.
+    """
+    set_run_phase(driver, "login")
+    add_report_section(driver, "login_method", account.login_method)
+    if session_restored(driver):
+        navigate(driver, "profile")
+        delays_for(driver).note("success")
+    elif race_pending(driver):
+        race_login(driver, account)
+        navigate(driver, "profile")
+        delays_for(driver).note("success")
+    else:
+        login(driver, account.login_method, **account.login_kwargs())
+    stop_browser_trace(driver)
+    refresh_profile(driver, account.resume_path, account.account_id)
+    try:
+        # After the refresh, so its last-updated check isn't masked by these saves
+        update_profile_fields(driver, account.account_id)
+    except Exception as e:
+        print(f"⚠️ Could not update profile fields: {e}")
+
+
+@command_phase("refresh_profile")
+def refresh_profile(driver: WebDriver, resume_file_path: str, account_id: Optional[str] = None) -> None:
     """
-    Refreshes the Naukri profile by re-uploading the resume.
+    Refreshes the Naukri profile with the cheapest action that works (see refresh_strategy).
+
+    The run only counts as succeeded when the profile's last-updated marker
+    moved, or when it already said "Today" and so can't show a change. A
+    marker that can't be found before or after fails the run.
 
     Args:
         driver: The webdriver instance.
-        resume_file_path: The path to the resume file.
+        resume_file_path: The configured resume path, for the resume upload action.
+        account_id: The account whose action history to use; defaults to the one in the environment.
+
+    Raises:
+        RefreshNotConfirmed: If the marker did not move or could not be found.
+        Exception: If the refresh action failed.
     """
-    wait = WebDriverWait(driver, 15)
+    set_run_phase(driver, "refresh")
     try:
-        upload_input = wait.until(
-            EC.presence_of_element_located((By.XPATH, "//input[@type='file']"))
-        )
-        upload_input.send_keys(resume_file_path)
-        print("📎 Resume re-uploaded.")
-        time.sleep(5)
+        apply_network_policy(driver, "upload")
+        result = refresh_with_strategy(driver, account_id or current_account_id(), resume_file_path)
+        add_report_section(driver, "refresh", result)
+        capture_page(driver, "after_upload")
+        if result["outcome"] == "failed":
+            raise Exception(result["attempts"][-1].get("error", "refresh action failed"))
+        if result["outcome"] == "unconfirmed":
+            raise RefreshNotConfirmed(f"Profile last-updated marker stayed at {result['marker_after']!r}")
+        if result["outcome"] == "no_marker":
+            raise RefreshNotConfirmed(f"Profile last-updated marker not found "
+                                      f"(before {result['marker_before']!r}, after {result['marker_after']!r})")
+        if result["outcome"] == "unverified":
+            print(f"⚠️ Refresh not confirmed, the last-updated marker already showed today ({result['marker_after']!r})")
         print(f"✅ Profile refreshed successfully at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        mark_run_succeeded(driver)
     except Exception as e:
-        print("⚠️ Could not refresh profile:", e)
+        print("❌ Could not refresh profile:", e)
+        record_run_error(driver, e)
+        # Callers exit non-zero or retry the job instead of counting the run as a refresh
+        raise
 
 def cleanup(driver: WebDriver) -> None:
     """
@@ -1287,5 +1397,33 @@ def cleanup(driver: WebDriver) -> None:
     Args:
         driver: The webdriver instance.
     """
-    driver.quit()
+    try:
+        # First, so the reports' own log reads below aren't counted against the run
+        add_report_section(driver, "webdriver_commands", report_command_counts(driver))
+        stop_browser_trace(driver)
+        finish_recording(driver)
+        add_report_section(driver, "network_savings", report_network_savings(driver))
+        add_report_section(driver, "page_load_savings", report_page_load_savings(driver))
+        add_report_section(driver, "injection_overhead", report_injection_overhead(driver))
+        add_report_section(driver, "traffic", report_traffic(driver))
+        add_report_section(driver, "profile_cache", report_profile_cache(driver))
+        add_report_section(driver, "delays", finish_delays(driver))
+    except Exception as e:
+        print(f"⚠️ Could not report run savings: {e}")
+    run_error = None
+    try:
+        report = finish_run_report(driver)
+        run_error = ((report or {}).get("error") or {}).get("message")
+        record_run_metrics(report)
+    except Exception as e:
+        print(f"⚠️ Could not record run metrics: {e}")
+    try:
+        driver.quit()
+    except Exception as e:
+        # A remote node that died mid-run fails here too
+        release_profile(driver)
+        release_remote_node(driver, e)
+        raise
+    release_profile(driver)
+    release_remote_node(driver, run_error)
     print("✅ Script finished")